@@ -0,0 +1,68 @@
+"""
+토큰 발급 벤치마크: 로그인 vs 리프레시 토큰 재발급.
+
+    python -m benchmarks.bench_auth [--requests 50]
+
+임시 테스트 DB에 사용자를 만든 뒤 /api/auth/login/ (비밀번호 해시 검증)과
+/api/auth/refresh/ (refresh_token 쿠키로 재발급)를 같은 횟수만큼 호출해
+요청당 경과 시간·CPU 시간과 초당 처리량을 비교한다. 두 요청 모두 Django 테스트 클라이언트로 미들웨어부터 거친다.
+"""
+import argparse
+import time as timer
+
+from . import setup_django
+
+setup_django()
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import Client  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+
+LOGIN_URL = '/api/auth/login/'
+REFRESH_URL = '/api/auth/refresh/'
+CREDENTIALS = {'username': 'bench_auth', 'password': 'bench-auth-password'}
+
+
+def login(client: Client):
+    response = client.post(LOGIN_URL, CREDENTIALS, content_type='application/json')
+    assert response.status_code == 200, response.content
+
+
+def refresh(client: Client):
+    # 쿠키가 교체되므로 클라이언트가 받은 새 refresh_token 으로 다음 요청을 보낸다.
+    response = client.post(REFRESH_URL)
+    assert response.status_code == 200, response.content
+
+
+def measure(func, client: Client, requests: int) -> tuple[float, float]:
+    started, cpu_started = timer.perf_counter(), timer.process_time()
+    for _ in range(requests):
+        func(client)
+    return timer.perf_counter() - started, timer.process_time() - cpu_started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=50)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=1, autoclobber=True, serialize=False)
+    try:
+        User.objects.create_user(**CREDENTIALS)
+        client = Client()
+        login(client)
+
+        print(f"{'endpoint':>10} {'requests':>9} {'ms/req':>9} {'cpu ms/req':>11} {'req/s':>9}")
+        for name, func in (('login', login), ('refresh', refresh)):
+            elapsed, cpu = measure(func, client, args.requests)
+            print(f"{name:>10} {args.requests:>9} {elapsed / args.requests * 1000:>9.2f} "
+                  f"{cpu / args.requests * 1000:>11.2f} {args.requests / elapsed:>9.1f}")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=1)
+
+
+if __name__ == '__main__':
+    main()
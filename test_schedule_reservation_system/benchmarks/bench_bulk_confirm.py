@@ -0,0 +1,105 @@
+"""
+예약 확정 벤치마크: 단건 확정 반복 vs 일괄 확정.
+
+    python -m benchmarks.bench_bulk_confirm [--sizes 100 500 2000] [--dates 3]
+
+임시 테스트 DB에 대기 예약을 만든 뒤 confirm_reservation_by_id 를 하나씩 호출하는 방식과
+confirm_reservations 로 한 번에 확정하는 방식의 시간과 쿼리 수를 비교한다.
+두 방식의 확정 결과(확정된 id 집합)가 같은지도 확인한다.
+"""
+import argparse
+import time as timer
+from datetime import date, time, timedelta
+
+from . import setup_django
+
+setup_django()
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.db import connection  # noqa: E402
+from rest_framework.exceptions import ValidationError  # noqa: E402
+
+from core.models.capacity_ledger import CapacityLedger  # noqa: E402
+from core.models.reservation import Reservation, Status  # noqa: E402
+from system_admin.reservation.services import confirm_reservation_by_id, confirm_reservations  # noqa: E402
+
+
+def prepare(user: User, size: int, date_count: int) -> list[int]:
+    Reservation.objects.all().delete()
+    CapacityLedger.objects.all().delete()
+
+    dates = [date.today() + timedelta(days=10 + i) for i in range(date_count)]
+    # 대략 절반이 수용되도록 시간대와 인원을 섞는다.
+    reservations = Reservation.objects.bulk_create([
+        Reservation(
+            user=user,
+            test_reservation_date=dates[i % date_count],
+            test_start_time=time(8 + i % 8, 0),
+            test_end_time=time(9 + i % 8 + i % 3, 0),
+            headcount=200 + (i * 37) % 800,
+            status=Status.AWAIT
+        )
+        for i in range(size)
+    ])
+    return [reservation.id for reservation in reservations]
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def confirm_one_by_one(ids: list[int]) -> set[int]:
+    confirmed = set()
+    for reservation_id in ids:
+        try:
+            confirm_reservation_by_id(reservation_id)
+            confirmed.add(reservation_id)
+        except ValidationError:
+            pass
+    return confirmed
+
+
+def confirm_in_bulk(ids: list[int]) -> set[int]:
+    return set(confirm_reservations({'ids': ids})['confirmed'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 500, 2000])
+    parser.add_argument('--dates', type=int, default=3)
+    args = parser.parse_args()
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=1, autoclobber=True, serialize=False)
+    try:
+        user = User.objects.create_user(username='bench', password='bench')
+
+        print(f"{'size':>6} {'mode':>8} {'confirmed':>9} {'queries':>8} {'seconds':>8}")
+        for size in args.sizes:
+            results = {}
+            for mode, confirm in (('single', confirm_one_by_one), ('bulk', confirm_in_bulk)):
+                ids = prepare(user, size, args.dates)
+                counter = QueryCounter()
+                with connection.execute_wrapper(counter):
+                    started = timer.perf_counter()
+                    confirmed = confirm(ids)
+                    elapsed = timer.perf_counter() - started
+
+                # 같은 데이터를 id 순서로 확정하므로 같은 위치의 예약들이 확정되어야 한다.
+                position = {pk: index for index, pk in enumerate(ids)}
+                results[mode] = {position[pk] for pk in confirmed}
+                print(f"{size:>6} {mode:>8} {len(confirmed):>9} {counter.count:>8} {elapsed:>8.2f}")
+
+            if results['single'] != results['bulk']:
+                print("  경고: 두 방식의 확정 결과가 다릅니다.")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=1)
+
+
+if __name__ == '__main__':
+    main()
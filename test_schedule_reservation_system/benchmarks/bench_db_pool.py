@@ -0,0 +1,143 @@
+"""
+DB 연결 재사용 벤치마크: 요청마다 연결 vs 지속 연결 vs psycopg 연결 풀.
+
+    python -m benchmarks.bench_db_pool [--requests 300] [--threads 1 8] [--pool-size 4]
+
+임시 테스트 DB에 사용자를 만든 뒤 /api/reservations/available/ 를 WSGI 핸들러로 직접 호출한다.
+(테스트 클라이언트와 달리 요청이 끝날 때 CONN_MAX_AGE 에 따라 연결을 닫는다)
+가능 인원은 캐시에서 읽으므로 요청당 쿼리는 사용자 조회 한 번이고, 차이는 연결 수립 비용에서 나온다.
+방식마다 요청당 지연(p50, p95), 초당 처리량과 core.db_pool 의 연결 획득 통계를 출력한다.
+pool 은 psycopg_pool 이 설치되어 있을 때만 측정한다. (pip install "psycopg[pool]")
+"""
+import argparse
+import statistics
+import time as timer
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from . import setup_django
+
+setup_django()
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.core.handlers.wsgi import WSGIHandler  # noqa: E402
+from django.db import connection, connections  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from django.utils.timezone import now  # noqa: E402
+
+from core import db_pool  # noqa: E402
+from core.auth.token_utils import generate_tokens_for_user  # noqa: E402
+
+URL = '/api/reservations/available/'
+
+
+def has_psycopg_pool() -> bool:
+    try:
+        import psycopg_pool  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def configure(mode: str, pool_size: int):
+    connections.close_all()
+    connection.close_pool()
+
+    settings_dict = connection.settings_dict
+    options = {key: value for key, value in settings_dict['OPTIONS'].items() if key != 'pool'}
+    if mode == 'pool':
+        # 풀은 지속 연결과 함께 쓸 수 없다. (CONN_MAX_AGE=0)
+        options['pool'] = {'min_size': pool_size, 'max_size': pool_size, 'timeout': 30}
+        settings_dict.update(CONN_MAX_AGE=0, CONN_HEALTH_CHECKS=False)
+    elif mode == 'persistent':
+        settings_dict.update(CONN_MAX_AGE=60, CONN_HEALTH_CHECKS=True)
+    else:
+        settings_dict.update(CONN_MAX_AGE=0, CONN_HEALTH_CHECKS=False)
+    settings_dict['OPTIONS'] = options
+    db_pool.reset_stats()
+
+
+def request(handler: WSGIHandler, factory: RequestFactory, query: dict, token: str) -> float:
+    environ = factory.get(URL, query, HTTP_AUTHORIZATION=f'Bearer {token}').environ
+    started = timer.perf_counter()
+    statuses = []
+    response = handler(environ, lambda status, headers: statuses.append(status))
+    b''.join(response)
+    # request_finished 시그널로 CONN_MAX_AGE 에 따라 연결을 닫거나 풀에 돌려준다.
+    response.close()
+    elapsed = timer.perf_counter() - started
+    assert statuses[0].startswith('200'), statuses[0]
+    return elapsed
+
+
+def run(handler: WSGIHandler, query: dict, token: str, requests: int, threads: int) -> dict:
+    factory = RequestFactory()
+
+    def worker(count: int) -> list[float]:
+        try:
+            return [request(handler, factory, query, token) for _ in range(count)]
+        finally:
+            # 지속 연결은 스레드가 끝날 때 닫는다.
+            connections.close_all()
+
+    counts = [requests // threads + (1 if i < requests % threads else 0) for i in range(threads)]
+    started = timer.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        latencies = sorted(latency for result in executor.map(worker, counts) for latency in result)
+    elapsed = timer.perf_counter() - started
+
+    return {
+        'rps': requests / elapsed,
+        'p50': statistics.median(latencies) * 1000,
+        'p95': latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 8])
+    parser.add_argument('--pool-size', type=int, default=4)
+    args = parser.parse_args()
+
+    modes = ['none', 'persistent']
+    if has_psycopg_pool():
+        modes.append('pool')
+    else:
+        print('psycopg_pool 이 설치되어 있지 않아 pool 은 측정하지 않습니다.')
+
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    original = {key: connection.settings_dict[key] for key in ('CONN_MAX_AGE', 'CONN_HEALTH_CHECKS', 'OPTIONS')}
+    connection.creation.create_test_db(verbosity=1, autoclobber=True, serialize=False)
+    try:
+        user = User.objects.create_user(username='bench_pool', password='bench-pool-password')
+        token = generate_tokens_for_user(user)['access_token']
+        query = {'date': (now().date() + timedelta(days=5)).isoformat(), 'interval': 60}
+        handler = WSGIHandler()
+
+        print(f"\n{'mode':<11} {'threads':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+              f"{'acquired':>9} {'acquire avg/max ms':>19} {'waiting':>8}")
+        for threads in args.threads:
+            for mode in modes:
+                configure(mode, args.pool_size)
+                # 캐시를 채우고 풀을 여는 첫 요청은 측정에서 뺀다.
+                request(handler, RequestFactory(), query, token)
+                connections.close_all()
+                db_pool.reset_stats()
+
+                result = run(handler, query, token, args.requests, threads)
+                stats = db_pool.get_stats()['default']
+                print(f"{mode:<11} {threads:>7} {result['rps']:>9.1f} {result['p50']:>8.2f} {result['p95']:>8.2f} "
+                      f"{stats['acquired']:>9} {stats['acquire_avg_ms']:>9.2f}/{stats['acquire_max_ms']:<9.2f} "
+                      f"{stats['waiting']:>8}")
+    finally:
+        connections.close_all()
+        connection.close_pool()
+        connection.settings_dict.update(original)
+        connection.creation.destroy_test_db(old_name, verbosity=1)
+
+
+if __name__ == '__main__':
+    main()
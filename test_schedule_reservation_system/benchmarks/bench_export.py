@@ -0,0 +1,102 @@
+"""
+전체 예약 내보내기의 메모리 사용량 비교.
+
+    python -m benchmarks.bench_export [--rows 10000 50000] [--chunk-size 2000]
+
+임시 테스트 DB에 예약을 만든 뒤, 전체를 직렬화해 한 번에 렌더링하는 기존 방식과
+stream_all_reservations 로 나누어 내보내는 방식의 최대 메모리(tracemalloc)와 시간을 비교한다.
+스트리밍 방식의 최대 메모리는 행 수와 관계없이 chunk 크기에만 비례해야 한다.
+측정 전에 두 방식의 출력(JSON)이 같은지 확인한다.
+"""
+import argparse
+import json
+import time as timer
+import tracemalloc
+from datetime import date, time, timedelta
+
+from . import setup_django
+
+setup_django()
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.db import connection  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from core.models.reservation import Reservation, Status  # noqa: E402
+from system_admin.reservation.serializers import ReservationSerializer  # noqa: E402
+from system_admin.reservation.services import stream_all_reservations  # noqa: E402
+
+BATCH_SIZE = 10_000
+
+
+def seed(rows: int):
+    existing = Reservation.objects.count()
+    users = [User.objects.get_or_create(username=f'bench_export_{i}')[0] for i in range(10)]
+    for first in range(existing, rows, BATCH_SIZE):
+        Reservation.objects.bulk_create([
+            Reservation(
+                user=users[i % len(users)],
+                test_reservation_date=date(2025, 1, 1) + timedelta(days=i % 365),
+                test_start_time=time(9, 0),
+                test_end_time=time(10, 0),
+                headcount=1 + i % 500,
+                status=Status.CONFIRM if i % 4 == 0 else Status.AWAIT
+            )
+            for i in range(first, min(first + BATCH_SIZE, rows))
+        ])
+
+
+def render_all_json() -> bytes:
+    # 기존 방식: 모델 인스턴스를 만들어 ReservationSerializer 로 직렬화한다.
+    reservations = Reservation.objects.select_related('user').order_by('test_reservation_date', 'id')
+    return JSONRenderer().render(ReservationSerializer(reservations, many=True).data)
+
+
+def render_all() -> int:
+    return len(render_all_json())
+
+
+def render_stream(chunk_size: int) -> int:
+    # 응답으로 내보낸 조각은 바로 버려지므로 길이만 더한다.
+    return sum(len(part) for part in stream_all_reservations(chunk_size))
+
+
+def check_same_output(chunk_size: int):
+    # 두 방식이 같은 일을 하는지(같은 JSON 을 만드는지) 확인한 뒤에 측정한다.
+    streamed = json.loads(b''.join(stream_all_reservations(chunk_size)))
+    if json.loads(render_all_json()) != streamed:
+        raise SystemExit("기존 방식과 스트리밍 방식의 출력이 다릅니다.")
+
+
+def measure(func, *args) -> tuple[int, float, float]:
+    tracemalloc.start()
+    started = timer.perf_counter()
+    size = func(*args)
+    elapsed = timer.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size, elapsed, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 50_000])
+    parser.add_argument('--chunk-size', type=int, default=2000)
+    args = parser.parse_args()
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=1, autoclobber=True, serialize=False)
+    try:
+        print(f"{'rows':>8} {'mode':>8} {'bytes':>12} {'seconds':>8} {'peak MB':>9}")
+        for rows in sorted(args.rows):
+            seed(rows)
+            check_same_output(args.chunk_size)
+            for mode, func, func_args in (('all', render_all, ()), ('stream', render_stream, (args.chunk_size,))):
+                size, elapsed, peak = measure(func, *func_args)
+                print(f"{rows:>8} {mode:>8} {size:>12,} {elapsed:>8.2f} {peak:>9.1f}")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+JSON 렌더러/파서 벤치마크: DRF JSONRenderer/JSONParser vs FastJSONRenderer/FastJSONParser.
+
+    python -m benchmarks.bench_json [--sizes 100 10000 100000] [--repeat 5]
+
+예약 목록 응답(중첩 user, date/time/datetime 포함)과 시간대별 가능 인원 응답 형태의 데이터를 만들어
+인코딩/디코딩 시간을 비교하고, 두 렌더러의 출력이 같은지 확인한다. DB 없이 실행된다.
+orjson 이 없으면 Fast* 클래스도 DRF 기본 구현으로 동작하므로 차이가 나지 않는다.
+"""
+import argparse
+import time as timer
+from datetime import date, datetime, time, timedelta, timezone
+from io import BytesIO
+
+from . import setup_django
+
+setup_django()
+
+from rest_framework.parsers import JSONParser  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from core import renderers  # noqa: E402
+from core.parsers import FastJSONParser  # noqa: E402
+from core.renderers import FastJSONRenderer  # noqa: E402
+
+
+def reservation_list(size: int) -> list[dict]:
+    created = datetime(2025, 4, 1, 9, 0, tzinfo=timezone.utc)
+    return [
+        {
+            'id': i,
+            'user': {'id': i % 100, 'username': f'company_user{i % 100}', 'is_staff': False},
+            'test_reservation_date': date(2025, 4, 20) + timedelta(days=i % 30),
+            'test_start_time': time(9 + i % 10, 0),
+            'test_end_time': time(10 + i % 10, 30),
+            'headcount': 100 + i % 5000,
+            'status': 'CONFIRM' if i % 3 else 'AWAIT',
+            'status_display': '확정' if i % 3 else '대기',
+            'created_at': created + timedelta(seconds=i),
+            'updated_at': created + timedelta(seconds=i, microseconds=123456),
+        }
+        for i in range(size)
+    ]
+
+
+def availability_range(days: int) -> dict:
+    return {
+        'from': date(2025, 4, 1),
+        'to': date(2025, 4, 1) + timedelta(days=days - 1),
+        'days': [
+            {
+                'date': date(2025, 4, 1) + timedelta(days=d),
+                'available_slots': [
+                    {
+                        'start_time': f'{m // 60:02d}:{m % 60:02d}',
+                        'end_time': f'{(m + 15) // 60:02d}:{(m + 15) % 60:02d}',
+                        'available_headcount': 50000 - (m * d) % 50000
+                    }
+                    for m in range(0, 1440, 15)
+                ]
+            }
+            for d in range(days)
+        ]
+    }
+
+
+def best_of(repeat: int, func, *args) -> tuple[float, object]:
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        started = timer.perf_counter()
+        result = func(*args)
+        best = min(best, timer.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"orjson: {'사용' if renderers.orjson is not None else '미설치'}\n")
+    payloads = [(f'reservations x {size:,}', reservation_list(size)) for size in args.sizes]
+    payloads.append(('availability 31 days x 96', availability_range(31)))
+
+    print(f"{'payload':<28} {'bytes':>12} {'encode drf':>11} {'encode fast':>12} {'decode drf':>11} "
+          f"{'decode fast':>12}  same")
+    for name, data in payloads:
+        drf_encode, drf_body = best_of(args.repeat, JSONRenderer().render, data)
+        fast_encode, fast_body = best_of(args.repeat, FastJSONRenderer().render, data)
+        drf_decode, _ = best_of(args.repeat, lambda: JSONParser().parse(BytesIO(drf_body)))
+        fast_decode, _ = best_of(args.repeat, lambda: FastJSONParser().parse(BytesIO(drf_body)))
+
+        print(f"{name:<28} {len(drf_body):>12,} {drf_encode * 1000:>9.1f}ms {fast_encode * 1000:>10.1f}ms "
+              f"{drf_decode * 1000:>9.1f}ms {fast_decode * 1000:>10.1f}ms  {drf_body == fast_body}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+시간대별 예약 가능 인원 계산 벤치마크.
+
+    python -m benchmarks.bench_occupancy [--sizes 100 10000 100000] [--repeat 5]
+
+기존 방식(24개 시간대 x 전체 예약 비교)과 분 단위 점유 배열(Occupancy)의
+numpy / 순수 파이썬 구현을 같은 데이터로 비교한다. DB 없이 실행된다.
+"""
+import argparse
+import random
+import time as timer
+from datetime import date, time
+
+from . import setup_django
+
+setup_django()
+
+from core.models import occupancy  # noqa: E402
+from core.models.occupancy import Occupancy  # noqa: E402
+from core.models.reservation import Reservation, Status  # noqa: E402
+from core.models.reservations import Reservations  # noqa: E402
+
+
+def generate_reservations(count: int, seed: int) -> list[Reservation]:
+    rng = random.Random(seed)
+    reservations = []
+    for _ in range(count):
+        start = rng.randrange(0, 1380)
+        end = min(start + rng.choice((30, 60, 90, 120, 180)), 1439)
+        reservations.append(Reservation(
+            test_reservation_date=date(2025, 4, 20),
+            test_start_time=time(start // 60, start % 60),
+            test_end_time=time(end // 60, end % 60),
+            headcount=rng.randrange(1, 200),
+            status=Status.CONFIRM
+        ))
+    return reservations
+
+
+def legacy_hourly_available_headcount(reservations: list[Reservation]) -> list:
+    available_headcount = []
+    for hour in range(0, 24):
+        start = time(hour, 0)
+        end = time(hour + 1, 0) if hour < 23 else time(23, 59)
+
+        reserved_headcount = sum(
+            r.headcount for r in reservations
+            if r.test_start_time < end and r.test_end_time > start
+        )
+
+        available_headcount.append((start, end, max(0, Reservations.MAX_AVAILABLE_LIMIT - reserved_headcount)))
+    return available_headcount
+
+
+def measure(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = timer.perf_counter()
+        func()
+        best = min(best, timer.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    cases = [('legacy (24 x n)', legacy_hourly_available_headcount)]
+    cases.append(('occupancy (python)', lambda rs: Occupancy.from_reservations(rs, use_numpy=False).get_slot_peaks(60)))
+    if occupancy.np is not None:
+        cases.append(('occupancy (numpy)', lambda rs: Occupancy.from_reservations(rs, use_numpy=True).get_slot_peaks(60)))
+    else:
+        print('numpy가 설치되어 있지 않아 numpy 구현은 건너뜁니다.')
+
+    print(f"{'reservations':>12}  {'implementation':<20} {'best (ms)':>10} {'speedup':>8}")
+    for size in args.sizes:
+        reservations = generate_reservations(size, args.seed)
+        baseline = None
+        for name, func in cases:
+            elapsed = measure(lambda: func(reservations), args.repeat)
+            baseline = baseline or elapsed
+            print(f"{size:>12}  {name:<20} {elapsed * 1000:>10.2f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
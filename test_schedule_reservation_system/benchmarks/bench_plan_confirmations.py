@@ -0,0 +1,106 @@
+"""
+예약 확정 계획(plan_confirmations) 벤치마크.
+
+    python -m benchmarks.bench_plan_confirmations [--pending 100000] [--dates 10]
+
+임시 테스트 DB에 대기 예약을 만든 뒤 dry-run 계획과 실제 확정(apply)에 걸리는 시간을 재고,
+계획의 확정 인원을 선착순(id 순) 수용과 비교한다.
+"""
+import argparse
+import random
+import time as timer
+from datetime import date, time, timedelta
+
+from . import setup_django
+
+setup_django()
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.db import connection  # noqa: E402
+
+from core.models.capacity_ledger import CapacityLedger  # noqa: E402
+from core.models.confirmation_planner import admit_greedy  # noqa: E402
+from core.models.reservation import Reservation, Status  # noqa: E402
+from core.models.reservations import Reservations  # noqa: E402
+from system_admin.reservation.services import plan_confirmations  # noqa: E402
+
+BATCH_SIZE = 10_000
+
+
+def seed(user: User, pending: int, dates: list[date], seed_value: int = 0):
+    rng = random.Random(seed_value)
+    for first in range(0, pending, BATCH_SIZE):
+        reservations = []
+        for i in range(first, min(first + BATCH_SIZE, pending)):
+            start = rng.randrange(8 * 60, 20 * 60, 15)
+            end = min(start + rng.choice((30, 60, 90, 120, 180)), 23 * 60)
+            reservations.append(Reservation(
+                user=user,
+                test_reservation_date=dates[i % len(dates)],
+                test_start_time=time(start // 60, start % 60),
+                test_end_time=time(end // 60, end % 60),
+                headcount=rng.randrange(10, 2000),
+                status=Status.AWAIT
+            ))
+        Reservation.objects.bulk_create(reservations)
+
+
+def first_come_headcount(start_date: date, end_date: date) -> int:
+    pending = Reservation.objects.filter(
+        status=Status.AWAIT,
+        test_reservation_date__gte=start_date,
+        test_reservation_date__lte=end_date
+    ).order_by('id')
+
+    by_date = {}
+    for reservation in pending:
+        by_date.setdefault(reservation.test_reservation_date, []).append(reservation)
+
+    occupancies = CapacityLedger.objects.get_occupancies(by_date.keys())
+    return sum(
+        reservation.headcount
+        for test_date, reservations in by_date.items()
+        for reservation in admit_greedy(reservations, occupancies[test_date], Reservations.MAX_AVAILABLE_LIMIT)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pending', type=int, default=100_000)
+    parser.add_argument('--dates', type=int, default=10)
+    args = parser.parse_args()
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=1, autoclobber=True, serialize=False)
+    try:
+        user = User.objects.create_user(username='bench', password='bench')
+        dates = [date.today() + timedelta(days=10 + i) for i in range(args.dates)]
+        seed(user, args.pending, dates)
+        start_date, end_date = dates[0], dates[-1]
+
+        started = timer.perf_counter()
+        plans = plan_confirmations(start_date, end_date)
+        dry_run = timer.perf_counter() - started
+
+        baseline = first_come_headcount(start_date, end_date)
+        seated = sum(plan['seated_headcount'] for plan in plans)
+        planned = sum(len(plan['planned']) for plan in plans)
+        strategies = sorted({plan['strategy'] for plan in plans})
+
+        started = timer.perf_counter()
+        plan_confirmations(start_date, end_date, apply=True)
+        applied = timer.perf_counter() - started
+
+        print(f"pending            {args.pending:>12,}")
+        print(f"planned            {planned:>12,}")
+        print(f"seated (plan)      {seated:>12,}  ({', '.join(strategies)})")
+        print(f"seated (선착순)    {baseline:>12,}  ({(seated - baseline) / baseline:+.1%})")
+        print(f"dry-run            {dry_run:>11.2f}s")
+        print(f"apply              {applied:>11.2f}s")
+        print(f"ledger verify      {'OK' if not CapacityLedger.objects.verify(dates) else 'MISMATCH':>12}")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+"""
+Reservations(메모리 목록) 마이크로 벤치마크.
+
+    python -m benchmarks.bench_reservations [--sizes 10 1000 100000 1000000] [--distributions uniform peak all_day]
+        [--repeat 3] [--output reservations.json]
+
+분포별로 예약 목록을 만든 뒤 get_total_headcount, validate_exceed_limit, get_hourly_available_headcount 의
+최소 실행 시간과 예약 1건당 시간, 예약 목록과 각 연산이 추가로 쓰는 메모리(최대, 예약 1건당 바이트)를 측정한다.
+- uniform: 하루 중 임의의 시각에 30분~3시간
+- peak: 오전 9시, 오후 2시 전후에 몰린 1~2시간
+- all_day: 이른 아침에 시작해 밤늦게 끝나는 종일 예약
+시간은 tracemalloc 을 끈 상태에서, 메모리는 따로 한 번 실행해 잰다. DB 없이 실행된다.
+"""
+import argparse
+import json
+import random
+import time as timer
+import tracemalloc
+from datetime import date, time
+
+from . import setup_django
+
+setup_django()
+
+from rest_framework.exceptions import ValidationError  # noqa: E402
+
+from core.models import occupancy  # noqa: E402
+from core.models.reservation import Reservation, Status  # noqa: E402
+from core.models.reservations import Reservations  # noqa: E402
+
+LAST_MINUTE = 23 * 60 + 59
+# validate_exceed_limit 로 검사할 신청 (10:00~12:00, 10명)
+VALIDATE_ARGS = (10, time(10, 0), time(12, 0))
+
+
+def uniform_window(rng: random.Random) -> tuple[int, int]:
+    start = rng.randrange(0, 23 * 60)
+    return start, min(start + rng.choice((30, 60, 90, 120, 180)), LAST_MINUTE)
+
+
+def peak_window(rng: random.Random) -> tuple[int, int]:
+    # 두 피크 시각 주변의 정규 분포를 10분 단위로 맞춘다.
+    center = rng.choice((9 * 60, 14 * 60))
+    start = min(max(int(rng.gauss(center, 40)) // 10 * 10, 0), 22 * 60)
+    return start, start + rng.choice((60, 90, 120))
+
+
+def all_day_window(rng: random.Random) -> tuple[int, int]:
+    return rng.randrange(0, 3 * 60, 30), rng.randrange(21 * 60, LAST_MINUTE + 1, 30)
+
+
+DISTRIBUTIONS = {'uniform': uniform_window, 'peak': peak_window, 'all_day': all_day_window}
+
+
+def generate_reservations(distribution: str, count: int, seed: int) -> list[Reservation]:
+    rng = random.Random(seed)
+    window = DISTRIBUTIONS[distribution]
+    reservations = []
+    for _ in range(count):
+        start, end = window(rng)
+        reservations.append(Reservation(
+            test_reservation_date=date(2025, 4, 20),
+            test_start_time=time(start // 60, start % 60),
+            test_end_time=time(end // 60, end % 60),
+            headcount=rng.randrange(1, 200),
+            status=Status.CONFIRM
+        ))
+    return reservations
+
+
+def validate_exceed_limit(reservations: Reservations) -> bool:
+    # 큰 목록은 한도를 넘으므로 예외도 정상 결과로 본다.
+    try:
+        reservations.validate_exceed_limit(*VALIDATE_ARGS)
+    except ValidationError:
+        return False
+    return True
+
+
+OPERATIONS = {
+    'get_total_headcount': Reservations.get_total_headcount,
+    'validate_exceed_limit': validate_exceed_limit,
+    'get_hourly_available_headcount': Reservations.get_hourly_available_headcount,
+}
+
+
+def measure_time(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = timer.perf_counter()
+        func()
+        best = min(best, timer.perf_counter() - started)
+    return best
+
+
+def measure_peak_memory(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure_set_memory(distribution: str, count: int, seed: int) -> int:
+    tracemalloc.start()
+    try:
+        reservations = generate_reservations(distribution, count, seed)
+        size = tracemalloc.get_traced_memory()[0]
+        del reservations
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 1_000, 100_000, 1_000_000])
+    parser.add_argument('--distributions', nargs='+', choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    print(f"occupancy 구현: {'numpy' if occupancy.np is not None else 'python'}")
+    print(f"\n{'distribution':<12} {'entries':>9} {'set B/entry':>12}  {'operation':<31} "
+          f"{'best ms':>10} {'ns/entry':>9} {'peak B/entry':>13}")
+
+    # 처음 모델 인스턴스를 만들 때 생기는 캐시가 첫 측정에 들어가지 않도록 미리 만들어 둔다.
+    generate_reservations('uniform', 100, args.seed)
+
+    results = []
+    for distribution in args.distributions:
+        for size in args.sizes:
+            set_bytes = measure_set_memory(distribution, size, args.seed)
+            reservations = Reservations(generate_reservations(distribution, size, args.seed))
+            for name, operation in OPERATIONS.items():
+                elapsed = measure_time(lambda: operation(reservations), args.repeat)
+                peak = measure_peak_memory(lambda: operation(reservations))
+                result = {
+                    'distribution': distribution,
+                    'entries': size,
+                    'set_bytes_per_entry': round(set_bytes / size, 1),
+                    'operation': name,
+                    'best_ms': round(elapsed * 1000, 4),
+                    'ns_per_entry': round(elapsed / size * 1e9, 1),
+                    'peak_bytes_per_entry': round(peak / size, 1),
+                }
+                results.append(result)
+                print(f"{distribution:<12} {size:>9} {result['set_bytes_per_entry']:>12.1f}  {name:<31} "
+                      f"{result['best_ms']:>10.3f} {result['ns_per_entry']:>9.1f} {result['peak_bytes_per_entry']:>13.1f}")
+            del reservations
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump({
+                'numpy': occupancy.np is not None,
+                'repeat': args.repeat,
+                'seed': args.seed,
+                'results': results,
+            }, output, ensure_ascii=False, indent=2)
+        print(f"\n결과를 {args.output} 에 저장했습니다.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+예약 목록 직렬화 벤치마크: ReservationSerializer vs values_list 기반 직렬화.
+
+    python -m benchmarks.bench_serializers [--rows 100000] [--repeat 3]
+
+임시 테스트 DB에 예약을 만든 뒤 같은 목록을 두 방식으로 조회, 직렬화, JSON 렌더링하고
+단계별 시간과 결과 JSON 이 바이트 단위로 같은지를 출력한다.
+"""
+import argparse
+import time as timer
+from datetime import date, time, timedelta
+
+from . import setup_django
+
+setup_django()
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.db import connection  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from core.models.reservation import Reservation, Status  # noqa: E402
+from core.serializers import get_reservation_rows, serialize_reservation_rows  # noqa: E402
+from system_admin.reservation.serializers import ReservationSerializer  # noqa: E402
+
+BATCH_SIZE = 10_000
+
+
+def seed(rows: int):
+    users = User.objects.bulk_create([User(username=f'bench_{i}', is_staff=i == 0) for i in range(100)])
+    for first in range(0, rows, BATCH_SIZE):
+        Reservation.objects.bulk_create([
+            Reservation(
+                user=users[i % len(users)],
+                test_reservation_date=date(2025, 1, 1) + timedelta(days=i % 365),
+                test_start_time=time(8 + i % 10, (i % 4) * 15),
+                test_end_time=time(10 + i % 10, 0),
+                headcount=1 + i % 500,
+                status=Status.CONFIRM if i % 3 == 0 else Status.AWAIT
+            )
+            for i in range(first, min(first + BATCH_SIZE, rows))
+        ])
+
+
+def with_serializer() -> tuple[list, dict]:
+    timings = {}
+    started = timer.perf_counter()
+    reservations = list(Reservation.objects.select_related('user').order_by('test_reservation_date', 'id'))
+    timings['query'] = timer.perf_counter() - started
+
+    started = timer.perf_counter()
+    data = ReservationSerializer(reservations, many=True).data
+    timings['serialize'] = timer.perf_counter() - started
+    return data, timings
+
+
+def with_rows() -> tuple[list, dict]:
+    timings = {}
+    started = timer.perf_counter()
+    rows = list(get_reservation_rows(Reservation.objects.order_by('test_reservation_date', 'id')))
+    timings['query'] = timer.perf_counter() - started
+
+    started = timer.perf_counter()
+    data = serialize_reservation_rows(rows)
+    timings['serialize'] = timer.perf_counter() - started
+    return data, timings
+
+
+def measure(func, repeat: int) -> tuple[bytes, dict]:
+    best = None
+    for _ in range(repeat):
+        data, timings = func()
+        started = timer.perf_counter()
+        body = JSONRenderer().render(data)
+        timings['render'] = timer.perf_counter() - started
+        timings['total'] = sum(timings.values())
+        if best is None or timings['total'] < best['total']:
+            best = timings
+    return body, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=1, autoclobber=True, serialize=False)
+    try:
+        seed(args.rows)
+
+        results = {}
+        print(f"{'mode':<12} {'query':>8} {'serialize':>10} {'render':>8} {'total':>8}")
+        for mode, func in (('serializer', with_serializer), ('rows', with_rows)):
+            body, timings = measure(func, args.repeat)
+            results[mode] = body
+            print(f"{mode:<12} {timings['query']:>7.2f}s {timings['serialize']:>9.2f}s "
+                  f"{timings['render']:>7.2f}s {timings['total']:>7.2f}s")
+
+        print(f"\n{len(results['rows']):,} bytes, identical: {results['rows'] == results['serializer']}")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+"""
+예약 테이블 핫 쿼리의 인덱스 사용 여부 확인 (PostgreSQL 전용).
+
+    python -m benchmarks.explain_indexes [--rows 10000000] [--users 10000] [--keepdb]
+
+settings의 DB 이름 앞에 test_가 붙은 임시 DB를 만들어 마이그레이션한 뒤 generate_series로
+대량의 예약을 넣고, 각 쿼리의 EXPLAIN (ANALYZE, BUFFERS) 결과에 기대한 인덱스가 나오는지 확인한다.
+비교를 위해 인덱스 스캔을 끈 상태의 실행 시간도 함께 출력한다.
+"""
+import argparse
+import re
+import sys
+import time as timer
+from datetime import date, time, timedelta
+
+from . import setup_django
+
+setup_django()
+
+from django.db import connection  # noqa: E402
+from django.db.models import Count, Max, Q  # noqa: E402
+
+from core.models.reservation import Reservation, Status  # noqa: E402
+
+BASE_DATE = date(2025, 1, 1)
+DAYS = 365
+CHUNK_SIZE = 1_000_000
+
+SEED_USERS_SQL = """
+    INSERT INTO auth_user (password, is_superuser, username, first_name, last_name, email, is_staff, is_active,
+                           date_joined)
+    SELECT '!', false, 'bench_user_' || g, '', '', '', false, true, now()
+    FROM generate_series(1, %s) g
+    ON CONFLICT (username) DO NOTHING
+"""
+
+SEED_RESERVATIONS_SQL = """
+    INSERT INTO core_reservation (user_id, test_reservation_date, test_start_time, test_end_time, headcount, status,
+                                  created_at, updated_at)
+    SELECT %(min_user_id)s + (g %% %(users)s),
+           %(base_date)s::date + (g %% %(days)s),
+           make_time(8 + (g %% 10), (g %% 2) * 30, 0),
+           make_time(9 + (g %% 10) + (g %% 3), (g %% 2) * 30, 0),
+           1 + (g * 7) %% 500,
+           CASE WHEN g %% 4 = 0 THEN 'CONFIRM' ELSE 'AWAIT' END,
+           now(),
+           now()
+    FROM generate_series(%(first)s, %(last)s) g
+"""
+
+DISABLE_INDEX_SCANS = ('enable_indexscan', 'enable_indexonlyscan', 'enable_bitmapscan')
+
+
+def seed(rows: int, users: int):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT count(*) FROM core_reservation")
+        existing = cursor.fetchone()[0]
+        if existing >= rows:
+            print(f"이미 {existing:,}건이 있어 데이터 생성을 건너뜁니다.")
+            return
+
+        cursor.execute(SEED_USERS_SQL, [users])
+        cursor.execute("SELECT min(id) FROM auth_user WHERE username LIKE %s", ['bench_user_%'])
+        min_user_id = cursor.fetchone()[0]
+
+        for first in range(existing + 1, rows + 1, CHUNK_SIZE):
+            last = min(first + CHUNK_SIZE - 1, rows)
+            started = timer.perf_counter()
+            cursor.execute(SEED_RESERVATIONS_SQL, {
+                'min_user_id': min_user_id,
+                'users': users,
+                'base_date': BASE_DATE,
+                'days': DAYS,
+                'first': first,
+                'last': last,
+            })
+            print(f"  {last:,} / {rows:,} ({timer.perf_counter() - started:.1f}s)")
+
+        cursor.execute("VACUUM ANALYZE core_reservation")
+
+
+def explain(queryset, disable_index_scans: bool = False) -> str:
+    with connection.cursor() as cursor:
+        for option in DISABLE_INDEX_SCANS:
+            cursor.execute(f"SET {option} = {'off' if disable_index_scans else 'on'}")
+    try:
+        return queryset.explain(analyze=True, buffers=True)
+    finally:
+        with connection.cursor() as cursor:
+            for option in DISABLE_INDEX_SCANS:
+                cursor.execute(f"RESET {option}")
+
+
+def execution_time(plan: str) -> float:
+    match = re.search(r"Execution Time: ([\d.]+) ms", plan)
+    return float(match.group(1)) if match else float('nan')
+
+
+def hot_queries(user_id: int):
+    target_date = BASE_DATE + timedelta(days=DAYS // 2)
+    week = [target_date + timedelta(days=i) for i in range(7)]
+    return [
+        (
+            "인원 검사 (확정 예약 시간대 겹침)",
+            Reservation.objects.filter(
+                test_reservation_date=target_date,
+                test_start_time__lt=time(11, 0),
+                test_end_time__gt=time(10, 0),
+                status=Status.CONFIRM
+            ).values_list('test_start_time', 'test_end_time', 'headcount'),
+            'reservation_confirmed_date_idx',
+        ),
+        (
+            "시간대별 가능 인원 (날짜별 확정 예약)",
+            Reservation.objects.filter(
+                test_reservation_date=target_date,
+                status=Status.CONFIRM
+            ).values_list('test_start_time', 'test_end_time', 'headcount'),
+            'reservation_confirmed_date_idx',
+        ),
+        (
+            "장부 재구성 (기간별 확정 예약)",
+            Reservation.objects.filter(
+                test_reservation_date__in=week,
+                status=Status.CONFIRM
+            ).order_by('test_reservation_date').values_list(
+                'test_reservation_date', 'test_start_time', 'test_end_time', 'headcount'
+            ),
+            'reservation_confirmed_date_idx',
+        ),
+        (
+            "내 예약 목록",
+            Reservation.objects.filter(user_id=user_id).order_by('-test_reservation_date'),
+            'reservation_user_date_upd_idx',
+        ),
+        (
+            "내 예약 목록 ETag (건수, 최종 수정)",
+            Reservation.objects.filter(user_id=user_id).values('user_id').annotate(
+                count=Count('*'), updated_at=Max('updated_at')
+            ),
+            'reservation_user_date_upd_idx',
+        ),
+        (
+            "관리자 목록 (keyset 페이지)",
+            Reservation.objects.filter(
+                Q(test_reservation_date__gt=target_date) | Q(test_reservation_date=target_date, id__gt=0),
+                test_reservation_date__gte=target_date
+            ).order_by('test_reservation_date', 'id')[:101],
+            'reservation_date_id_idx',
+        ),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--keepdb', action='store_true', help="임시 DB를 삭제하지 않고 다음 실행에 재사용합니다.")
+    parser.add_argument('--verbose', action='store_true', help="전체 실행 계획을 출력합니다.")
+    args = parser.parse_args()
+
+    if connection.vendor != 'postgresql':
+        sys.exit("PostgreSQL 에서만 실행할 수 있습니다.")
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=1, autoclobber=True, serialize=False, keepdb=args.keepdb)
+    failed = []
+    try:
+        seed(args.rows, args.users)
+        user_id = Reservation.objects.values_list('user_id', flat=True).first()
+
+        print(f"\n{'query':<32} {'index':>12} {'no index':>12}  result")
+        for name, queryset, expected_index in hot_queries(user_id):
+            plan = explain(queryset)
+            without_index = explain(queryset, disable_index_scans=True)
+            used = expected_index in plan
+            if not used:
+                failed.append(name)
+
+            print(f"{name:<32} {execution_time(plan):>10.2f}ms {execution_time(without_index):>10.2f}ms  "
+                  f"{'OK ' + expected_index if used else 'MISSING ' + expected_index}")
+            if args.verbose or not used:
+                print(plan, end='\n\n')
+    finally:
+        if not args.keepdb:
+            connection.creation.destroy_test_db(old_name, verbosity=1)
+
+    if failed:
+        sys.exit(f"인덱스를 사용하지 않은 쿼리: {', '.join(failed)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+"""
+ASGI 단일 프로세스 부하 테스트: 동기 조회 API vs 비동기 조회 API.
+
+    python -m benchmarks.load_asgi [--concurrency 1 8 32] [--requests 400] [--db-latency-ms 0 5]
+
+임시 테스트 DB에 예약을 만든 뒤 프로젝트의 ASGI application 을 서버 없이 이벤트 루프에서 직접 호출한다.
+같은 동시 요청 수로 동기 API(/my/, /available/, 관리자 목록)와 비동기 API(/async/...)를 호출해
+초당 처리량과 지연 시간(p50, p95)을 비교한다.
+
+--db-latency-ms 를 주면 쿼리마다 해당 시간만큼 대기해 네트워크 너머의 느린 DB 를 흉내 낸다.
+(대기는 쿼리를 실행하는 스레드를 막으므로 실제 DB 대기와 같이 동작한다)
+"""
+import argparse
+import asyncio
+import statistics
+import time as timer
+from datetime import time, timedelta
+
+from . import setup_django
+
+setup_django()
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.core.asgi import get_asgi_application  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.db.backends.signals import connection_created  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from django.utils.timezone import now  # noqa: E402
+
+from core.auth.token_utils import generate_tokens_for_user  # noqa: E402
+from core.models.reservation import Reservation, Status  # noqa: E402
+
+BATCH_SIZE = 10_000
+
+
+class QueryDelay:
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def __call__(self, execute, sql, params, many, context):
+        timer.sleep(self.seconds)
+        return execute(sql, params, many, context)
+
+
+def seed(rows: int, users: int) -> tuple[User, User, str]:
+    corporate = User.objects.bulk_create([User(username=f'bench_load_{i}') for i in range(users)])
+    admin = User.objects.create(username='bench_load_admin', is_staff=True)
+    target_date = now().date() + timedelta(days=5)
+
+    for first in range(0, rows, BATCH_SIZE):
+        Reservation.objects.bulk_create([
+            Reservation(
+                user=corporate[i % users],
+                test_reservation_date=target_date + timedelta(days=i % 30),
+                test_start_time=time(8 + i % 10, 0),
+                test_end_time=time(9 + i % 10, 0),
+                headcount=1 + i % 50,
+                status=Status.CONFIRM if i % 4 == 0 else Status.AWAIT
+            )
+            for i in range(first, min(first + BATCH_SIZE, rows))
+        ])
+    return corporate[0], admin, target_date.isoformat()
+
+
+async def request(app, path: str, query: str, token: str) -> int:
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': query.encode(),
+        'root_path': '',
+        'headers': [(b'host', b'testserver'), (b'authorization', f'Bearer {token}'.encode())],
+        'client': ('127.0.0.1', 50000),
+        'server': ('testserver', 80),
+    }
+    body_sent = False
+    finished = asyncio.Event()
+    status = 0
+
+    async def receive():
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        # Django 는 본문을 읽은 뒤 연결 종료를 기다린다. 응답이 끝날 때까지 대기한다.
+        await finished.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        nonlocal status
+        if message['type'] == 'http.response.start':
+            status = message['status']
+
+    await app(scope, receive, send)
+    finished.set()
+    return status
+
+
+async def run_load(app, path: str, query: str, token: str, concurrency: int, requests: int) -> dict:
+    latencies = []
+    queue = iter(range(requests))
+
+    async def worker():
+        for _ in queue:
+            started = timer.perf_counter()
+            status = await request(app, path, query, token)
+            latencies.append(timer.perf_counter() - started)
+            assert status == 200, f"{path} 응답 코드 {status}"
+
+    started = timer.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = timer.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'rps': requests / elapsed,
+        'p50': statistics.median(latencies) * 1000,
+        'p95': latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--rows', type=int, default=50_000)
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--db-latency-ms', type=float, nargs='+', default=[0, 5])
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=1, autoclobber=True, serialize=False)
+    try:
+        user, admin, target_date = seed(args.rows, args.users)
+        user_token = generate_tokens_for_user(user)['access_token']
+        admin_token = generate_tokens_for_user(admin)['access_token']
+        # 시드에 쓴 연결은 닫고, 요청을 처리하는 스레드마다 새 연결을 열게 한다.
+        connection.close()
+
+        endpoints = [
+            ('my', '/api/reservations/my/', '/api/reservations/async/my/', '', user_token),
+            ('available', '/api/reservations/available/', '/api/reservations/async/available/',
+             f'date={target_date}&interval=15', user_token),
+            ('admin list', '/api/admin-reservation/reservations/', '/api/admin-reservation/async/reservations/',
+             'page_size=100', admin_token),
+        ]
+        app = get_asgi_application()
+
+        print(f"\n{'db ms':>6} {'endpoint':<11} {'conc':>5} {'sync rps':>9} {'async rps':>10} "
+              f"{'sync p50/p95 ms':>17} {'async p50/p95 ms':>18}")
+        for latency in args.db_latency_ms:
+            delay = QueryDelay(latency / 1000)
+
+            def add_delay(sender, connection, **kwargs):
+                connection.execute_wrappers.append(delay)
+
+            connection_created.connect(add_delay, dispatch_uid='load_asgi_delay')
+            try:
+                for name, sync_path, async_path, query, token in endpoints:
+                    for concurrency in args.concurrency:
+                        results = [
+                            asyncio.run(run_load(app, path, query, token, concurrency, args.requests))
+                            for path in (sync_path, async_path)
+                        ]
+                        sync, asynchronous = results
+                        print(f"{latency:>6g} {name:<11} {concurrency:>5} {sync['rps']:>9.1f} "
+                              f"{asynchronous['rps']:>10.1f} {sync['p50']:>8.1f}/{sync['p95']:<8.1f} "
+                              f"{asynchronous['p50']:>9.1f}/{asynchronous['p95']:<8.1f}")
+            finally:
+                connection_created.disconnect(dispatch_uid='load_asgi_delay')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=1)
+
+
+if __name__ == '__main__':
+    main()
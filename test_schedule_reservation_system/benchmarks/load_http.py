@@ -0,0 +1,386 @@
+"""
+HTTP 부하 테스트: 실행 중인 서버에 실제 트래픽 비율의 요청을 동시에 보낸다.
+
+    # 1) 서버와 같은 설정(DB)으로 사용자와 예약을 만든다. 서버를 띄우기 전에 실행한다.
+    python -m benchmarks.load_http seed [--users 200] [--reservations 20000] [--seed 1]
+
+    # 2) 서버를 띄운다. (다른 터미널, SQLite 는 DB_ENGINE=sqlite 를 두 명령에 모두 지정)
+    python manage.py runserver --noreload
+
+    # 3) 동시 클라이언트로 요청을 보내고 결과를 JSON 으로 저장한다.
+    python -m benchmarks.load_http run [--clients 16] [--duration 30] [--output load.json]
+        [--mix signup=1,login=2,create=10,my=25,available=40,confirm=5,admin_list=5]
+
+    # 4) 두 결과를 비교한다.
+    python -m benchmarks.load_http compare before.json after.json
+
+클라이언트는 시드한 사용자(load_user_N)로 로그인한 뒤 --mix 의 가중치대로 요청을 고른다.
+confirm 은 관리자(load_admin)가 대기 중인 예약을 하나씩 확정하며, 대상은 시작할 때 관리자 목록에서 읽은
+대기 예약과 실행 중 create 로 만든 예약이다. 엔드포인트별 요청 수, 실패 수, 초당 처리량, p50/p95/p99 지연을 출력한다.
+run, compare 는 표준 라이브러리만 사용하므로 다른 환경의 서버에도 실행할 수 있다.
+"""
+import argparse
+import http.client
+import json
+import random
+import statistics
+import threading
+import time as timer
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from . import setup_django
+
+PASSWORD = 'load-test-password'
+USER_PREFIX = 'load_user_'
+ADMIN_USERNAME = 'load_admin'
+BATCH_SIZE = 5_000
+
+DEFAULT_MIX = 'signup=1,login=2,create=10,my=25,available=40,confirm=5,admin_list=5'
+OPERATIONS = ('signup', 'login', 'create', 'my', 'available', 'confirm', 'admin_list')
+
+# 예약은 오늘부터 4~33일 뒤 날짜에 만든다. (3일 이내 예약 불가)
+FIRST_DAY, DAYS = 4, 30
+
+
+def seed(users: int, reservations: int, random_seed: int):
+    setup_django()
+    from django.contrib.auth.hashers import make_password
+    from django.contrib.auth.models import User
+    from django.db import transaction
+
+    from core.models.capacity_ledger import CapacityLedger
+    from core.models.reservation import Reservation, Status
+
+    rng = random.Random(random_seed)
+    # 비밀번호 해시는 느리므로 한 번만 계산해 모든 사용자에 쓴다.
+    password = make_password(PASSWORD)
+    first_date = today() + timedelta(days=FIRST_DAY)
+
+    with transaction.atomic():
+        User.objects.filter(username__startswith=USER_PREFIX).delete()
+        User.objects.filter(username=ADMIN_USERNAME).delete()
+        User.objects.create(username=ADMIN_USERNAME, password=password, is_staff=True)
+        created = User.objects.bulk_create(
+            [User(username=f'{USER_PREFIX}{i}', password=password) for i in range(users)],
+            batch_size=BATCH_SIZE
+        )
+
+        for first in range(0, reservations, BATCH_SIZE):
+            batch = []
+            for _ in range(first, min(first + BATCH_SIZE, reservations)):
+                start = rng.randint(8, 18)
+                batch.append(Reservation(
+                    user=rng.choice(created),
+                    test_reservation_date=first_date + timedelta(days=rng.randrange(DAYS)),
+                    test_start_time=time(start, rng.choice((0, 30))),
+                    test_end_time=time(start + rng.randint(1, 3), 0),
+                    # 확정 인원이 한도(50,000명)를 넘지 않도록 작게 잡는다.
+                    headcount=rng.randint(1, 30),
+                    status=Status.CONFIRM if rng.random() < 0.3 else Status.AWAIT
+                ))
+            Reservation.objects.bulk_create(batch)
+        dates = CapacityLedger.objects.rebuild()
+
+    print(f"사용자 {users}명(+관리자 {ADMIN_USERNAME}), 예약 {reservations}건, 장부 {dates}개 날짜를 만들었습니다.")
+
+
+class Client:
+    """스레드 하나가 쓰는 keep-alive HTTP 연결. 연결이 끊기면 다시 연결한다."""
+
+    def __init__(self, base_url: str, timeout: float):
+        parts = urlsplit(base_url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self.make_connection = lambda: connection_class(parts.hostname, parts.port, timeout=timeout)
+        self.prefix = parts.path.rstrip('/')
+        self.connection = self.make_connection()
+        self.token = None
+
+    def request(self, method: str, path: str, body: dict = None, query: dict = None) -> tuple[int, dict | None]:
+        url = self.prefix + path + (f'?{urlencode(query)}' if query else '')
+        headers = {'Accept': 'application/json'}
+        if self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode()
+            headers['Content-Type'] = 'application/json'
+
+        for attempt in range(2):
+            try:
+                self.connection.request(method, url, payload, headers)
+                response = self.connection.getresponse()
+                content = response.read()
+                break
+            except (http.client.HTTPException, ConnectionError):
+                # 서버가 keep-alive 연결을 닫은 경우 한 번 다시 연결한다.
+                self.connection.close()
+                self.connection = self.make_connection()
+                if attempt:
+                    raise
+
+        try:
+            data = json.loads(content) if content else None
+        except ValueError:
+            data = None
+        return response.status, data
+
+    def login(self, username: str) -> int:
+        status, data = self.request('POST', '/api/auth/login/', {'username': username, 'password': PASSWORD})
+        if status == 200:
+            self.token = data['access_token']
+        return status
+
+    def close(self):
+        self.connection.close()
+
+
+class PendingReservations:
+    """confirm 대상이 될 대기 예약 id. 여러 클라이언트가 같은 예약을 확정하지 않도록 하나씩 꺼낸다."""
+
+    def __init__(self, ids: list[int]):
+        self.ids = ids
+        self.lock = threading.Lock()
+
+    def add(self, reservation_id: int):
+        with self.lock:
+            self.ids.append(reservation_id)
+
+    def pop(self) -> int | None:
+        with self.lock:
+            return self.ids.pop(random.randrange(len(self.ids))) if self.ids else None
+
+
+def today() -> date:
+    # 서버와 같이 UTC 기준 날짜
+    return datetime.now(timezone.utc).date()
+
+
+def random_reservation(rng: random.Random) -> dict:
+    start = rng.randint(8, 18)
+    return {
+        'test_reservation_date': (today() + timedelta(days=rng.randrange(FIRST_DAY, FIRST_DAY + DAYS))).isoformat(),
+        'test_start_time': f'{start:02d}:00',
+        'test_end_time': f'{start + rng.randint(1, 3):02d}:00',
+        'headcount': rng.randint(1, 30),
+    }
+
+
+def run_operation(name: str, client: Client, admin: Client, pending: PendingReservations,
+                  users: int, rng: random.Random) -> int | None:
+    """요청 하나를 보내고 응답 코드를 반환한다. 보낼 대상이 없으면 None"""
+    if name == 'signup':
+        username = f'load_signup_{uuid.uuid4().hex[:12]}'
+        return client.request('POST', '/api/auth/signup/', {'username': username, 'password': PASSWORD})[0]
+    if name == 'login':
+        # 클라이언트의 토큰은 그대로 두고 다른 사용자의 로그인 요청을 보낸다.
+        username = f'{USER_PREFIX}{rng.randrange(users)}'
+        return client.request('POST', '/api/auth/login/', {'username': username, 'password': PASSWORD})[0]
+    if name == 'create':
+        status, data = client.request('POST', '/api/reservations/create/', random_reservation(rng))
+        if status == 201:
+            pending.add(data['reservation']['id'])
+        return status
+    if name == 'my':
+        return client.request('GET', '/api/reservations/my/')[0]
+    if name == 'available':
+        target_date = today() + timedelta(days=rng.randrange(FIRST_DAY, FIRST_DAY + DAYS))
+        return client.request('GET', '/api/reservations/available/', query={'date': target_date.isoformat()})[0]
+    if name == 'confirm':
+        reservation_id = pending.pop()
+        if reservation_id is None:
+            return None
+        return admin.request('PATCH', f'/api/admin-reservation/{reservation_id}/confirm/')[0]
+    if name == 'admin_list':
+        return admin.request('GET', '/api/admin-reservation/reservations/', query={'page_size': 100})[0]
+    raise ValueError(name)
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    mix = {}
+    for item in value.split(','):
+        name, _, weight = item.partition('=')
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"알 수 없는 요청 종류: {name} (가능: {', '.join(OPERATIONS)})")
+        mix[name] = float(weight)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("가중치가 모두 0 입니다.")
+    return mix
+
+
+def percentile(values: list[float], percent: float) -> float:
+    # nearest-rank 백분위수 (values 는 정렬되어 있어야 한다)
+    index = max(int(len(values) * percent / 100 + 0.5) - 1, 0)
+    return values[min(index, len(values) - 1)]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    latencies = sorted(latencies)
+    summary = {'requests': len(latencies), 'errors': errors, 'rps': round(len(latencies) / elapsed, 2)}
+    if latencies:
+        summary.update({
+            'p50_ms': round(statistics.median(latencies) * 1000, 2),
+            'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+            'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+            'max_ms': round(latencies[-1] * 1000, 2),
+        })
+    return summary
+
+
+def run(args) -> dict:
+    # 관리자 목록 첫 페이지들에서 대기 예약을 confirm 대상으로 모은다.
+    admin = Client(args.base_url, args.timeout)
+    if admin.login(ADMIN_USERNAME) != 200:
+        raise SystemExit(f"{ADMIN_USERNAME} 로그인에 실패했습니다. 먼저 seed 를 실행하세요.")
+    pending_ids, query = [], {'page_size': 1000}
+    for _ in range(5):
+        status, data = admin.request('GET', '/api/admin-reservation/reservations/', query=query)
+        if status != 200:
+            break
+        pending_ids += [row['id'] for row in data['results'] if row['status'] == 'AWAIT']
+        if not data['next']:
+            break
+        query = dict(parse_qsl(urlsplit(data['next']).query))
+    admin.close()
+    pending = PendingReservations(pending_ids)
+
+    names, weights = zip(*args.mix.items())
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    results_lock = threading.Lock()
+    remaining = iter(range(args.requests)) if args.requests else None
+
+    def worker(index: int):
+        rng = random.Random(args.seed * 1000 + index)
+        client = Client(args.base_url, args.timeout)
+        admin = Client(args.base_url, args.timeout)
+        try:
+            if client.login(f'{USER_PREFIX}{index % args.users}') != 200 or admin.login(ADMIN_USERNAME) != 200:
+                start_barrier.abort()
+                return
+            start_barrier.wait()
+            deadline = timer.perf_counter() + args.duration
+
+            while True:
+                if remaining is not None:
+                    if next(remaining, None) is None:
+                        break
+                elif timer.perf_counter() >= deadline:
+                    break
+
+                name = rng.choices(names, weights)[0]
+                started = timer.perf_counter()
+                try:
+                    status = run_operation(name, client, admin, pending, args.users, rng)
+                except (OSError, http.client.HTTPException):
+                    status = 0
+                elapsed = timer.perf_counter() - started
+                if status is None:
+                    continue
+
+                with results_lock:
+                    latencies[name].append(elapsed)
+                    # 확정 한도 초과 등 정상적인 거절(4xx)도 실패로 센다.
+                    if not 200 <= status < 300:
+                        errors[name] += 1
+        finally:
+            client.close()
+            admin.close()
+
+    start_barrier = threading.Barrier(args.clients + 1)
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(args.clients)]
+    for thread in threads:
+        thread.start()
+    # 모든 클라이언트가 로그인한 뒤 동시에 시작한다.
+    try:
+        start_barrier.wait()
+    except threading.BrokenBarrierError:
+        raise SystemExit("시드한 사용자로 로그인하지 못했습니다. --users 가 seed 와 같은지 확인하세요.")
+    started = timer.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = timer.perf_counter() - started
+
+    return {
+        'started_at': datetime.now(timezone.utc).isoformat(),
+        'base_url': args.base_url,
+        'clients': args.clients,
+        'elapsed_seconds': round(elapsed, 3),
+        'mix': args.mix,
+        'endpoints': {name: summarize(latencies[name], errors[name], elapsed) for name in names if latencies[name]},
+        'total': summarize([value for values in latencies.values() for value in values], sum(errors.values()), elapsed),
+    }
+
+
+def print_results(result: dict):
+    print(f"\n{result['clients']} clients, {result['elapsed_seconds']}s")
+    print(f"{'endpoint':<11} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name, summary in (*result['endpoints'].items(), ('total', result['total'])):
+        print(f"{name:<11} {summary['requests']:>9} {summary['errors']:>7} {summary['rps']:>8.1f} "
+              f"{summary.get('p50_ms', 0):>8.2f} {summary.get('p95_ms', 0):>8.2f} {summary.get('p99_ms', 0):>8.2f}")
+
+
+def compare(before_path: str, after_path: str):
+    with open(before_path) as before_file, open(after_path) as after_file:
+        before, after = json.load(before_file), json.load(after_file)
+
+    def change(old: float, new: float) -> str:
+        return f"{(new - old) / old * 100:+.1f}%" if old else '-'
+
+    print(f"{'endpoint':<11} {'req/s':<26} {'p95 ms':<26} {'p99 ms':<26}")
+    names = [*before['endpoints'], *(name for name in after['endpoints'] if name not in before['endpoints'])]
+    for name in (*names, 'total'):
+        old = before['total'] if name == 'total' else before['endpoints'].get(name)
+        new = after['total'] if name == 'total' else after['endpoints'].get(name)
+        if not old or not new:
+            continue
+        columns = []
+        for key in ('rps', 'p95_ms', 'p99_ms'):
+            old_value, new_value = old.get(key, 0), new.get(key, 0)
+            columns.append(f"{old_value:>8.1f}->{new_value:<8.1f} {change(old_value, new_value):>7}")
+        print(f"{name:<11} {' '.join(columns)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    seed_parser = subparsers.add_parser('seed', help="사용자와 예약 생성 (서버와 같은 DB 설정 사용)")
+    seed_parser.add_argument('--users', type=int, default=200)
+    seed_parser.add_argument('--reservations', type=int, default=20_000)
+    seed_parser.add_argument('--seed', type=int, default=1)
+
+    run_parser = subparsers.add_parser('run', help="실행 중인 서버에 부하 요청")
+    run_parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+    run_parser.add_argument('--clients', type=int, default=16)
+    run_parser.add_argument('--duration', type=float, default=30, help="실행 시간(초)")
+    run_parser.add_argument('--requests', type=int, default=0, help="지정하면 --duration 대신 총 요청 수로 끝낸다")
+    run_parser.add_argument('--users', type=int, default=200, help="seed 의 --users 와 같은 값")
+    run_parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    run_parser.add_argument('--seed', type=int, default=1)
+    run_parser.add_argument('--timeout', type=float, default=30)
+    run_parser.add_argument('--output', help="결과를 저장할 JSON 파일")
+
+    compare_parser = subparsers.add_parser('compare', help="두 run 결과(JSON) 비교")
+    compare_parser.add_argument('before')
+    compare_parser.add_argument('after')
+
+    args = parser.parse_args()
+    if args.command == 'seed':
+        seed(args.users, args.reservations, args.seed)
+    elif args.command == 'run':
+        result = run(args)
+        print_results(result)
+        if args.output:
+            with open(args.output, 'w') as output:
+                json.dump(result, output, ensure_ascii=False, indent=2)
+            print(f"\n결과를 {args.output} 에 저장했습니다.")
+    else:
+        compare(args.before, args.after)
+
+
+if __name__ == '__main__':
+    main()
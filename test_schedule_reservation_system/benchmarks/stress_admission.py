@@ -0,0 +1,147 @@
+"""
+날짜별 잠금(advisory lock)을 사용하는 예약 확정의 동시성 스트레스 테스트 (PostgreSQL 전용).
+
+    python -m benchmarks.stress_admission [--threads 16] [--requests 800] [--dates 1 2 4 8 16] [--latency-ms 2]
+
+임시 테스트 DB에서 대기 예약을 날짜 수만큼 나눠 만든 뒤, 여러 스레드가 동시에 confirm_reservation_by_id를
+호출한다. 날짜마다 절반만 수용되도록 인원을 정하므로, 결과에서 초과 확정(oversell)이 없는지와
+서로 다른 날짜 수에 따라 처리량이 늘어나는지를 함께 확인할 수 있다.
+
+로컬 DB는 왕복 지연이 거의 없어 잠금 대기보다 파이썬 CPU 시간이 먼저 병목이 된다.
+--latency-ms 로 쿼리마다 네트워크 왕복 지연을 흉내 내어 운영 환경처럼 잠금 보유 시간이 처리량을 좌우하게 한다.
+"""
+import argparse
+import queue
+import sys
+import threading
+import time as timer
+from datetime import date, time, timedelta
+
+from . import setup_django
+
+setup_django()
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.db import connection, connections  # noqa: E402
+from rest_framework.exceptions import ValidationError  # noqa: E402
+
+from core.models.capacity_ledger import CapacityLedger  # noqa: E402
+from core.models.reservation import Reservation, Status  # noqa: E402
+from core.models.reservations import Reservations  # noqa: E402
+from system_admin.reservation.services import confirm_reservation_by_id  # noqa: E402
+
+
+def prepare(user: User, requests: int, date_count: int) -> list[date]:
+    with connection.cursor() as cursor:
+        cursor.execute("TRUNCATE core_reservation, core_capacityledger")
+
+    dates = [date.today() + timedelta(days=10 + i) for i in range(date_count)]
+    per_date = requests // date_count
+    headcount = Reservations.MAX_AVAILABLE_LIMIT // max(per_date // 2, 1)
+
+    Reservation.objects.bulk_create([
+        Reservation(
+            user=user,
+            test_reservation_date=dates[i % date_count],
+            test_start_time=time(10, 0),
+            test_end_time=time(11, 0),
+            headcount=headcount,
+            status=Status.AWAIT
+        )
+        for i in range(per_date * date_count)
+    ])
+    return dates
+
+
+def simulate_latency(latency: float):
+    def wrapper(execute, sql, params, many, context):
+        timer.sleep(latency)
+        return execute(sql, params, many, context)
+    return wrapper
+
+
+def run(threads: int, latency: float) -> tuple[float, int, int]:
+    pending = queue.Queue()
+    for reservation_id in Reservation.objects.order_by('?').values_list('id', flat=True):
+        pending.put(reservation_id)
+
+    counts = {'confirmed': 0, 'rejected': 0}
+    counts_lock = threading.Lock()
+
+    def worker():
+        try:
+            with connection.execute_wrapper(simulate_latency(latency)):
+                while True:
+                    try:
+                        reservation_id = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        confirm_reservation_by_id(reservation_id)
+                        result = 'confirmed'
+                    except ValidationError:
+                        result = 'rejected'
+                    with counts_lock:
+                        counts[result] += 1
+        finally:
+            connections.close_all()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = timer.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return timer.perf_counter() - started, counts['confirmed'], counts['rejected']
+
+
+def find_oversold(dates: list[date]) -> list[date]:
+    oversold = []
+    for test_date in dates:
+        peak = Reservations(Reservation.objects.filter(
+            test_reservation_date=test_date,
+            status=Status.CONFIRM
+        )).get_peak_headcount(time(0, 0), time(23, 59))
+        if peak > Reservations.MAX_AVAILABLE_LIMIT:
+            oversold.append(test_date)
+    return oversold
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=800)
+    parser.add_argument('--dates', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    parser.add_argument('--latency-ms', type=float, default=2.0, help="쿼리마다 추가할 왕복 지연 (ms)")
+    args = parser.parse_args()
+
+    if connection.vendor != 'postgresql':
+        sys.exit("PostgreSQL 에서만 실행할 수 있습니다.")
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=1, autoclobber=True, serialize=False)
+    failed = False
+    try:
+        user = User.objects.create_user(username='stress', password='stress')
+
+        print(f"{'dates':>5} {'threads':>7} {'confirmed':>9} {'rejected':>8} {'seconds':>8} {'confirm/s':>10}  oversell")
+        for date_count in args.dates:
+            dates = prepare(user, args.requests, date_count)
+            elapsed, confirmed, rejected = run(args.threads, args.latency_ms / 1000)
+            oversold = find_oversold(dates)
+            mismatched = CapacityLedger.objects.verify(dates)
+            failed = failed or bool(oversold or mismatched)
+
+            print(f"{date_count:>5} {args.threads:>7} {confirmed:>9} {rejected:>8} {elapsed:>8.2f} "
+                  f"{(confirmed + rejected) / elapsed:>10.1f}  "
+                  f"{'none' if not oversold else len(oversold)}{' (ledger mismatch)' if mismatched else ''}")
+    finally:
+        connections.close_all()
+        connection.creation.destroy_test_db(old_name, verbosity=1)
+
+    if failed:
+        sys.exit("초과 확정 또는 장부 불일치가 발생했습니다.")
+
+
+if __name__ == '__main__':
+    main()
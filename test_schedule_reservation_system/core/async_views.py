@@ -0,0 +1,39 @@
+import inspect
+
+from asgiref.sync import sync_to_async
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    핸들러(get 등)를 async def 로 작성하는 APIView.
+    ASGI 에서는 DB 를 기다리는 동안 이벤트 루프가 다른 요청을 처리한다. (WSGI 에서도 동작한다)
+    인증·권한·스로틀 검사(initial)는 사용자 조회가 있을 수 있어 스레드에서 실행하고,
+    예외 처리와 응답 렌더링은 APIView 와 같다.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            # options, http_method_not_allowed 는 APIView 의 동기 메서드다.
+            response = handler(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
@@ -0,0 +1,153 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import IntegrityError, transaction
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken, Token
+
+from .. import db_router
+from ..models.claims_user import ClaimsUser
+from ..models.token_revocation import TokenRevocation, UsedRefreshToken
+from .token_utils import ISSUED_AT_CLAIM, TOKEN_USER_CLAIMS, set_issued_at
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+# 캐시에 "폐기 기록 없음"(None)도 저장하므로 조회 실패와 구분한다.
+MISSING = object()
+
+
+def get_cache():
+    return caches[settings.AUTH_REVOCATION_CACHE_ALIAS]
+
+
+def get_cache_timeout() -> int:
+    return int(max(api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME).total_seconds())
+
+
+def revoked_key(user_id) -> str:
+    return f'auth:revoked:{user_id}'
+
+
+def revoke_tokens(*user_ids: int):
+    """
+    지금까지 발급된 user_ids 의 토큰(액세스·리프레시)을 모두 무효로 한다.
+    폐기 시각은 DB 에 한 번에 기록하고, JWT_STATELESS_AUTH 에서 읽는 AUTH_REVOCATION_CACHE_ALIAS 캐시도 갱신한다.
+    """
+    if not user_ids:
+        return
+
+    revoked_at = timezone.now()
+    TokenRevocation.objects.bulk_create(
+        [TokenRevocation(user_id=user_id, revoked_at=revoked_at) for user_id in user_ids],
+        update_conflicts=True,
+        unique_fields=['user_id'],
+        update_fields=['revoked_at']
+    )
+    get_cache().set_many({revoked_key(user_id): revoked_at for user_id in user_ids}, get_cache_timeout())
+
+
+def get_revoked_at(user_id: int) -> datetime | None:
+    """캐시에서 폐기 시각을 읽고, 없으면 DB 에서 읽어 캐시에 둔다."""
+    cache = get_cache()
+    revoked_at = cache.get(revoked_key(user_id), MISSING)
+    if revoked_at is MISSING:
+        revoked_at = TokenRevocation.objects.filter(user_id=user_id).values_list('revoked_at', flat=True).first()
+        cache.set(revoked_key(user_id), revoked_at, get_cache_timeout())
+    return revoked_at
+
+
+def with_revoked_at(users):
+    # 사용자 행과 폐기 시각을 한 쿼리로 읽는다.
+    return users.annotate(token_revoked_at=Subquery(
+        TokenRevocation.objects.filter(user_id=OuterRef('pk')).values('revoked_at')[:1]
+    ))
+
+
+def get_issued_at(token: Token) -> int:
+    # 발급 시각 클레임이 없는 이전 토큰은 iat 초의 시작에 발급된 것으로 보아 같은 초의 폐기에도 거부한다.
+    issued_at = token.get(ISSUED_AT_CLAIM)
+    return issued_at if issued_at is not None else token.get('iat', 0) * 1_000_000
+
+
+def is_revoked(token: Token, revoked_at: datetime | None) -> bool:
+    return revoked_at is not None and get_issued_at(token) <= (revoked_at - EPOCH) // timedelta(microseconds=1)
+
+
+def refresh_tokens(refresh_token: str) -> dict:
+    """
+    리프레시 토큰으로 새 액세스 토큰을 발급한다. 비밀번호 해시는 검증하지 않고,
+    사용자의 활성 여부와 폐기 시각만 primary 에서 기본 키로 한 번 읽는다.
+    사용자 클레임은 리프레시 토큰에서 그대로 복사되며, 클레임이 바뀐 사용자의 토큰은 이미 폐기되어 있다.
+    ROTATE_REFRESH_TOKENS 가 켜져 있으면 리프레시 토큰도 새로 발급하고, 이전 토큰의 재사용은 DB 기록으로 거부한다.
+    """
+    try:
+        refresh = RefreshToken(refresh_token)
+    except TokenError:
+        raise InvalidToken("유효하지 않거나 만료된 리프레시 토큰입니다.")
+
+    with db_router.use_primary():
+        user = with_revoked_at(get_user_model().objects.filter(
+            **{api_settings.USER_ID_FIELD: refresh.get(api_settings.USER_ID_CLAIM)}
+        )).values('is_active', 'token_revoked_at').first()
+    if user is None or not user['is_active']:
+        raise AuthenticationFailed("사용할 수 없는 사용자입니다. 다시 로그인해주세요.", code='user_inactive')
+    if is_revoked(refresh, user['token_revoked_at']):
+        raise AuthenticationFailed("폐기된 토큰입니다. 다시 로그인해주세요.", code='token_revoked')
+
+    if not api_settings.ROTATE_REFRESH_TOKENS:
+        return {'access_token': str(refresh.access_token)}
+
+    # 이전 토큰의 jti 를 만료 시각까지 기록해 두고, 이미 기록된 토큰이면 거부한다. (모든 프로세스가 같은 기록을 본다)
+    try:
+        with transaction.atomic():
+            UsedRefreshToken.objects.create(
+                jti=refresh[api_settings.JTI_CLAIM],
+                expires_at=datetime.fromtimestamp(refresh['exp'], tz=dt_timezone.utc)
+            )
+    except IntegrityError:
+        raise AuthenticationFailed("이미 사용된 리프레시 토큰입니다. 다시 로그인해주세요.", code='token_reused')
+
+    refresh.set_jti()
+    refresh.set_exp()
+    refresh.set_iat()
+    set_issued_at(refresh)
+    return {'access_token': str(refresh.access_token), 'refresh_token': str(refresh)}
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT_STATELESS_AUTH 가 켜져 있으면 사용자 행을 읽지 않고 토큰 클레임으로 ClaimsUser 를 만들며,
+    폐기 여부는 AUTH_REVOCATION_CACHE_ALIAS 캐시로 확인한다. (모든 프로세스가 공유하는 캐시여야 한다)
+    그 외에는 사용자 행과 폐기 시각을 한 쿼리로 읽는다. 클레임이 없는 이전 토큰도 이 방식으로 처리한다.
+    """
+
+    def authenticate(self, request):
+        result = super().authenticate(request)
+        if result is not None:
+            db_router.set_request_user(result[0].pk)
+        return result
+
+    def get_user(self, validated_token: Token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("토큰에 사용자 정보가 없습니다.")
+
+        if settings.JWT_STATELESS_AUTH and all(claim in validated_token for claim in TOKEN_USER_CLAIMS):
+            if is_revoked(validated_token, get_revoked_at(user_id)):
+                raise AuthenticationFailed("폐기된 토큰입니다. 다시 로그인해주세요.", code='token_revoked')
+            return ClaimsUser.from_claims(user_id, validated_token['username'], validated_token['is_staff'])
+
+        user = with_revoked_at(self.user_model.objects.filter(**{api_settings.USER_ID_FIELD: user_id})).first()
+        if user is None:
+            raise AuthenticationFailed("사용자를 찾을 수 없습니다.", code='user_not_found')
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed("비활성화된 사용자입니다.", code='user_inactive')
+        if is_revoked(validated_token, user.token_revoked_at):
+            raise AuthenticationFailed("폐기된 토큰입니다. 다시 로그인해주세요.", code='token_revoked')
+        return user
@@ -52,3 +52,25 @@ login_docs = {
         400: OpenApiTypes.OBJECT
     },
 }
+
+refresh_docs = {
+    "summary": "액세스 토큰 재발급",
+    "description": "로그인 시 발급된 refresh_token 쿠키로 새 액세스 토큰을 발급합니다. 비밀번호 검증을 하지 않으므로 "
+                   "액세스 토큰이 만료되면 로그인 대신 이 API 를 사용합니다. 리프레시 토큰은 매번 새로 발급되어 쿠키가 "
+                   "교체되며, 이전 리프레시 토큰은 다시 사용할 수 없습니다. 비활성화·삭제된 사용자와 폐기된 토큰은 거부합니다.",
+    "request": None,
+    "examples": [
+        OpenApiExample(
+            name="재발급 응답 예시",
+            value={
+                "message": "토큰 재발급 성공",
+                "access_token": "<access_token>"
+            },
+            response_only=True
+        )
+    ],
+    "responses": {
+        200: OpenApiTypes.OBJECT,
+        401: OpenApiTypes.OBJECT
+    },
+}
@@ -0,0 +1,6 @@
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class ClaimsJWTScheme(SimpleJWTScheme):
+    # drf-spectacular 의 simplejwt 확장은 하위 클래스를 찾지 않으므로 같은 Bearer 스킴으로 등록한다.
+    target_class = 'core.auth.authentication.ClaimsJWTAuthentication'
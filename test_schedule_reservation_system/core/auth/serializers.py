@@ -2,6 +2,8 @@ from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from rest_framework import serializers
 
+from .. import db_router
+
 
 class SignupSerializer(serializers.ModelSerializer):
     class Meta:
@@ -25,7 +27,9 @@ class LoginSerializer(serializers.Serializer):
     password = serializers.CharField()
 
     def validate(self, data):
-        user = authenticate(**data)
+        # 가입 직후의 로그인도 찾을 수 있도록 복제 지연이 없는 primary 에서 확인한다.
+        with db_router.use_primary():
+            user = authenticate(**data)
         if not user:
             raise serializers.ValidationError("존재하지 않는 사용자 입니다.")
 
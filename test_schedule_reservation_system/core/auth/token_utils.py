@@ -1,11 +1,26 @@
+import time
+
 import jwt
 from django.conf import settings
 from jwt import InvalidTokenError
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
 
+# 인증 시 사용자 행을 읽지 않고 권한을 판단할 수 있도록 토큰에 넣는 클레임
+TOKEN_USER_CLAIMS = ('username', 'is_staff')
+# 발급 시각(마이크로초). iat 는 초 단위라 같은 초에 폐기된 뒤 새로 발급한 토큰과 구분할 수 없다.
+ISSUED_AT_CLAIM = 'iat_us'
+
+
+def set_issued_at(token):
+    token[ISSUED_AT_CLAIM] = time.time_ns() // 1_000
+
+
 def generate_tokens_for_user(user):
     token = TokenObtainPairSerializer.get_token(user)
+    for claim in TOKEN_USER_CLAIMS:
+        token[claim] = getattr(user, claim)
+    set_issued_at(token)
     return {
         "access_token": str(token.access_token),
         "refresh_token": str(token)
@@ -2,14 +2,22 @@ from rest_framework.decorators import action
 from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import NotAuthenticated
+from .authentication import ClaimsJWTAuthentication, refresh_tokens
 from .serializers import SignupSerializer, LoginSerializer
 from .token_utils import generate_tokens_for_user
 from drf_spectacular.utils import extend_schema
-from .docs import signup_docs, login_docs
+from .docs import signup_docs, login_docs, refresh_docs
+
+REFRESH_TOKEN_COOKIE = 'refresh_token'
 
 
 class AuthViewSet(ViewSet):
 
+    def get_authenticate_header(self, request):
+        # 인증 클래스를 쓰지 않는 refresh 에서도 토큰 오류를 403 이 아닌 401 로 응답한다.
+        return ClaimsJWTAuthentication().authenticate_header(request)
+
     @extend_schema(**signup_docs)
     @action(detail=False, methods=['post'], url_path='signup')
     def signup(self, request):
@@ -34,5 +42,24 @@ class AuthViewSet(ViewSet):
             "access_token": tokens['access_token']
         })
 
-        response.set_cookie("refresh_token", tokens['refresh_token'], httponly=True)
+        response.set_cookie(REFRESH_TOKEN_COOKIE, tokens['refresh_token'], httponly=True)
+        return response
+
+    # 만료된 액세스 토큰이 Authorization 헤더에 남아 있어도 재발급할 수 있도록 인증 클래스를 쓰지 않는다.
+    @extend_schema(**refresh_docs)
+    @action(detail=False, methods=['post'], url_path='refresh', authentication_classes=[])
+    def refresh(self, request):
+        refresh_token = request.COOKIES.get(REFRESH_TOKEN_COOKIE)
+        if not refresh_token:
+            raise NotAuthenticated("리프레시 토큰이 없습니다. 다시 로그인해주세요.")
+
+        tokens = refresh_tokens(refresh_token)
+
+        response = Response({
+            "message": "토큰 재발급 성공",
+            "access_token": tokens['access_token']
+        })
+
+        if 'refresh_token' in tokens:
+            response.set_cookie(REFRESH_TOKEN_COOKIE, tokens['refresh_token'], httponly=True)
         return response
@@ -0,0 +1,141 @@
+import threading
+import time
+from datetime import date
+from typing import Awaitable, Callable, Iterable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from .db_router import use_primary
+from .models.occupancy import Occupancy
+
+stats = {'hits': 0, 'misses': 0}
+stats_lock = threading.Lock()
+
+
+def get_cache():
+    return caches[settings.AVAILABILITY_CACHE_ALIAS]
+
+
+def version_key(test_date: date) -> str:
+    return f'availability:version:{test_date}'
+
+
+def occupancy_key(test_date: date, version: int) -> str:
+    return f'availability:occupancy:{test_date}:{version}'
+
+
+def new_version() -> int:
+    # 버전 키가 만료·축출되어도 이전 버전 번호를 다시 쓰지 않도록 시각 기반 값으로 시작한다.
+    return time.time_ns()
+
+
+def get_version_timeout() -> int:
+    # 프로세스별 캐시에서는 다른 워커의 변경으로 버전이 오르지 않으므로, 점유 배열과 같이 만료시켜
+    # 최대 AVAILABILITY_CACHE_TIMEOUT 뒤에는 새 버전으로 다시 읽게 한다.
+    return settings.AVAILABILITY_CACHE_TIMEOUT
+
+
+def get_versions(dates: list[date]) -> dict[date, int]:
+    cache = get_cache()
+    keys = {version_key(d): d for d in dates}
+    versions = {keys[key]: version for key, version in cache.get_many(keys).items()}
+
+    missing = {version_key(d): new_version() for d in dates if d not in versions}
+    if missing:
+        cache.set_many(missing, get_version_timeout())
+        versions.update({keys[key]: version for key, version in missing.items()})
+    return versions
+
+
+async def aget_versions(dates: list[date]) -> dict[date, int]:
+    cache = get_cache()
+    keys = {version_key(d): d for d in dates}
+    versions = {keys[key]: version for key, version in (await cache.aget_many(keys)).items()}
+
+    missing = {version_key(d): new_version() for d in dates if d not in versions}
+    if missing:
+        await cache.aset_many(missing, get_version_timeout())
+        versions.update({keys[key]: version for key, version in missing.items()})
+    return versions
+
+
+def bump_version(test_date: date):
+    cache = get_cache()
+    try:
+        cache.incr(version_key(test_date))
+    except ValueError:
+        cache.set(version_key(test_date), new_version(), get_version_timeout())
+
+
+def invalidate(*dates: date, using: str = None):
+    # 커밋 전에 캐시된 값이 남지 않도록 즉시 한 번, 커밋 후 다시 한 번 버전을 올린다.
+    for test_date in set(dates):
+        bump_version(test_date)
+        transaction.on_commit(lambda d=test_date: bump_version(d), using=using)
+
+
+def count_lookups(hits: int, misses: int):
+    with stats_lock:
+        stats['hits'] += hits
+        stats['misses'] += misses
+
+
+def get_occupancies(dates: Iterable[date],
+                    load: Callable[[list[date]], dict[date, Occupancy]]) -> dict[date, Occupancy]:
+    cache = get_cache()
+    dates = list(dates)
+    keys = {d: occupancy_key(d, version) for d, version in get_versions(dates).items()}
+
+    cached = cache.get_many(keys.values())
+    occupancies = {d: cached[keys[d]] for d in dates if keys[d] in cached}
+    missing = [d for d in dates if d not in occupancies]
+    count_lookups(len(occupancies), len(missing))
+
+    if missing:
+        # 캐시에는 복제 지연이 없는 최신 값을 채운다.
+        with use_primary():
+            loaded = load(missing)
+        cache.set_many({keys[d]: loaded[d] for d in missing}, settings.AVAILABILITY_CACHE_TIMEOUT)
+        occupancies.update(loaded)
+    return occupancies
+
+
+async def aget_occupancies(dates: Iterable[date],
+                           load: Callable[[list[date]], Awaitable[dict[date, Occupancy]]]) -> dict[date, Occupancy]:
+    cache = get_cache()
+    dates = list(dates)
+    keys = {d: occupancy_key(d, version) for d, version in (await aget_versions(dates)).items()}
+
+    cached = await cache.aget_many(keys.values())
+    occupancies = {d: cached[keys[d]] for d in dates if keys[d] in cached}
+    missing = [d for d in dates if d not in occupancies]
+    count_lookups(len(occupancies), len(missing))
+
+    if missing:
+        with use_primary():
+            loaded = await load(missing)
+        await cache.aset_many({keys[d]: loaded[d] for d in missing}, settings.AVAILABILITY_CACHE_TIMEOUT)
+        occupancies.update(loaded)
+    return occupancies
+
+
+def get_occupancy(test_date: date, load: Callable[[list[date]], dict[date, Occupancy]]) -> Occupancy:
+    return get_occupancies([test_date], load)[test_date]
+
+
+async def aget_occupancy(test_date: date,
+                         load: Callable[[list[date]], Awaitable[dict[date, Occupancy]]]) -> Occupancy:
+    return (await aget_occupancies([test_date], load))[test_date]
+
+
+def get_stats() -> dict:
+    with stats_lock:
+        hits, misses = stats['hits'], stats['misses']
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 4) if total else 0.0,
+    }
@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+# 서버 프로세스마다 따로 저장되어 다른 워커와 공유되지 않는 캐시 백엔드
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@register(Tags.security)
+def check_revocation_cache(app_configs, **kwargs):
+    # JWT_STATELESS_AUTH 는 토큰 폐기 여부를 캐시로만 확인하므로 폐기한 프로세스 외에는 반영되지 않는다.
+    if not settings.JWT_STATELESS_AUTH:
+        return []
+
+    backend = settings.CACHES[settings.AUTH_REVOCATION_CACHE_ALIAS]['BACKEND']
+    if backend not in PROCESS_LOCAL_CACHE_BACKENDS:
+        return []
+    return [Error(
+        f"JWT_STATELESS_AUTH 를 사용하려면 AUTH_REVOCATION_CACHE_ALIAS('{settings.AUTH_REVOCATION_CACHE_ALIAS}')가 "
+        f"모든 서버 프로세스가 공유하는 캐시여야 합니다. (현재 {backend})",
+        hint="CACHES 에 Redis, Memcached 등 공유 캐시를 추가하고 AUTH_REVOCATION_CACHE_ALIAS 로 지정하세요.",
+        id='core.E001',
+    )]
+
+
+@register(Tags.caches)
+def check_replica_pin_cache(app_configs, **kwargs):
+    # 쓰기 후 primary 로 읽게 하는 기록이 프로세스별이면 다른 워커가 처리한 요청은 지연된 복제본을 읽는다.
+    if not settings.DATABASE_REPLICAS or not settings.REPLICA_READ_YOUR_WRITES_SECONDS:
+        return []
+
+    backend = settings.CACHES[settings.REPLICA_PIN_CACHE_ALIAS]['BACKEND']
+    if backend not in PROCESS_LOCAL_CACHE_BACKENDS:
+        return []
+    return [Error(
+        f"DATABASE_REPLICAS 를 사용하려면 REPLICA_PIN_CACHE_ALIAS('{settings.REPLICA_PIN_CACHE_ALIAS}')가 "
+        f"모든 서버 프로세스가 공유하는 캐시여야 합니다. (현재 {backend})",
+        hint="CACHES 에 Redis, Memcached 등 공유 캐시를 추가하고 REPLICA_PIN_CACHE_ALIAS 로 지정하거나, "
+             "REPLICA_READ_YOUR_WRITES_SECONDS 를 0 으로 두세요.",
+        id='core.E002',
+    )]
@@ -0,0 +1,48 @@
+import hashlib
+from typing import Any, Awaitable, Callable
+
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return quote_etag(digest)
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+
+    # If-None-Match 는 약한 비교를 사용한다. (W/ 접두사 무시)
+    etags = parse_etags(header)
+    return '*' in etags or any(value.removeprefix('W/') == etag for value in etags)
+
+
+def conditional_response(request: Request, etag: str, get_data: Callable[[], Any]) -> Response:
+    """
+    버전 토큰으로 만든 ETag 가 If-None-Match 와 같으면 get_data 를 호출하지 않고 304 를 반환한다.
+    같은 데이터라도 렌더러(JSON, Browsable API)에 따라 응답 본문이 다르므로 협상된 미디어 타입을 ETag 에 포함한다.
+    """
+    etag = make_etag(etag, request.accepted_media_type)
+    if is_not_modified(request, etag):
+        return with_etag(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+    return with_etag(Response(get_data()), etag)
+
+
+async def aconditional_response(request: Request, etag: str, get_data: Callable[[], Awaitable[Any]]) -> Response:
+    etag = make_etag(etag, request.accepted_media_type)
+    if is_not_modified(request, etag):
+        return with_etag(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+    return with_etag(Response(await get_data()), etag)
+
+
+def with_etag(response: Response, etag: str) -> Response:
+    response['ETag'] = etag
+    # 클라이언트가 저장한 응답을 쓰기 전에 항상 재검증하게 한다.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -0,0 +1,26 @@
+import time
+
+from django.db.backends.postgresql import base
+
+from core import db_pool
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    연결을 얻는 시간과 사용 중인 연결 수를 core.db_pool 에 기록하는 PostgreSQL 백엔드.
+    풀(OPTIONS['pool'])을 사용하면 풀에서 꺼내고 돌려주는 시점을 기록한다.
+    """
+
+    def get_new_connection(self, conn_params):
+        started = time.perf_counter()
+        connection = super().get_new_connection(conn_params)
+        db_pool.record_acquire(self.alias, time.perf_counter() - started)
+        return connection
+
+    def _close(self):
+        if self.connection is None:
+            return
+        try:
+            return super()._close()
+        finally:
+            db_pool.record_release(self.alias)
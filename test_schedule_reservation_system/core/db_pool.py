@@ -0,0 +1,78 @@
+import threading
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# alias 별 연결 획득 통계 (프로세스 기준). core.db_backend 가 기록한다.
+stats: dict[str, dict] = {}
+stats_lock = threading.Lock()
+
+
+def _alias_stats(alias: str) -> dict:
+    return stats.setdefault(alias, {'in_use': 0, 'acquired': 0, 'acquire_seconds': 0.0, 'acquire_max_seconds': 0.0})
+
+
+def record_acquire(alias: str, seconds: float):
+    with stats_lock:
+        alias_stats = _alias_stats(alias)
+        alias_stats['in_use'] += 1
+        alias_stats['acquired'] += 1
+        alias_stats['acquire_seconds'] += seconds
+        alias_stats['acquire_max_seconds'] = max(alias_stats['acquire_max_seconds'], seconds)
+
+
+def record_release(alias: str):
+    with stats_lock:
+        alias_stats = _alias_stats(alias)
+        alias_stats['in_use'] = max(alias_stats['in_use'] - 1, 0)
+
+
+def reset_stats():
+    with stats_lock:
+        stats.clear()
+
+
+def get_mode(settings_dict: dict) -> str:
+    if settings_dict.get('OPTIONS', {}).get('pool'):
+        return 'pool'
+    # CONN_MAX_AGE 가 None 이면 연결을 닫지 않는다.
+    if settings_dict.get('CONN_MAX_AGE') != 0:
+        return 'persistent'
+    return 'none'
+
+
+def get_alias_stats(alias: str) -> dict:
+    connection = connections[alias]
+    settings_dict = connection.settings_dict
+    mode = get_mode(settings_dict)
+
+    with stats_lock:
+        alias_stats = dict(_alias_stats(alias))
+    acquired = alias_stats['acquired']
+
+    result = {
+        'mode': mode,
+        'conn_max_age': settings_dict.get('CONN_MAX_AGE'),
+        'health_checks': settings_dict.get('CONN_HEALTH_CHECKS'),
+        'in_use': alias_stats['in_use'],
+        'waiting': 0,
+        'acquired': acquired,
+        'acquire_avg_ms': round(alias_stats['acquire_seconds'] / acquired * 1000, 3) if acquired else 0.0,
+        'acquire_max_ms': round(alias_stats['acquire_max_seconds'] * 1000, 3),
+        'pool': None,
+    }
+    if mode == 'pool':
+        # psycopg_pool 의 통계: 풀 크기, 남은 연결, 대기 중인 요청 수, 누적 대기 시간 등
+        pool_stats = connection.pool.get_stats()
+        result['waiting'] = pool_stats.get('requests_waiting', 0)
+        result['pool'] = pool_stats
+    return result
+
+
+def get_stats() -> dict:
+    """
+    primary 와 DATABASE_REPLICAS 의 연결 통계를 반환한다.
+    in_use 는 이 프로세스에서 열려 있는(풀 사용 시 풀에서 꺼낸) 연결 수, acquire 는 연결을 얻는 데 걸린 시간이다.
+    (지속 연결은 새 연결 수립 시간, 풀은 풀에서 꺼내는 시간)
+    """
+    return {alias: get_alias_stats(alias) for alias in (DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS)}
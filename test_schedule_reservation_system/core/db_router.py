@@ -0,0 +1,104 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+@dataclass
+class RoutingState:
+    # 요청 안에서 쓰기가 있었거나 최근에 쓴 사용자의 요청이면 읽기도 primary 로 보낸다.
+    primary: bool = False
+    wrote: bool = False
+    user_id: int | None = None
+
+
+routing_state: ContextVar[RoutingState | None] = ContextVar('routing_state', default=None)
+primary_only: ContextVar[bool] = ContextVar('primary_only', default=False)
+
+
+def pinned_key(user_id: int) -> str:
+    return f'db:pinned:{user_id}'
+
+
+def pin_cache():
+    return caches[settings.REPLICA_PIN_CACHE_ALIAS]
+
+
+def replicas_enabled() -> bool:
+    return bool(settings.DATABASE_REPLICAS)
+
+
+def in_write_transaction() -> bool:
+    # 쓰기 트랜잭션 안의 읽기(인원 검사 등)는 복제 지연의 영향을 받지 않도록 primary 에서 한다.
+    return connections[DEFAULT_DB_ALIAS].in_atomic_block
+
+
+@contextmanager
+def use_primary():
+    """블록 안의 읽기를 primary 로 보낸다. (캐시를 채우는 읽기 등 최신 값이 필요한 경우)"""
+    token = primary_only.set(True)
+    try:
+        yield
+    finally:
+        primary_only.reset(token)
+
+
+def begin_request() -> object:
+    return routing_state.set(RoutingState())
+
+
+def end_request(token: object):
+    state = routing_state.get()
+    routing_state.reset(token)
+
+    window = settings.REPLICA_READ_YOUR_WRITES_SECONDS
+    if state is not None and state.wrote and state.user_id is not None and window and replicas_enabled():
+        pin_cache().set(pinned_key(state.user_id), True, window)
+
+
+def set_request_user(user_id: int):
+    """
+    인증된 사용자를 요청 상태에 기록한다. 최근 쓰기가 있던 사용자면 이번 요청의 읽기를 primary 로 보낸다.
+    (REPLICA_READ_YOUR_WRITES_SECONDS 동안)
+    """
+    state = routing_state.get()
+    if state is None or not replicas_enabled():
+        return
+
+    state.user_id = user_id
+    if settings.REPLICA_READ_YOUR_WRITES_SECONDS and pin_cache().get(pinned_key(user_id)):
+        state.primary = True
+
+
+class ReplicaRouter:
+    """
+    DATABASE_REPLICAS 에 지정한 복제본으로 읽기를 나누고 쓰기는 모두 default(primary)로 보낸다.
+    DATABASE_REPLICAS 가 비어 있으면 모든 쿼리가 default 를 사용한다.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not replicas_enabled() or primary_only.get() or in_write_transaction():
+            return DEFAULT_DB_ALIAS
+
+        state = routing_state.get()
+        if state is not None and (state.primary or state.wrote):
+            return DEFAULT_DB_ALIAS
+
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        state = routing_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 primary 와 같은 데이터이므로 어느 쪽에서 읽은 객체끼리도 관계를 맺을 수 있다.
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
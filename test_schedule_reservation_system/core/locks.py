@@ -0,0 +1,28 @@
+from datetime import date
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# advisory lock 키 (namespace, date.toordinal()) 의 namespace. 다른 advisory lock 과 겹치지 않게 구분한다.
+RESERVATION_DATE_LOCK_NAMESPACE = 20_250_401
+
+
+def lock_reservation_dates(*dates: date, using: str = DEFAULT_DB_ALIAS):
+    """
+    예약 날짜 단위로 인원 검사와 확정 인원 변경을 직렬화한다.
+    트랜잭션이 끝나면 자동으로 해제되며, 서로 다른 날짜는 동시에 진행된다.
+    """
+    connection = connections[using]
+    if not connection.in_atomic_block:
+        raise RuntimeError("lock_reservation_dates는 transaction.atomic 안에서 호출해야 합니다.")
+
+    # SQLite 등은 쓰기 트랜잭션이 DB 단위로 직렬화되므로 별도 잠금이 필요 없다.
+    if connection.vendor != 'postgresql':
+        return
+
+    with connection.cursor() as cursor:
+        # 여러 날짜를 잠글 때는 항상 같은 순서로 잠가 교착 상태를 피한다.
+        for test_date in sorted(set(dates)):
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(%s, %s)",
+                [RESERVATION_DATE_LOCK_NAMESPACE, test_date.toordinal()]
+            )
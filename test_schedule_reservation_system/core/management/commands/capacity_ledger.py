@@ -0,0 +1,33 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models.capacity_ledger import CapacityLedger
+
+
+class Command(BaseCommand):
+    help = "예약(Reservation) 테이블을 기준으로 시간대별 확정 인원 장부(CapacityLedger)를 검증하거나 재구성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['verify', 'rebuild'])
+        parser.add_argument(
+            '--date',
+            dest='dates',
+            action='append',
+            type=date.fromisoformat,
+            help="대상 날짜 (YYYY-MM-DD). 여러 번 지정할 수 있으며, 생략하면 전체 날짜를 대상으로 합니다."
+        )
+
+    def handle(self, *args, action, dates, **options):
+        if action == 'rebuild':
+            rebuilt = CapacityLedger.objects.rebuild(dates)
+            self.stdout.write(self.style.SUCCESS(f"{rebuilt}개 날짜의 장부를 재구성했습니다."))
+            return
+
+        mismatched = CapacityLedger.objects.verify(dates)
+        if mismatched:
+            for test_date in mismatched:
+                self.stderr.write(f"불일치: {test_date.isoformat()}")
+            raise CommandError(f"{len(mismatched)}개 날짜의 장부가 예약 정보와 일치하지 않습니다. rebuild를 실행하세요.")
+
+        self.stdout.write(self.style.SUCCESS("장부가 예약 정보와 일치합니다."))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.models.token_revocation import UsedRefreshToken
+
+
+class Command(BaseCommand):
+    help = "만료된 리프레시 토큰의 사용 기록을 삭제합니다. 만료된 토큰은 서명 검증에서 거부되므로 기록이 필요 없습니다."
+
+    def handle(self, *args, **options):
+        deleted, _ = UsedRefreshToken.objects.filter(expires_at__lt=timezone.now()).delete()
+        self.stdout.write(self.style.SUCCESS(f"만료된 리프레시 토큰 기록 {deleted}건을 삭제했습니다."))
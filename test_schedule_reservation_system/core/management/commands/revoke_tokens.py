@@ -0,0 +1,21 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from core.auth.authentication import revoke_tokens
+
+
+class Command(BaseCommand):
+    help = "사용자에게 지금까지 발급된 액세스·리프레시 토큰을 모두 폐기합니다. 폐기 후에는 다시 로그인해야 합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('usernames', nargs='+', help="토큰을 폐기할 사용자 이름")
+
+    def handle(self, *args, usernames, **options):
+        users = dict(User.objects.filter(username__in=usernames).values_list('username', 'id'))
+        missing = [username for username in usernames if username not in users]
+        if missing:
+            raise CommandError(f"존재하지 않는 사용자입니다: {', '.join(missing)}")
+
+        for user_id in users.values():
+            revoke_tokens(user_id)
+        self.stdout.write(self.style.SUCCESS(f"{len(users)}명의 토큰을 폐기했습니다."))
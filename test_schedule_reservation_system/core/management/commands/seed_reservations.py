@@ -0,0 +1,290 @@
+import io
+import math
+import random
+import time as timer
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from statistics import NormalDist
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+
+from core.auth.authentication import revoke_tokens
+from core.models.capacity_ledger import CapacityLedger
+from core.models.occupancy import Occupancy
+from core.models.reservation import Reservation, Status
+from core.models.reservations import Reservations
+from core.signals import defer_token_revocation
+
+BUCKET_MINUTES = CapacityLedger.BUCKET_MINUTES
+
+# 시작 시각(시)별 가중치: 오전 9~11시, 오후 1~3시에 몰린다.
+START_HOUR_WEIGHTS = {
+    7: 2, 8: 5, 9: 12, 10: 14, 11: 9, 12: 4, 13: 10, 14: 12, 15: 9, 16: 6, 17: 4, 18: 3, 19: 2, 20: 1,
+}
+DURATION_WEIGHTS = {60: 40, 90: 20, 120: 30, 180: 10}
+# 주말(토, 일)에는 예약이 적다.
+WEEKDAY_WEIGHTS = (10, 10, 10, 10, 9, 3, 2)
+# 지난 날짜의 예약은 대부분 확정되었고, 앞으로의 예약은 일부만 확정되어 있다.
+PAST_CONFIRM_RATIO = 0.85
+FUTURE_CONFIRM_RATIO = 0.35
+LAST_END_MINUTE = 23 * 60 + 30
+# 예약 인원: 로그 정규 분포(중앙값 약 20명, 드물게 수천 명)의 분위수 표
+HEADCOUNT_TABLE = [
+    min(max(int(math.exp(NormalDist(3.0, 1.0).inv_cdf((i + 0.5) / 1024))), 1), 5_000) for i in range(1024)
+]
+
+COPY_COLUMNS = (
+    'user_id', 'test_reservation_date', 'test_start_time', 'test_end_time',
+    'headcount', 'status', 'created_at', 'updated_at'
+)
+
+
+class ReservationGenerator:
+    """
+    같은 seed, 시작 날짜, 기준 날짜(today)면 같은 예약을 같은 순서로 만든다.
+    확정 예약은 날짜별 버킷 합계(CapacityLedger 와 같은 방식)가 한도를 넘지 않을 때만 확정으로 두고,
+    넘으면 대기로 둔다. 확정으로 더한 인원은 get_added_occupancies 로 장부에 반영한다.
+    """
+
+    def __init__(self, seed: int, user_ids: list[int], start_date: date, days: int, today: date,
+                 occupancies: dict[date, Occupancy]):
+        self.rng = random.Random(seed)
+        self.user_ids = user_ids
+        self.today = today
+        # 생성 시각의 상한. 실행 시각 대신 기준 날짜의 자정을 써서 언제 실행해도 같은 값을 만든다.
+        self.now = datetime.combine(today, time.min, tzinfo=dt_timezone.utc)
+        dates = [start_date + timedelta(days=offset) for offset in range(days)]
+        # 가중치만큼 값을 반복한 표에서 random() 한 번으로 뽑는다. (random.choices 보다 몇 배 빠르다)
+        self.date_table = weighted_table({d: WEEKDAY_WEIGHTS[d.weekday()] for d in dates})
+        self.start_table = weighted_table({
+            hour * 60 + minute: weight for hour, weight in START_HOUR_WEIGHTS.items() for minute in (0, 30)
+        })
+        self.duration_table = weighted_table(DURATION_WEIGHTS)
+        self.midnights = {d: datetime.combine(d, time.min, tzinfo=dt_timezone.utc) for d in dates}
+        self.initial = {d: [int(headcount) for headcount in occupancies[d].slots] for d in dates}
+        self.buckets = {d: list(buckets) for d, buckets in self.initial.items()}
+        self.confirmed = 0
+
+    def try_confirm(self, test_date: date, start: int, end: int, headcount: int) -> bool:
+        buckets = self.buckets[test_date]
+        first, last = start // BUCKET_MINUTES, (end - 1) // BUCKET_MINUTES
+        if max(buckets[first:last + 1]) + headcount > Reservations.MAX_AVAILABLE_LIMIT:
+            return False
+        for bucket in range(first, last + 1):
+            buckets[bucket] += headcount
+        self.confirmed += 1
+        return True
+
+    def get_added_occupancies(self) -> dict[date, Occupancy]:
+        occupancies = {}
+        for test_date, buckets in self.buckets.items():
+            occupancy = Occupancy(BUCKET_MINUTES, use_numpy=False)
+            occupancy.slots = [after - before for after, before in zip(buckets, self.initial[test_date])]
+            occupancies[test_date] = occupancy
+        return occupancies
+
+    def generate(self, count: int):
+        """(user_id, 날짜, 시작 분, 종료 분, 인원, 상태, created_at, updated_at) 를 count 개 만든다."""
+        rnd = self.rng.random
+        date_table, start_table, duration_table = self.date_table, self.start_table, self.duration_table
+        user_ids, now = self.user_ids, self.now
+        for _ in range(count):
+            test_date = date_table[int(rnd() * len(date_table))]
+            start = start_table[int(rnd() * len(start_table))]
+            end = min(start + duration_table[int(rnd() * len(duration_table))], LAST_END_MINUTE)
+            headcount = HEADCOUNT_TABLE[int(rnd() * len(HEADCOUNT_TABLE))]
+
+            ratio = PAST_CONFIRM_RATIO if test_date < self.today else FUTURE_CONFIRM_RATIO
+            confirmed = rnd() < ratio and self.try_confirm(test_date, start, end, headcount)
+
+            # 시험일 3~60일 전에 신청, 확정은 신청 후 1~48시간 뒤. 기준 날짜 이후 시각은 기준 날짜 자정으로 맞춘다.
+            created_at = self.midnights[test_date] - timedelta(seconds=3 * 86_400 + int(rnd() * 57 * 86_400))
+            updated_at = created_at + timedelta(hours=1 + int(rnd() * 48)) if confirmed else created_at
+            # 일부 기업이 예약을 많이 한다. (앞쪽 사용자일수록 자주 뽑힌다)
+            user_id = user_ids[int(len(user_ids) * rnd() ** 2)]
+            yield (
+                user_id, test_date, start, end, headcount,
+                Status.CONFIRM.value if confirmed else Status.AWAIT.value,
+                min(created_at, now), min(updated_at, now)
+            )
+
+
+def weighted_table(weights: dict) -> list:
+    return [value for value, weight in weights.items() for _ in range(weight)]
+
+
+def minute_to_time(minute: int) -> time:
+    return time(minute // 60, minute % 60)
+
+
+def copy_chunks(rows, chunk_size: int = 10_000):
+    """COPY 텍스트 형식의 행을 chunk_size 개씩 묶어 bytes 로 반환한다."""
+    # 날짜와 시각 문자열은 종류가 적으므로 한 번만 만든다.
+    dates, times = {}, {}
+    lines = []
+    for user_id, test_date, start, end, headcount, status, created_at, updated_at in rows:
+        date_text = dates.get(test_date) or dates.setdefault(test_date, test_date.isoformat())
+        start_text = times.get(start) or times.setdefault(start, minute_to_time(start).isoformat())
+        end_text = times.get(end) or times.setdefault(end, minute_to_time(end).isoformat())
+        lines.append(
+            f"{user_id}\t{date_text}\t{start_text}\t{end_text}\t{headcount}\t{status}\t"
+            f"{created_at.isoformat()}\t{updated_at.isoformat()}\n"
+        )
+        if len(lines) == chunk_size:
+            yield ''.join(lines).encode()
+            lines = []
+    if lines:
+        yield ''.join(lines).encode()
+
+
+class Command(BaseCommand):
+    help = (
+        "성능 테스트용 사용자와 예약을 대량으로 생성합니다. 같은 --seed, --start-date, --today 면 같은 데이터를 만듭니다. "
+        "PostgreSQL 에서는 COPY, 그 외에는 bulk_create 로 적재하고 확정 인원 장부에 확정한 인원을 더합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1_000, help="생성할 사용자 수 (기본 1,000)")
+        parser.add_argument('--reservations', type=int, default=100_000, help="생성할 예약 수 (기본 100,000)")
+        parser.add_argument('--seed', type=int, default=1, help="난수 seed (기본 1)")
+        parser.add_argument(
+            '--start-date',
+            type=date.fromisoformat,
+            help="예약 날짜 범위의 시작 (YYYY-MM-DD, 기본 --today 부터 60일 전)"
+        )
+        parser.add_argument(
+            '--today',
+            type=date.fromisoformat,
+            help="확정 비율(지난 날짜/앞으로의 날짜)과 생성 시각 상한의 기준 날짜 (YYYY-MM-DD, 기본 오늘)"
+        )
+        parser.add_argument('--days', type=int, default=180, help="예약 날짜 범위의 일 수 (기본 180)")
+        parser.add_argument('--batch-size', type=int, default=100_000, help="한 번에 적재할 예약 수 (기본 100,000)")
+        parser.add_argument(
+            '--method',
+            choices=['auto', 'copy', 'bulk'],
+            default='auto',
+            help="적재 방식. auto 는 PostgreSQL 이면 copy, 아니면 bulk(bulk_create)"
+        )
+        parser.add_argument('--prefix', default='seed_user_', help="생성할 사용자 이름의 접두사 (기본 seed_user_)")
+        parser.add_argument('--password', default='seed-password', help="생성할 사용자의 비밀번호")
+        parser.add_argument('--clear', action='store_true', help="같은 접두사로 만든 사용자와 예약을 먼저 삭제")
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, users, reservations, seed, start_date, today, days, batch_size, method, prefix,
+               password, clear, database, **options):
+        if users < 1 or reservations < 0 or days < 1 or batch_size < 1:
+            raise CommandError("--users, --days, --batch-size 는 1 이상, --reservations 는 0 이상이어야 합니다.")
+
+        connection = connections[database]
+        if method == 'auto':
+            method = 'copy' if connection.vendor == 'postgresql' else 'bulk'
+        elif method == 'copy' and connection.vendor != 'postgresql':
+            raise CommandError("COPY 는 PostgreSQL 에서만 사용할 수 있습니다. --method bulk 를 사용하세요.")
+
+        today = today or timezone.now().date()
+        start_date = start_date or today - timedelta(days=60)
+        dates = [start_date + timedelta(days=offset) for offset in range(days)]
+        ledger = CapacityLedger.objects.db_manager(database)
+        started = timer.perf_counter()
+
+        with transaction.atomic(using=database):
+            seeded_users = User.objects.using(database).filter(username__startswith=prefix)
+            if clear:
+                # 삭제한 예약이 있던 날짜의 장부를 남은 예약 기준으로 맞춘다.
+                ledger.rebuild(self.clear(database, seeded_users))
+            elif seeded_users.exists():
+                raise CommandError(f"'{prefix}' 로 시작하는 사용자가 이미 있습니다. --clear 로 먼저 삭제하세요.")
+
+            user_ids = self.create_users(database, users, prefix, password)
+            generator = ReservationGenerator(seed, user_ids, start_date, days, today, ledger.get_occupancies(dates))
+
+            written = 0
+            while written < reservations:
+                rows = generator.generate(min(batch_size, reservations - written))
+                count = self.copy_rows(connection, rows) if method == 'copy' else self.bulk_create_rows(database, rows)
+                written += count
+                if options['verbosity'] >= 2:
+                    self.stdout.write(f"{written:,}/{reservations:,}건 ({timer.perf_counter() - started:.1f}초)")
+
+            # 확정 예약을 다시 읽어 재구성하지 않고, 만들면서 더한 인원을 장부에 반영한다.
+            ledger.add_occupancies(generator.get_added_occupancies())
+
+        elapsed = timer.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"사용자 {users:,}명, 예약 {reservations:,}건(확정 {generator.confirmed:,}건)을 {method} 로 "
+            f"{elapsed:.1f}초에 적재했습니다."
+        ))
+
+    def clear(self, database: str, seeded_users) -> set[date]:
+        reservations = Reservation.objects.using(database).filter(user__in=seeded_users)
+        stale_dates = set(reservations.values_list('test_reservation_date', flat=True).distinct())
+        # 예약 삭제 시그널(캐시 무효화)을 건마다 보내지 않도록 한 번에 삭제한다. 장부와 캐시는 재구성할 때 맞춘다.
+        connection = connections[database]
+        sql, params = seeded_users.values('id').query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {connection.ops.quote_name(Reservation._meta.db_table)} WHERE user_id IN ({sql})",
+                params
+            )
+        # 사용자마다 토큰 폐기 쿼리를 보내지 않고 한 번에 폐기한다.
+        user_ids = list(seeded_users.values_list('id', flat=True))
+        with defer_token_revocation():
+            seeded_users.delete()
+        revoke_tokens(*user_ids)
+        return stale_dates
+
+    def create_users(self, database: str, count: int, prefix: str, password: str) -> list[int]:
+        # 비밀번호 해시는 느리므로 한 번만 계산해 모든 사용자에 쓴다.
+        password = make_password(password)
+        created = User.objects.using(database).bulk_create(
+            [User(username=f'{prefix}{i}', password=password) for i in range(count)],
+            batch_size=10_000
+        )
+        return [user.pk for user in created]
+
+    def copy_rows(self, connection, rows) -> int:
+        columns = ', '.join(
+            connection.ops.quote_name(Reservation._meta.get_field(name).column) for name in COPY_COLUMNS
+        )
+        sql = f"COPY {connection.ops.quote_name(Reservation._meta.db_table)} ({columns}) FROM STDIN"
+
+        with connection.cursor() as cursor:
+            if hasattr(cursor.cursor, 'copy'):
+                # 조금씩 나눠 보내 서버가 적재하는 동안 다음 행을 만든다.
+                count = 0
+                with cursor.cursor.copy(sql) as copy:
+                    for chunk in copy_chunks(rows):
+                        copy.write(chunk)
+                        count += chunk.count(b'\n')
+                return count
+
+            # psycopg2
+            data = b''.join(copy_chunks(rows))
+            cursor.cursor.copy_expert(sql, io.BytesIO(data))
+            return data.count(b'\n')
+
+    def bulk_create_rows(self, database: str, rows) -> int:
+        reservations = [
+            Reservation(
+                user_id=user_id,
+                test_reservation_date=test_date,
+                test_start_time=minute_to_time(start),
+                test_end_time=minute_to_time(end),
+                headcount=headcount,
+                status=status,
+                created_at=created_at,
+                updated_at=updated_at
+            )
+            for user_id, test_date, start, end, headcount, status, created_at, updated_at in rows
+        ]
+        # created_at, updated_at 은 auto_now 필드라 bulk_create 는 현재 시각으로 덮어쓴다.
+        # raw 저장(loaddata 와 같은 방식)으로 객체에 넣은 값을 그대로 적재한다.
+        fields = [field for field in Reservation._meta.concrete_fields if not field.primary_key]
+        queryset = Reservation.objects.using(database)
+        batch_size = min(5_000, connections[database].ops.bulk_batch_size(fields, reservations) or 5_000)
+        for first in range(0, len(reservations), batch_size):
+            queryset._insert(reservations[first:first + batch_size], fields=fields, raw=True, using=database)
+        return len(reservations)
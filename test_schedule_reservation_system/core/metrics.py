@@ -0,0 +1,176 @@
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+UNMATCHED_VIEW = 'unmatched'
+
+# 모든 지표가 하나의 잠금을 쓴다. 기록은 요청당 한 번이라 경합이 적다.
+metrics_lock = threading.Lock()
+
+
+def escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(labels: dict) -> str:
+    return ','.join(f'{key}="{escape_label(str(value))}"' for key, value in labels.items())
+
+
+class Histogram:
+    """view 라벨별 히스토그램. 구간별 개수를 따로 두고 내보낼 때 누적한다."""
+
+    def __init__(self, name: str, documentation: str, buckets: tuple):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = buckets
+        self.series: dict[str, list] = {}
+        self.sums: dict[str, float] = {}
+
+    def observe(self, view: str, value: float):
+        # le 는 '이하' 이므로 경계값과 같은 값은 그 구간에 들어간다. 마지막 칸은 +Inf
+        index = bisect_left(self.buckets, value)
+        counts = self.series.get(view)
+        if counts is None:
+            counts = self.series.setdefault(view, [0] * (len(self.buckets) + 1))
+            self.sums.setdefault(view, 0.0)
+        counts[index] += 1
+        self.sums[view] += value
+
+    def render(self) -> list[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        for view, counts in sorted(self.series.items()):
+            label = f'view="{escape_label(view)}"'
+            total = 0
+            for bound, count in zip((*map(float, self.buckets), '+Inf'), counts):
+                total += count
+                lines.append(f'{self.name}_bucket{{{label},le="{bound}"}} {total}')
+            lines.append(f'{self.name}_sum{{{label}}} {self.sums[view]}')
+            lines.append(f'{self.name}_count{{{label}}} {total}')
+        return lines
+
+    def clear(self):
+        self.series.clear()
+        self.sums.clear()
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self.values: dict[tuple, int] = {}
+
+    def inc(self, **labels):
+        key = tuple(labels.items())
+        self.values[key] = self.values.get(key, 0) + 1
+
+    def render(self) -> list[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} counter']
+        for key, value in sorted(self.values.items()):
+            lines.append(f'{self.name}{{{format_labels(dict(key))}}} {value}')
+        return lines
+
+    def clear(self):
+        self.values.clear()
+
+
+requests_total = Counter('http_requests_total', '처리한 요청 수')
+request_duration = Histogram('http_request_duration_seconds', '요청 처리 시간 (미들웨어 기준)', DURATION_BUCKETS)
+db_queries = Histogram('http_request_db_queries', '요청당 DB 쿼리 수', QUERY_BUCKETS)
+db_duration = Histogram('http_request_db_duration_seconds', '요청당 DB 쿼리 실행 시간 합계', DURATION_BUCKETS)
+# 뷰가 끝난 뒤 Response.render() 의 시간만 잰다. 뷰 안의 직렬화(serializer.data 등)는 포함하지 않는다.
+render_duration = Histogram('http_response_render_duration_seconds', '응답 본문 렌더링 시간', DURATION_BUCKETS)
+response_size = Histogram('http_response_size_bytes', '응답 본문 크기', SIZE_BUCKETS)
+
+REGISTRY = (requests_total, request_duration, db_queries, db_duration, render_duration, response_size)
+
+
+@dataclass
+class RequestMetrics:
+    started: float
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    render_seconds: float = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        # execute_wrapper 가 요청 중 실행한 쿼리 수와 시간을 센다.
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_seconds += time.perf_counter() - started
+            self.db_queries += 1
+
+
+current_request: ContextVar[RequestMetrics | None] = ContextVar('current_request', default=None)
+
+
+def execute_wrapper(execute, sql, params, many, context):
+    # 요청 중이면 그 요청의 RequestMetrics 에 기록한다. current_request 는 sync_to_async 로 실행되는
+    # 스레드에도 전달되므로 ASGI 에서 다른 스레드의 연결로 실행한 쿼리도 센다.
+    request_metrics = current_request.get()
+    if request_metrics is None:
+        return execute(sql, params, many, context)
+    return request_metrics(execute, sql, params, many, context)
+
+
+def install_execute_wrapper(connection):
+    # 다른 코드가 execute_wrapper() 로 잠시 추가한 wrapper 를 꺼낼 때 함께 빠지지 않도록 맨 앞에 둔다.
+    if execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, execute_wrapper)
+
+
+def get_view_name(request) -> str:
+    # 라우터가 붙인 URL 이름 (예: user-reservation-get-available-slots). 경로 값이 라벨에 들어가지 않게 한다.
+    match = request.resolver_match
+    if match is None:
+        return UNMATCHED_VIEW
+    return match.url_name or match.route
+
+
+def record(view: str, method: str, status_code: int, request_metrics: RequestMetrics, size: int | None):
+    elapsed = time.perf_counter() - request_metrics.started
+    with metrics_lock:
+        requests_total.inc(view=view, method=method, status=status_code)
+        request_duration.observe(view, elapsed)
+        db_queries.observe(view, request_metrics.db_queries)
+        db_duration.observe(view, request_metrics.db_seconds)
+        render_duration.observe(view, request_metrics.render_seconds)
+        if size is not None:
+            response_size.observe(view, size)
+
+
+def record_size(view: str, size: int):
+    with metrics_lock:
+        response_size.observe(view, size)
+
+
+def render() -> str:
+    with metrics_lock:
+        lines = [line for metric in REGISTRY for line in metric.render()]
+    return '\n'.join(lines) + '\n'
+
+
+def reset():
+    with metrics_lock:
+        for metric in REGISTRY:
+            metric.clear()
+
+
+def metrics_view(request):
+    """
+    Prometheus 텍스트 형식의 요청 지표. INTERNAL_IPS 에서 온 요청만 허용한다.
+    값은 요청을 처리한 서버 프로세스 기준이다.
+    """
+    if request.META.get('REMOTE_ADDR') not in settings.INTERNAL_IPS:
+        return HttpResponseForbidden()
+    return HttpResponse(render(), content_type=CONTENT_TYPE)
@@ -0,0 +1,113 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from . import db_router, metrics
+
+
+class ReplicaRoutingMiddleware:
+    """
+    요청마다 DB 라우팅 상태를 새로 만든다. 요청 중 쓰기가 있으면 이후 읽기는 primary 로 가고,
+    응답 후에는 REPLICA_READ_YOUR_WRITES_SECONDS 동안 해당 사용자의 읽기를 primary 로 고정한다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        token = db_router.begin_request()
+        try:
+            return self.get_response(request)
+        finally:
+            db_router.end_request(token)
+
+    async def __acall__(self, request):
+        token = db_router.begin_request()
+        try:
+            return await self.get_response(request)
+        finally:
+            db_router.end_request(token)
+
+
+class MetricsMiddleware:
+    """
+    요청마다 처리 시간, DB 쿼리 수와 시간, 응답 렌더링 시간, 응답 크기를 URL 이름별로 core.metrics 에 기록한다.
+    스트리밍 응답의 크기는 전송이 끝난 뒤 기록한다.
+    DB 쿼리는 모든 연결에 걸린 metrics.execute_wrapper 가 current_request 를 보고 기록한다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        request_metrics = metrics.RequestMetrics(started=time.perf_counter())
+        token = metrics.current_request.set(request_metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            metrics.current_request.reset(token)
+        return self.finish(request, response, request_metrics)
+
+    async def __acall__(self, request):
+        request_metrics = metrics.RequestMetrics(started=time.perf_counter())
+        token = metrics.current_request.set(request_metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            metrics.current_request.reset(token)
+        return self.finish(request, response, request_metrics)
+
+    def process_template_response(self, request, response):
+        # DRF Response 는 이 미들웨어 다음에 렌더링된다. 렌더링이 끝나면 걸린 시간을 더한다.
+        request_metrics = metrics.current_request.get()
+        if request_metrics is not None:
+            started = time.perf_counter()
+
+            def rendered(response):
+                request_metrics.render_seconds += time.perf_counter() - started
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    def finish(self, request, response, request_metrics):
+        view = metrics.get_view_name(request)
+        if not response.streaming:
+            metrics.record(view, request.method, response.status_code, request_metrics, len(response.content))
+            return response
+
+        metrics.record(view, request.method, response.status_code, request_metrics, None)
+        if response.is_async:
+            response.streaming_content = self.acount_size(view, response.streaming_content)
+        else:
+            response.streaming_content = self.count_size(view, response.streaming_content)
+        return response
+
+    def count_size(self, view, content):
+        size = 0
+        for chunk in content:
+            size += len(chunk)
+            yield chunk
+        metrics.record_size(view, size)
+
+    async def acount_size(self, view, content):
+        size = 0
+        async for chunk in content:
+            size += len(chunk)
+            yield chunk
+        metrics.record_size(view, size)
@@ -0,0 +1,63 @@
+# Generated by Django 5.1.7 on 2026-10-18 21:09
+
+from itertools import accumulate, groupby
+
+from django.db import migrations, models
+
+BUCKET_MINUTES = 15
+
+
+# 마이그레이션이 현재 모델 코드에 의존하지 않도록 core.models.occupancy 의 계산을 복사해 둔다.
+def bucket_headcounts(intervals, bucket_minutes: int) -> list[int]:
+    """하루를 bucket_minutes 분 단위로 나눈 버킷별 인원. 종료 시각의 초는 다음 분으로 올린다."""
+    size = 24 * 60 // bucket_minutes
+    diff = [0] * (size + 1)
+    for start, end, headcount in intervals:
+        end_minute = end.hour * 60 + end.minute + (1 if end.second or end.microsecond else 0)
+        first = (start.hour * 60 + start.minute) // bucket_minutes
+        last = min(-(-end_minute // bucket_minutes), size)
+        if first < last:
+            diff[first] += headcount
+            diff[last] -= headcount
+    return list(accumulate(diff[:-1]))
+
+
+def build_capacity_ledger(apps, schema_editor):
+    Reservation = apps.get_model('core', 'Reservation')
+    CapacityLedger = apps.get_model('core', 'CapacityLedger')
+
+    rows = Reservation.objects.filter(status='CONFIRM').order_by('test_reservation_date').values_list(
+        'test_reservation_date', 'test_start_time', 'test_end_time', 'headcount'
+    ).iterator(chunk_size=10_000)
+
+    ledger = []
+    for test_date, intervals in groupby(rows, key=lambda row: row[0]):
+        slots = bucket_headcounts((row[1:] for row in intervals), BUCKET_MINUTES)
+        ledger.extend(
+            CapacityLedger(test_reservation_date=test_date, bucket=bucket, headcount=headcount)
+            for bucket, headcount in enumerate(slots) if headcount
+        )
+    CapacityLedger.objects.bulk_create(ledger, batch_size=5_000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_remove_reservation_member_id_reservation_user'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CapacityLedger',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('test_reservation_date', models.DateField()),
+                ('bucket', models.PositiveSmallIntegerField()),
+                ('headcount', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('test_reservation_date', 'bucket'), name='unique_capacity_ledger_bucket')],
+            },
+        ),
+        migrations.RunPython(build_capacity_ledger, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.7 on 2026-10-18 21:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_capacityledger'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(condition=models.Q(('status', 'CONFIRM')), fields=['test_reservation_date', 'test_start_time'], include=('test_end_time', 'headcount'), name='reservation_confirmed_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['user', '-test_reservation_date'], name='reservation_user_date_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.7 on 2026-10-18 21:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_reservation_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['test_reservation_date', 'id'], name='reservation_date_id_idx'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.7 on 2026-10-18 21:57
+
+from django.conf import settings
+from django.contrib.postgres import operations as postgres_operations
+from django.db import migrations, models
+
+
+# PostgreSQL 에서는 쓰기를 막지 않도록 CONCURRENTLY 로 만들고 지운다. 그 외(SQLite)에서는 일반 인덱스 작업으로 한다.
+class AddIndexConcurrently(postgres_operations.AddIndexConcurrently):
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+        else:
+            migrations.AddIndex.database_forwards(self, app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+        else:
+            migrations.AddIndex.database_backwards(self, app_label, schema_editor, from_state, to_state)
+
+
+class RemoveIndexConcurrently(postgres_operations.RemoveIndexConcurrently):
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+        else:
+            migrations.RemoveIndex.database_forwards(self, app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+        else:
+            migrations.RemoveIndex.database_backwards(self, app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+    # CREATE/DROP INDEX CONCURRENTLY 는 트랜잭션 안에서 실행할 수 없다.
+    atomic = False
+
+    dependencies = [
+        ('core', '0007_reservation_date_id_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    # 새 인덱스를 다른 이름으로 먼저 만든 뒤 기존 인덱스를 지워, 그 사이에도 사용자별 조회가 인덱스를 쓴다.
+    operations = [
+        AddIndexConcurrently(
+            model_name='reservation',
+            index=models.Index(fields=['user', '-test_reservation_date'], include=('updated_at',), name='reservation_user_date_upd_idx'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='reservation',
+            name='reservation_user_date_idx',
+        ),
+    ]
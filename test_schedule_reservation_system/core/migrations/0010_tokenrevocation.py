@@ -0,0 +1,20 @@
+# Generated by Django 5.1.7 on 2026-10-18 23:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_claimsuser'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TokenRevocation',
+            fields=[
+                ('user_id', models.IntegerField(primary_key=True, serialize=False)),
+                ('revoked_at', models.DateTimeField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,50 @@
+from itertools import accumulate, groupby
+
+from django.db import migrations
+
+
+# 마이그레이션이 현재 모델 코드에 의존하지 않도록 core.models.occupancy 의 계산을 복사해 둔다.
+def bucket_headcounts(intervals, bucket_minutes: int) -> list[int]:
+    """하루를 bucket_minutes 분 단위로 나눈 버킷별 인원. 종료 시각의 초는 다음 분으로 올린다."""
+    size = 24 * 60 // bucket_minutes
+    diff = [0] * (size + 1)
+    for start, end, headcount in intervals:
+        end_minute = end.hour * 60 + end.minute + (1 if end.second or end.microsecond else 0)
+        first = (start.hour * 60 + start.minute) // bucket_minutes
+        last = min(-(-end_minute // bucket_minutes), size)
+        if first < last:
+            diff[first] += headcount
+            diff[last] -= headcount
+    return list(accumulate(diff[:-1]))
+
+
+def rebuild_capacity_ledger(bucket_minutes: int):
+    def rebuild(apps, schema_editor):
+        Reservation = apps.get_model('core', 'Reservation')
+        CapacityLedger = apps.get_model('core', 'CapacityLedger')
+
+        CapacityLedger.objects.all().delete()
+        rows = Reservation.objects.filter(status='CONFIRM').order_by('test_reservation_date').values_list(
+            'test_reservation_date', 'test_start_time', 'test_end_time', 'headcount'
+        ).iterator(chunk_size=10_000)
+
+        for test_date, intervals in groupby(rows, key=lambda row: row[0]):
+            slots = bucket_headcounts((row[1:] for row in intervals), bucket_minutes)
+            CapacityLedger.objects.bulk_create([
+                CapacityLedger(test_reservation_date=test_date, bucket=bucket, headcount=headcount)
+                for bucket, headcount in enumerate(slots) if headcount
+            ], batch_size=5_000)
+
+    return rebuild
+
+
+class Migration(migrations.Migration):
+    # 15분 버킷 장부를 1분 버킷으로 다시 만든다.
+
+    dependencies = [
+        ('core', '0011_usedrefreshtoken'),
+    ]
+
+    operations = [
+        migrations.RunPython(rebuild_capacity_ledger(1), rebuild_capacity_ledger(15)),
+    ]
@@ -1 +1,4 @@
 from .reservation import models
+from .capacity_ledger import models
+from .claims_user import ClaimsUser
+from .token_revocation import TokenRevocation, UsedRefreshToken
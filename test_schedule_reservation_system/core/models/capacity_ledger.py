@@ -0,0 +1,171 @@
+from datetime import date, time
+from itertools import groupby
+from typing import Iterable
+
+from django.db import models, transaction
+from django.db.models import Case, F, Max, Value, When
+from rest_framework.exceptions import ValidationError
+
+from .. import availability_cache
+from .occupancy import Occupancy, slot_range
+from .reservation import Reservation, Status
+from .reservations import Reservations
+
+
+class CapacityLedgerManager(models.Manager):
+
+    def get_occupancies(self, dates: Iterable[date]) -> dict[date, Occupancy]:
+        occupancies = {d: Occupancy(CapacityLedger.BUCKET_MINUTES) for d in dates}
+        rows = self.filter(test_reservation_date__in=occupancies.keys()).values_list(
+            'test_reservation_date', 'bucket', 'headcount'
+        )
+        for test_date, bucket, headcount in rows:
+            occupancies[test_date].slots[bucket] = headcount
+        return occupancies
+
+    async def aget_occupancies(self, dates: Iterable[date]) -> dict[date, Occupancy]:
+        occupancies = {d: Occupancy(CapacityLedger.BUCKET_MINUTES) for d in dates}
+        rows = self.filter(test_reservation_date__in=occupancies.keys()).values_list(
+            'test_reservation_date', 'bucket', 'headcount'
+        )
+        async for test_date, bucket, headcount in rows:
+            occupancies[test_date].slots[bucket] = headcount
+        return occupancies
+
+    def get_occupancy(self, test_date: date) -> Occupancy:
+        return self.get_occupancies([test_date])[test_date]
+
+    def get_peak_headcount(self, test_date: date, start: time, end: time, exclude: Reservation = None) -> int:
+        first, last = slot_range(start, end, CapacityLedger.BUCKET_MINUTES)
+        headcount = F('headcount')
+
+        # 수정 중인 확정 예약은 자기 자신의 인원을 제외하고 검사한다.
+        if exclude is not None and exclude.is_confirmed() and exclude.test_reservation_date == test_date:
+            exclude_first, exclude_last = slot_range(
+                exclude.test_start_time, exclude.test_end_time, CapacityLedger.BUCKET_MINUTES
+            )
+            headcount = headcount - Case(
+                When(bucket__gte=exclude_first, bucket__lt=exclude_last, then=Value(exclude.headcount)),
+                default=Value(0)
+            )
+
+        return self.filter(
+            test_reservation_date=test_date,
+            bucket__gte=first,
+            bucket__lt=last
+        ).aggregate(peak=Max(headcount))['peak'] or 0
+
+    def validate_exceed_limit(self, test_date: date, start: time, end: time, headcount: int,
+                              exclude: Reservation = None):
+        if self.get_peak_headcount(test_date, start, end, exclude) + headcount > Reservations.MAX_AVAILABLE_LIMIT:
+            raise ValidationError("해당 시간대의 예약 인원이 50,000명을 초과합니다.")
+
+    def add(self, test_date: date, start: time, end: time, headcount: int):
+        first, last = slot_range(start, end, CapacityLedger.BUCKET_MINUTES)
+        if first >= last or not headcount:
+            return
+
+        with transaction.atomic(using=self.db):
+            self.bulk_create(
+                [CapacityLedger(test_reservation_date=test_date, bucket=bucket) for bucket in range(first, last)],
+                ignore_conflicts=True
+            )
+            self.filter(
+                test_reservation_date=test_date,
+                bucket__gte=first,
+                bucket__lt=last
+            ).update(headcount=F('headcount') + headcount)
+            availability_cache.invalidate(test_date, using=self.db)
+
+    def add_occupancies(self, occupancies: dict[date, Occupancy]):
+        # 버킷마다 더할 인원이 다른 변경분을 날짜별 UPDATE 한 번으로 반영한다. (update() 로 확정한 예약 등)
+        with transaction.atomic(using=self.db):
+            for test_date, occupancy in occupancies.items():
+                deltas = {bucket: int(headcount) for bucket, headcount in enumerate(occupancy.slots) if headcount}
+                if not deltas:
+                    continue
+
+                self.bulk_create(
+                    [CapacityLedger(test_reservation_date=test_date, bucket=bucket) for bucket in deltas],
+                    ignore_conflicts=True
+                )
+                self.filter(test_reservation_date=test_date, bucket__in=deltas.keys()).update(
+                    headcount=F('headcount') + Case(
+                        *[When(bucket=bucket, then=Value(delta)) for bucket, delta in deltas.items()],
+                        default=Value(0)
+                    )
+                )
+                availability_cache.invalidate(test_date, using=self.db)
+
+    def remove(self, test_date: date, start: time, end: time, headcount: int):
+        self.add(test_date, start, end, -headcount)
+
+    def compute_from_reservations(self, dates: Iterable[date] = None) -> dict[date, dict[int, int]]:
+        reservations = Reservation.objects.db_manager(self.db).filter(status=Status.CONFIRM)
+        if dates is not None:
+            reservations = reservations.filter(test_reservation_date__in=dates)
+
+        rows = reservations.order_by('test_reservation_date').values_list(
+            'test_reservation_date', 'test_start_time', 'test_end_time', 'headcount'
+        ).iterator(chunk_size=10_000)
+
+        expected = {}
+        for test_date, intervals in groupby(rows, key=lambda row: row[0]):
+            occupancy = Occupancy.from_intervals((row[1:] for row in intervals), CapacityLedger.BUCKET_MINUTES)
+            expected[test_date] = {
+                bucket: int(headcount) for bucket, headcount in enumerate(occupancy.slots) if headcount
+            }
+        return expected
+
+    def get_stored(self, dates: Iterable[date] = None) -> dict[date, dict[int, int]]:
+        rows = self.exclude(headcount=0)
+        if dates is not None:
+            rows = rows.filter(test_reservation_date__in=dates)
+
+        stored = {}
+        for test_date, bucket, headcount in rows.values_list('test_reservation_date', 'bucket', 'headcount'):
+            stored.setdefault(test_date, {})[bucket] = headcount
+        return stored
+
+    def verify(self, dates: Iterable[date] = None) -> list[date]:
+        dates = list(dates) if dates is not None else None
+        expected = self.compute_from_reservations(dates)
+        stored = self.get_stored(dates)
+        return sorted(d for d in expected.keys() | stored.keys() if expected.get(d, {}) != stored.get(d, {}))
+
+    def rebuild(self, dates: Iterable[date] = None) -> int:
+        dates = list(dates) if dates is not None else None
+        with transaction.atomic(using=self.db):
+            expected = self.compute_from_reservations(dates)
+
+            stale = self.all() if dates is None else self.filter(test_reservation_date__in=dates)
+            stale_dates = set(stale.values_list('test_reservation_date', flat=True).distinct())
+            stale.delete()
+
+            self.bulk_create([
+                CapacityLedger(test_reservation_date=test_date, bucket=bucket, headcount=headcount)
+                for test_date, buckets in expected.items()
+                for bucket, headcount in buckets.items()
+            ], batch_size=5_000)
+            availability_cache.invalidate(*stale_dates, *expected.keys(), using=self.db)
+        return len(expected)
+
+
+class CapacityLedger(models.Model):
+    # 날짜별 1분 버킷마다 그 분에 걸친 확정 예약 인원의 합을 저장한다. (날짜당 최대 1,440행)
+    # 예약 시각은 분 단위로 받으므로 버킷을 더 크게 잡으면 겹치지 않는 예약도 같은 버킷에 더해져 거부된다.
+    BUCKET_MINUTES = 1
+
+    test_reservation_date = models.DateField(null=False)
+    bucket = models.PositiveSmallIntegerField(null=False)
+    headcount = models.IntegerField(null=False, default=0)
+
+    objects = CapacityLedgerManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['test_reservation_date', 'bucket'],
+                name='unique_capacity_ledger_bucket'
+            )
+        ]
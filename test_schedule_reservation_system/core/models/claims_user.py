@@ -0,0 +1,23 @@
+from django.contrib.auth.models import User
+
+
+class ClaimsUser(User):
+    """
+    액세스 토큰의 클레임(user_id, username, is_staff)만으로 만든 사용자.
+    DB 에서 읽지 않은 값이므로 저장·삭제할 수 없고, 외래 키 대입과 비교에는 User 처럼 쓸 수 있다.
+    """
+
+    class Meta:
+        proxy = True
+
+    @classmethod
+    def from_claims(cls, user_id: int, username: str, is_staff: bool) -> 'ClaimsUser':
+        user = cls(id=user_id, username=username, is_staff=is_staff, is_active=True)
+        user._state.adding = False
+        return user
+
+    def save(self, *args, **kwargs):
+        raise NotImplementedError("토큰 클레임으로 만든 사용자는 저장할 수 없습니다.")
+
+    def delete(self, *args, **kwargs):
+        raise NotImplementedError("토큰 클레임으로 만든 사용자는 삭제할 수 없습니다.")
@@ -0,0 +1,51 @@
+from typing import Callable, Iterable
+
+from .occupancy import Occupancy, to_minute, to_minute_ceil
+from .reservation import Reservation
+
+
+def get_duration(reservation: Reservation) -> int:
+    return to_minute_ceil(reservation.test_end_time) - to_minute(reservation.test_start_time)
+
+
+# 탐욕 배치에 사용할 순서들. 서로 약점이 달라 가장 많이 수용한 결과를 고른다.
+# 동점이면 앞선 순서(선착순)를 택한다.
+PLAN_ORDERINGS: dict[str, Callable[[Reservation], tuple]] = {
+    'first_come': lambda r: (r.id,),
+    'largest_first': lambda r: (-r.headcount, r.id),
+    'shortest_first': lambda r: (get_duration(r), -r.headcount, r.id),
+}
+
+
+def admit_greedy(reservations: Iterable[Reservation], occupancy: Occupancy, limit: int) -> list[Reservation]:
+    """
+    주어진 순서대로 들어갈 수 있는 예약을 수용한다.
+    예약은 id, test_start_time, test_end_time, headcount 속성만 있으면 된다. (모델 또는 named values_list)
+    """
+    # 하루 슬롯 수가 작아 numpy 슬라이스보다 파이썬 리스트가 빠르다.
+    slots = [int(headcount) for headcount in occupancy.slots]
+    admitted = []
+    for reservation in reservations:
+        first, last = occupancy.slot_range(reservation.test_start_time, reservation.test_end_time)
+        headcount = reservation.headcount
+        peak = max(slots[first:last]) if first < last else 0
+        if peak + headcount <= limit:
+            for i in range(first, last):
+                slots[i] += headcount
+            admitted.append(reservation)
+    return admitted
+
+
+def plan_date(pending: list[Reservation], occupancy: Occupancy, limit: int) -> tuple[str, list[Reservation]]:
+    """
+    한 날짜의 대기 예약 중 확정할 예약을 고른다.
+    occupancy 는 이미 확정된 인원이며, 고른 예약을 모두 더해도 모든 슬롯이 limit 을 넘지 않는다.
+    PLAN_ORDERINGS 중 가장 많이 수용한 결과를 고르는 휴리스틱이라 최적 조합은 보장하지 않는다.
+    """
+    best_name, best, best_seated = None, None, -1
+    for name, key in PLAN_ORDERINGS.items():
+        admitted = admit_greedy(sorted(pending, key=key), occupancy, limit)
+        seated = sum(r.headcount for r in admitted)
+        if seated > best_seated:
+            best_name, best, best_seated = name, admitted, seated
+    return best_name, sorted(best, key=lambda r: r.id)
@@ -0,0 +1,140 @@
+import hashlib
+from array import array
+from datetime import time
+from itertools import accumulate
+from typing import Iterable
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 순수 파이썬 리스트로 동작한다.
+    np = None
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def to_minute(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+def to_minute_ceil(value: time) -> int:
+    minute = to_minute(value)
+    if value.second or value.microsecond:
+        minute += 1
+    return minute
+
+
+def slot_range(start: time, end: time, resolution: int) -> tuple[int, int]:
+    first = to_minute(start) // resolution
+    last = -(-to_minute_ceil(end) // resolution)
+    return first, min(last, MINUTES_PER_DAY // resolution)
+
+
+def to_time(minute: int) -> time:
+    if minute >= MINUTES_PER_DAY:
+        return time(23, 59)
+    return time(minute // 60, minute % 60)
+
+
+class Occupancy:
+    """
+    하루를 resolution(분) 단위 슬롯으로 나눈 확정 인원 배열.
+    차분 배열에 시작/종료를 기록한 뒤 누적합 한 번으로 모든 슬롯의 인원을 구한다.
+    """
+
+    def __init__(self, resolution: int = 1, use_numpy: bool | None = None):
+        if MINUTES_PER_DAY % resolution:
+            raise ValueError("resolution은 1440의 약수여야 합니다.")
+
+        self.resolution = resolution
+        self.size = MINUTES_PER_DAY // resolution
+        self.use_numpy = np is not None if use_numpy is None else (use_numpy and np is not None)
+        self.slots = np.zeros(self.size, dtype=np.int64) if self.use_numpy else [0] * self.size
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[tuple[time, time, int]], resolution: int = 1,
+                       use_numpy: bool | None = None) -> 'Occupancy':
+        occupancy = cls(resolution, use_numpy)
+        start_minutes, end_minutes, headcounts = [], [], []
+        for start, end, headcount in intervals:
+            start_minutes.append(start.hour * 60 + start.minute)
+            end_minutes.append(to_minute_ceil(end) if end.second or end.microsecond else end.hour * 60 + end.minute)
+            headcounts.append(headcount)
+
+        if occupancy.use_numpy:
+            firsts = np.asarray(start_minutes, dtype=np.intp) // resolution
+            lasts = np.minimum(-(-np.asarray(end_minutes, dtype=np.intp) // resolution), occupancy.size)
+            weights = np.asarray(headcounts, dtype=np.int64)
+            valid = firsts < lasts
+
+            diff = np.bincount(firsts[valid], weights[valid], minlength=occupancy.size + 1)
+            diff -= np.bincount(lasts[valid], weights[valid], minlength=occupancy.size + 1)
+            occupancy.slots = np.cumsum(diff[:-1]).astype(np.int64)
+        else:
+            diff = [0] * (occupancy.size + 1)
+            for start_minute, end_minute, headcount in zip(start_minutes, end_minutes, headcounts):
+                first = start_minute // resolution
+                last = min(-(-end_minute // resolution), occupancy.size)
+                if first < last:
+                    diff[first] += headcount
+                    diff[last] -= headcount
+            occupancy.slots = list(accumulate(diff[:-1]))
+        return occupancy
+
+    @classmethod
+    def from_reservations(cls, reservations, resolution: int = 1,
+                          use_numpy: bool | None = None) -> 'Occupancy':
+        return cls.from_intervals(
+            ((r.test_start_time, r.test_end_time, r.headcount) for r in reservations),
+            resolution,
+            use_numpy
+        )
+
+    def copy(self) -> 'Occupancy':
+        occupancy = Occupancy(self.resolution, self.use_numpy)
+        occupancy.slots = self.slots.copy()
+        return occupancy
+
+    def slot_range(self, start: time, end: time) -> tuple[int, int]:
+        return slot_range(start, end, self.resolution)
+
+    def fingerprint(self) -> str:
+        # 슬롯 값의 해시. numpy 와 리스트 구현에서 같은 값이 나온다.
+        data = self.slots.astype(np.int64).tobytes() if self.use_numpy else array('q', self.slots).tobytes()
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def add(self, start: time, end: time, headcount: int):
+        first, last = self.slot_range(start, end)
+        if self.use_numpy:
+            self.slots[first:last] += headcount
+        else:
+            for i in range(first, last):
+                self.slots[i] += headcount
+
+    def get_peak_headcount(self, start: time, end: time) -> int:
+        first, last = self.slot_range(start, end)
+        if first >= last:
+            return 0
+        if self.use_numpy:
+            return int(self.slots[first:last].max())
+        return max(self.slots[first:last])
+
+    def get_slot_peaks(self, slot_minutes: int) -> list[tuple[time, time, int]]:
+        if slot_minutes % self.resolution or MINUTES_PER_DAY % slot_minutes:
+            raise ValueError("slot_minutes는 resolution의 배수이면서 1440의 약수여야 합니다.")
+
+        step = slot_minutes // self.resolution
+        if self.use_numpy:
+            peaks = self.slots.reshape(-1, step).max(axis=1).tolist()
+        else:
+            peaks = [max(self.slots[i:i + step]) for i in range(0, self.size, step)]
+
+        return [
+            (to_time(i * slot_minutes), to_time((i + 1) * slot_minutes), peak)
+            for i, peak in enumerate(peaks)
+        ]
+
+    def get_available_headcount(self, slot_minutes: int, limit: int) -> list[tuple[time, time, int]]:
+        return [
+            (start, end, max(0, limit - peak))
+            for start, end, peak in self.get_slot_peaks(slot_minutes)
+        ]
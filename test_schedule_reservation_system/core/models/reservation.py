@@ -27,8 +27,31 @@ class Reservation(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # 확정 예약의 날짜/시간대 조회 (인원 검사, 장부 재구성)
+            models.Index(
+                fields=['test_reservation_date', 'test_start_time'],
+                include=['test_end_time', 'headcount'],
+                condition=models.Q(status=Status.CONFIRM),
+                name='reservation_confirmed_date_idx'
+            ),
+            # 내 예약 목록 조회 (user 별 날짜 역순), updated_at 은 목록 ETag 계산을 인덱스만으로 하기 위함
+            models.Index(
+                fields=['user', '-test_reservation_date'],
+                include=['updated_at'],
+                name='reservation_user_date_upd_idx'
+            ),
+            # 관리자 전체 목록의 keyset 페이지네이션
+            models.Index(
+                fields=['test_reservation_date', 'id'],
+                name='reservation_date_id_idx'
+            ),
+        ]
+
     def is_confirmed(self) -> bool:
         return self.status == Status.CONFIRM
 
     def is_writer(self, user: User):
-        return self.user == user
\ No newline at end of file
+        # self.user 를 읽으면 사용자 행을 조회하므로 id 만 비교한다.
+        return self.user_id == user.pk
\ No newline at end of file
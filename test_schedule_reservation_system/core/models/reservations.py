@@ -1,33 +1,68 @@
 from datetime import time
 
+from django.db.models import QuerySet, Sum
 from rest_framework.exceptions import ValidationError
 
+from .occupancy import Occupancy
 from .reservation import Reservation
 
 
 class Reservations:
     MAX_AVAILABLE_LIMIT = 50_000
 
-    def __init__(self, reservations: list[Reservation]):
+    # list를 받으면 메모리에서 계산하고, QuerySet을 받으면 필요한 컬럼만 읽는다. (합계는 DB에서 집계)
+    # 예약 처리의 인원 검사는 CapacityLedger 장부의 집계를 사용한다.
+    def __init__(self, reservations: list[Reservation] | QuerySet):
         self.reservations = reservations
 
+    def is_queryset(self) -> bool:
+        return isinstance(self.reservations, QuerySet)
+
     def get_total_headcount(self):
+        if self.is_queryset():
+            return self.reservations.aggregate(total=Sum('headcount'))['total'] or 0
         return sum(r.headcount for r in self.reservations)
 
-    def validate_exceed_limit(self, headcount: int):
-        if self.get_total_headcount() + headcount > self.MAX_AVAILABLE_LIMIT:
-            raise ValidationError("해당 시간대의 예약 인원이 50,000명을 초과합니다.")
-
-    def get_hourly_available_headcount(self) -> list:
-        available_headcount = []
-        for hour in range(0, 24):
-            start = time(hour, 0)
-            end = time(hour + 1, 0) if hour < 23 else time(23, 59)
-
-            reserved_headcount = sum(
-                r.headcount for r in self.reservations
+    def get_peak_headcount(self, start: time, end: time) -> int:
+        if self.is_queryset():
+            # 겹치는 예약의 시각과 인원만 읽는다.
+            intervals = self.reservations.filter(
+                test_start_time__lt=end,
+                test_end_time__gt=start
+            ).values_list('test_start_time', 'test_end_time', 'headcount')
+        else:
+            intervals = (
+                (r.test_start_time, r.test_end_time, r.headcount) for r in self.reservations
                 if r.test_start_time < end and r.test_end_time > start
             )
 
-            available_headcount.append((start, end, max(0, self.MAX_AVAILABLE_LIMIT - reserved_headcount)))
-        return available_headcount
+        # [start, end) 구간에서 동시에 진행 중인 예약 인원의 최댓값 (시작/종료 이벤트 정렬 후 스윕)
+        events = []
+        for test_start_time, test_end_time, headcount in intervals:
+            events.append((max(test_start_time, start), headcount))
+            events.append((test_end_time, -headcount))
+
+        # 같은 시각에는 종료(-)가 시작(+)보다 먼저 처리되어 연달아 붙은 예약은 겹치지 않는다.
+        events.sort()
+
+        peak = current = 0
+        for _, delta in events:
+            current += delta
+            peak = max(peak, current)
+        return peak
+
+    def validate_exceed_limit(self, headcount: int, start: time, end: time):
+        if self.get_peak_headcount(start, end) + headcount > self.MAX_AVAILABLE_LIMIT:
+            raise ValidationError("해당 시간대의 예약 인원이 50,000명을 초과합니다.")
+
+    def get_available_headcount(self, slot_minutes: int = 60) -> list:
+        if self.is_queryset():
+            occupancy = Occupancy.from_intervals(self.reservations.values_list(
+                'test_start_time', 'test_end_time', 'headcount'
+            ).iterator())
+        else:
+            occupancy = Occupancy.from_reservations(self.reservations)
+        return occupancy.get_available_headcount(slot_minutes, self.MAX_AVAILABLE_LIMIT)
+
+    def get_hourly_available_headcount(self) -> list:
+        return self.get_available_headcount(60)
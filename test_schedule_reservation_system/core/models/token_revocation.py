@@ -0,0 +1,19 @@
+from django.db import models
+
+
+class TokenRevocation(models.Model):
+    """
+    사용자별 토큰 폐기 시각. 이 시각 이전에 발급된 액세스·리프레시 토큰은 거부한다.
+    모든 서버 프로세스가 같은 값을 보도록 DB 에 두며, 삭제된 사용자의 기록도 남도록 외래 키 대신 user_id 를 저장한다.
+    """
+    user_id = models.IntegerField(primary_key=True)
+    revoked_at = models.DateTimeField(null=False)
+
+
+class UsedRefreshToken(models.Model):
+    """
+    회전(ROTATE_REFRESH_TOKENS)으로 이미 사용된 리프레시 토큰의 jti. 기본 키 충돌로 재사용을 원자적으로 거부한다.
+    만료된 기록은 flush_used_refresh_tokens 명령으로 지운다.
+    """
+    jti = models.CharField(max_length=255, primary_key=True)
+    expires_at = models.DateTimeField(null=False, db_index=True)
@@ -0,0 +1,114 @@
+import base64
+import json
+from functools import reduce
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    정렬 키(ordering) 값 자체를 커서로 사용하는 페이지네이션.
+    OFFSET 과 COUNT(*) 없이 마지막으로 본 행 이후부터 인덱스를 따라 읽으므로 몇 번째 페이지든 비용이 같다.
+    정렬 키의 마지막 필드는 유일해야 한다.
+    """
+    ordering = ('test_reservation_date', 'id')
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 100
+    max_page_size = 1000
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> list:
+        queryset, page_size = self.get_page_queryset(queryset, request)
+        return self.get_page(list(queryset), page_size)
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> list:
+        queryset, page_size = self.get_page_queryset(queryset, request)
+        return self.get_page([row async for row in queryset], page_size)
+
+    def get_page_queryset(self, queryset: QuerySet, request: Request) -> tuple[QuerySet, int]:
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request, queryset.model)
+        if position is not None:
+            queryset = self.filter_after(queryset, position)
+
+        # 한 건을 더 읽어 다음 페이지가 있는지 판단한다.
+        return queryset[:page_size + 1], page_size
+
+    def get_page(self, rows: list, page_size: int) -> list:
+        has_next = len(rows) > page_size
+        page = rows[:page_size]
+        self.next_position = self.get_position(page[-1]) if has_next else None
+        return page
+
+    def get_page_size(self, request: Request) -> int:
+        value = request.query_params.get(self.page_size_query_param)
+        if value is None:
+            return self.page_size
+
+        # str.isdigit() 은 '²', '١٠' 같은 유니코드 숫자도 참이므로 ASCII 숫자만 받는다.
+        try:
+            page_size = int(value) if value.isascii() else 0
+        except ValueError:
+            page_size = 0
+        if page_size < 1:
+            raise ValidationError("page_size 는 1 이상의 정수여야 합니다.")
+
+        return min(page_size, self.max_page_size)
+
+    def filter_after(self, queryset: QuerySet, position: list) -> QuerySet:
+        # (a, b) > (x, y)  =>  a > x OR (a = x AND b > y)
+        conditions = [
+            Q(**{f'{field}__gt': value}, **dict(zip(self.ordering[:index], position[:index])))
+            for index, (field, value) in enumerate(zip(self.ordering, position))
+        ]
+        # 첫 번째 키의 하한을 함께 주어 인덱스 범위 스캔이 커서 위치에서 시작하게 한다.
+        return queryset.filter(
+            Q(**{f'{self.ordering[0]}__gte': position[0]}),
+            reduce(lambda left, right: left | right, conditions)
+        )
+
+    def get_position(self, instance) -> list:
+        return [getattr(instance, field) for field in self.ordering]
+
+    def encode_cursor(self, position: list) -> str:
+        payload = json.dumps([str(value) for value in position], separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, request: Request, model) -> list | None:
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None
+
+        try:
+            payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            values = json.loads(payload)
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                model._meta.get_field(field).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except (ValueError, TypeError, DjangoValidationError):
+            raise ValidationError("잘못된 커서입니다.")
+
+    def get_next_link(self) -> str | None:
+        if self.next_position is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def get_paginated_response(self, data) -> Response:
+        return Response({
+            'next': self.get_next_link(),
+            'results': data
+        })
@@ -0,0 +1,32 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 DRF 기본 JSONRenderer 로 동작한다.
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    orjson 이 설치되어 있으면 orjson 으로, 아니면 DRF JSONRenderer 로 렌더링한다.
+    출력은 JSONRenderer 의 compact 형식과 같다. (UTC 는 Z, Decimal 은 float, U+2028/2029 이스케이프)
+    """
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # 들여쓰기 요청(브라우저블 API 등)은 orjson 이 지원하는 형식과 달라 기본 렌더러에 맡긴다.
+        if orjson is None or data is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder.default,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            # 64비트를 넘는 정수 등 orjson 이 다루지 못하는 값
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -0,0 +1,112 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import metrics
+from .auth.authentication import revoke_tokens
+from .models.capacity_ledger import CapacityLedger
+from .models.reservation import Reservation, Status
+
+FOOTPRINT_FIELDS = ('test_reservation_date', 'test_start_time', 'test_end_time', 'headcount')
+
+
+def get_confirmed_footprint(reservation: Reservation):
+    if not reservation.is_confirmed():
+        return None
+    return tuple(getattr(reservation, field) for field in FOOTPRINT_FIELDS)
+
+
+@receiver(pre_save, sender=Reservation)
+def remember_confirmed_footprint(sender, instance: Reservation, raw=False, using=None, **kwargs):
+    instance._confirmed_footprint = None
+    if raw or instance.pk is None:
+        return
+
+    instance._confirmed_footprint = Reservation.objects.using(using).filter(
+        pk=instance.pk,
+        status=Status.CONFIRM
+    ).values_list(*FOOTPRINT_FIELDS).first()
+
+
+@receiver(post_save, sender=Reservation)
+def update_ledger_on_save(sender, instance: Reservation, raw=False, using=None, **kwargs):
+    if raw:
+        return
+
+    previous = getattr(instance, '_confirmed_footprint', None)
+    current = get_confirmed_footprint(instance)
+    if previous == current:
+        return
+
+    ledger = CapacityLedger.objects.db_manager(using)
+    with transaction.atomic(using=using):
+        if previous is not None:
+            ledger.remove(*previous)
+        if current is not None:
+            ledger.add(*current)
+
+
+@receiver(post_delete, sender=Reservation)
+def update_ledger_on_delete(sender, instance: Reservation, using=None, **kwargs):
+    footprint = get_confirmed_footprint(instance)
+    if footprint is not None:
+        CapacityLedger.objects.db_manager(using).remove(*footprint)
+
+
+# 토큰 클레임이나 인증 가능 여부에 영향을 주는 필드. 바뀌면 발급된 토큰을 폐기한다.
+TOKEN_USER_FIELDS = ('username', 'is_staff', 'is_active', 'password')
+
+# 사용자를 한꺼번에 삭제할 때 건마다 폐기하지 않고 호출한 쪽에서 revoke_tokens 로 한 번에 폐기한다.
+token_revocation_deferred: ContextVar[bool] = ContextVar('token_revocation_deferred', default=False)
+
+
+@contextmanager
+def defer_token_revocation():
+    """블록 안에서 삭제한 사용자의 토큰을 폐기하지 않는다. 블록이 끝난 뒤 revoke_tokens 를 직접 호출해야 한다."""
+    token = token_revocation_deferred.set(True)
+    try:
+        yield
+    finally:
+        token_revocation_deferred.reset(token)
+
+
+@receiver(pre_save, sender=User)
+def remember_token_user_fields(sender, instance: User, raw=False, using=None, update_fields=None, **kwargs):
+    instance._token_user_fields = None
+    if raw or instance.pk is None:
+        return
+
+    # last_login 갱신처럼 관련 없는 필드만 저장할 때는 조회하지 않는다.
+    if update_fields is not None and not set(update_fields) & set(TOKEN_USER_FIELDS):
+        return
+
+    instance._token_user_fields = User.objects.using(using).filter(pk=instance.pk).values_list(
+        *TOKEN_USER_FIELDS
+    ).first()
+
+
+@receiver(post_save, sender=User)
+def revoke_tokens_on_user_change(sender, instance: User, raw=False, **kwargs):
+    previous = getattr(instance, '_token_user_fields', None)
+    if raw or previous is None:
+        return
+
+    if previous != tuple(getattr(instance, field) for field in TOKEN_USER_FIELDS):
+        revoke_tokens(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def revoke_tokens_on_user_delete(sender, instance: User, **kwargs):
+    if not token_revocation_deferred.get():
+        revoke_tokens(instance.pk)
+
+
+@receiver(connection_created)
+def install_metrics_wrapper(sender, connection, **kwargs):
+    # 연결은 스레드별로 만들어지므로 새 연결마다 요청 지표용 wrapper 를 건다.
+    metrics.install_execute_wrapper(connection)
@@ -1,7 +1,27 @@
+from datetime import date, timedelta
+from io import StringIO
+from unittest import mock
+
+import jwt
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.contrib.auth.models import User
-from ..auth.token_utils import extract_user_id_from_token
+from ..auth.authentication import revoke_tokens
+from ..auth.token_utils import extract_user_id_from_token, generate_tokens_for_user
+from ..checks import check_revocation_cache
+from ..models.claims_user import ClaimsUser
+from ..models.reservation import Reservation
+from ..models.token_revocation import TokenRevocation, UsedRefreshToken
 
 
 class TestSignup(APITestCase):
@@ -73,3 +93,254 @@ class TestLogin(APITestCase):
         response = self.client.post(self.url, req, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestClaimsJWTAuthentication(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='user1', password='pass')
+        self.staff = User.objects.create_user(username='admin1', password='pass', is_staff=True)
+        self.my_url = '/api/reservations/my/'
+
+    def authenticate(self, user: User) -> str:
+        access_token = generate_tokens_for_user(user)['access_token']
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + access_token)
+        return access_token
+
+    def count_queries(self, url: str) -> int:
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return len(queries)
+
+    def test_tokens_contain_user_claims(self):
+        access_token = self.authenticate(self.staff)
+
+        payload = jwt.decode(access_token, settings.SECRET_KEY, algorithms=['HS256'])
+
+        self.assertEqual(payload['user_id'], self.staff.id)
+        self.assertEqual(payload['username'], 'admin1')
+        self.assertTrue(payload['is_staff'])
+
+    def test_stateless_mode_skips_user_lookup(self):
+        self.authenticate(self.user)
+
+        with override_settings(JWT_STATELESS_AUTH=False):
+            stateful = self.count_queries(self.my_url)
+        with override_settings(JWT_STATELESS_AUTH=True):
+            # 첫 요청에서 폐기 기록을 캐시에 둔다.
+            self.count_queries(self.my_url)
+            stateless = self.count_queries(self.my_url)
+
+        self.assertEqual(stateless, stateful - 1)
+
+    @override_settings(JWT_STATELESS_AUTH=True)
+    def test_stateless_user_can_create_and_delete_own_reservation(self):
+        self.authenticate(self.user)
+        data = {
+            'test_reservation_date': (date.today() + timedelta(days=4)).isoformat(),
+            'test_start_time': '10:00',
+            'test_end_time': '11:00',
+            'headcount': 10
+        }
+
+        res = self.client.post('/api/reservations/create/', data, format='json')
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data['reservation']['user'], 'user1')
+
+        reservation = Reservation.objects.get()
+        self.assertEqual(reservation.user_id, self.user.id)
+
+        res = self.client.delete(f'/api/reservations/{reservation.id}/delete/')
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+
+    @override_settings(JWT_STATELESS_AUTH=True)
+    def test_stateless_roles_come_from_claims(self):
+        self.authenticate(self.staff)
+
+        self.assertEqual(self.client.get(self.my_url).status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self.client.get('/api/admin-reservation/').status_code, status.HTTP_200_OK)
+
+    @override_settings(JWT_STATELESS_AUTH=True)
+    def test_token_without_claims_falls_back_to_database(self):
+        access_token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + access_token)
+
+        self.assertEqual(self.client.get(self.my_url).status_code, status.HTTP_200_OK)
+
+    def test_revoked_token_is_rejected(self):
+        for stateless in (False, True):
+            with self.subTest(stateless=stateless), override_settings(JWT_STATELESS_AUTH=stateless):
+                cache.clear()
+                self.authenticate(self.user)
+                revoke_tokens(self.user.id)
+
+                res = self.client.get(self.my_url)
+
+                self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_token_issued_after_revocation_is_accepted(self):
+        revoke_tokens(self.user.id)
+        self.authenticate(self.user)
+
+        for stateless in (False, True):
+            with self.subTest(stateless=stateless), override_settings(JWT_STATELESS_AUTH=stateless):
+                self.assertEqual(self.client.get(self.my_url).status_code, status.HTTP_200_OK)
+
+    def test_revocation_from_other_process_is_read_from_database(self):
+        # 다른 프로세스(revoke_tokens 명령 등)의 폐기는 이 프로세스의 캐시에 없다.
+        self.authenticate(self.user)
+        TokenRevocation.objects.create(user_id=self.user.id, revoked_at=timezone.now())
+
+        self.assertEqual(self.client.get(self.my_url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_login_with_outdated_password_hash_issues_valid_tokens(self):
+        # 로그인 중 이전 설정의 해시를 다시 저장하면서 토큰이 폐기되어도 그 뒤에 발급한 토큰은 유효하다.
+        hasher = PBKDF2PasswordHasher()
+        User.objects.filter(pk=self.user.pk).update(
+            password=hasher.encode('pass', hasher.salt(), iterations=100_000)
+        )
+
+        res = self.client.post('/api/auth/login/', {'username': 'user1', 'password': 'pass'}, format='json')
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(TokenRevocation.objects.filter(user_id=self.user.id).exists())
+
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + res.data['access_token'])
+        self.assertEqual(self.client.get(self.my_url).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.post('/api/auth/refresh/').status_code, status.HTTP_200_OK)
+
+    @override_settings(JWT_STATELESS_AUTH=True)
+    def test_role_change_revokes_tokens(self):
+        self.authenticate(self.user)
+
+        self.user.is_staff = True
+        self.user.save()
+
+        self.assertEqual(self.client.get(self.my_url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_unrelated_user_update_keeps_tokens(self):
+        self.authenticate(self.user)
+
+        self.user.first_name = 'first'
+        self.user.save()
+
+        self.assertEqual(self.client.get(self.my_url).status_code, status.HTTP_200_OK)
+
+    def test_revoke_tokens_command(self):
+        self.authenticate(self.user)
+
+        call_command('revoke_tokens', 'user1', stdout=StringIO())
+
+        self.assertEqual(self.client.get(self.my_url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_stateless_auth_requires_shared_revocation_cache(self):
+        self.assertEqual(check_revocation_cache(None), [])
+
+        with override_settings(JWT_STATELESS_AUTH=True):
+            self.assertEqual([error.id for error in check_revocation_cache(None)], ['core.E001'])
+
+        shared = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://'}}
+        with override_settings(JWT_STATELESS_AUTH=True, CACHES=shared):
+            self.assertEqual(check_revocation_cache(None), [])
+
+    def test_claims_user_cannot_be_saved(self):
+        user = ClaimsUser.from_claims(self.user.id, 'user1', False)
+
+        with self.assertRaises(NotImplementedError):
+            user.save()
+        self.assertEqual(user, self.user)
+
+
+class TestRefresh(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = '/api/auth/refresh/'
+        self.user = User.objects.create_user(username='user1', password='pass')
+        res = self.client.post('/api/auth/login/', {'username': 'user1', 'password': 'pass'}, format='json')
+        self.refresh_token = res.cookies['refresh_token'].value
+
+    def test_refresh_issues_access_token_from_claims(self):
+        res = self.client.post(self.url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['message'], '토큰 재발급 성공')
+        payload = jwt.decode(res.data['access_token'], settings.SECRET_KEY, algorithms=['HS256'])
+        self.assertEqual(payload['user_id'], self.user.id)
+        self.assertEqual(payload['username'], 'user1')
+        self.assertFalse(payload['is_staff'])
+
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + res.data['access_token'])
+        self.assertEqual(self.client.get('/api/reservations/my/').status_code, status.HTTP_200_OK)
+
+    def test_refresh_rotates_cookie_and_rejects_reuse(self):
+        res = self.client.post(self.url)
+        rotated = res.cookies['refresh_token'].value
+        self.assertNotEqual(rotated, self.refresh_token)
+
+        self.assertEqual(self.client.post(self.url).status_code, status.HTTP_200_OK)
+
+        self.client.cookies['refresh_token'] = self.refresh_token
+        res = self.client.post(self.url)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_reuse_is_rejected_without_shared_cache(self):
+        # 다른 워커가 회전한 토큰: 이 프로세스의 캐시에는 기록이 없다.
+        self.assertEqual(self.client.post(self.url).status_code, status.HTTP_200_OK)
+        cache.clear()
+
+        self.client.cookies['refresh_token'] = self.refresh_token
+        res = self.client.post(self.url)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn('이미 사용된', res.data['detail'])
+
+    def test_inactive_user_cannot_refresh(self):
+        # 시그널 없이 바뀐 경우에도 재발급 시 사용자 행을 확인한다.
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        self.assertEqual(self.client.post(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deleted_user_cannot_refresh(self):
+        self.user.delete()
+
+        self.assertEqual(self.client.post(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_flush_used_refresh_tokens_command(self):
+        self.client.post(self.url)
+        UsedRefreshToken.objects.create(jti='expired', expires_at=timezone.now() - timedelta(seconds=1))
+
+        call_command('flush_used_refresh_tokens', stdout=StringIO())
+
+        self.assertEqual(list(UsedRefreshToken.objects.values_list('jti', flat=True)),
+                         [RefreshToken(self.refresh_token)['jti']])
+
+    # simplejwt 의 api_settings 는 override_settings 로 다시 읽히지 않아 속성을 직접 바꾼다.
+    @mock.patch.object(api_settings, 'ROTATE_REFRESH_TOKENS', False)
+    def test_refresh_without_rotation_keeps_cookie(self):
+        res = self.client.post(self.url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotIn('refresh_token', res.cookies)
+        self.assertEqual(self.client.post(self.url).status_code, status.HTTP_200_OK)
+
+    def test_refresh_ignores_expired_access_token_header(self):
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer invalid')
+
+        self.assertEqual(self.client.post(self.url).status_code, status.HTTP_200_OK)
+
+    def test_missing_or_invalid_cookie_is_rejected(self):
+        del self.client.cookies['refresh_token']
+        self.assertEqual(self.client.post(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.cookies['refresh_token'] = 'invalid'
+        self.assertEqual(self.client.post(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_revoked_refresh_token_is_rejected(self):
+        revoke_tokens(self.user.id)
+
+        self.assertEqual(self.client.post(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_access_token_cannot_be_used_as_refresh_token(self):
+        self.client.cookies['refresh_token'] = generate_tokens_for_user(self.user)['access_token']
+
+        self.assertEqual(self.client.post(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,100 @@
+from datetime import date, time, timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from .. import availability_cache
+from ..models.capacity_ledger import CapacityLedger
+from ..models.reservation import Reservation, Status
+
+
+class TestAvailabilityCache(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='user', password='pass')
+        self.test_date = date.today() + timedelta(days=5)
+        self.loaded = []
+
+    def load(self, dates):
+        self.loaded.append(dates)
+        return CapacityLedger.objects.get_occupancies(dates)
+
+    def get_peak(self):
+        occupancy = availability_cache.get_occupancy(self.test_date, self.load)
+        return occupancy.get_peak_headcount(time(0, 0), time(23, 59))
+
+    def create_reservation(self, status=Status.CONFIRM, test_date=None) -> Reservation:
+        return Reservation.objects.create(
+            user=self.user,
+            test_reservation_date=test_date or self.test_date,
+            test_start_time=time(10, 0),
+            test_end_time=time(11, 0),
+            headcount=100,
+            status=status
+        )
+
+    def test_second_lookup_is_served_from_cache(self):
+        before = availability_cache.get_stats()
+
+        self.get_peak()
+        with self.assertNumQueries(0):
+            self.get_peak()
+
+        after = availability_cache.get_stats()
+        self.assertEqual(len(self.loaded), 1)
+        self.assertEqual(after['hits'] - before['hits'], 1)
+        self.assertEqual(after['misses'] - before['misses'], 1)
+
+    def test_confirming_reservation_invalidates_date(self):
+        reservation = self.create_reservation(status=Status.AWAIT)
+        self.assertEqual(self.get_peak(), 0)
+
+        reservation.status = Status.CONFIRM
+        reservation.save()
+
+        self.assertEqual(self.get_peak(), 100)
+
+    def test_updating_and_deleting_reservation_invalidates_date(self):
+        reservation = self.create_reservation()
+        self.assertEqual(self.get_peak(), 100)
+
+        reservation.headcount = 300
+        reservation.save()
+        self.assertEqual(self.get_peak(), 300)
+
+        reservation.delete()
+        self.assertEqual(self.get_peak(), 0)
+
+    def test_awaiting_reservation_does_not_invalidate_date(self):
+        self.get_peak()
+
+        self.create_reservation(status=Status.AWAIT)
+        self.get_peak()
+
+        self.assertEqual(len(self.loaded), 1)
+
+    def test_other_dates_stay_cached(self):
+        self.get_peak()
+
+        self.create_reservation(test_date=self.test_date + timedelta(days=1))
+        self.get_peak()
+
+        self.assertEqual(len(self.loaded), 1)
+
+    def test_rebuild_invalidates_dates(self):
+        self.create_reservation()
+        self.assertEqual(self.get_peak(), 100)
+
+        CapacityLedger.objects.all().delete()
+        CapacityLedger.objects.rebuild()
+
+        self.assertEqual(self.get_peak(), 100)
+        self.assertEqual(len(self.loaded), 2)
+
+    @override_settings(AVAILABILITY_CACHE_TIMEOUT=0)
+    def test_timeout(self):
+        self.get_peak()
+        self.get_peak()
+
+        self.assertEqual(len(self.loaded), 2)
@@ -0,0 +1,112 @@
+from datetime import date, time, timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from ..models.capacity_ledger import CapacityLedger
+from ..models.occupancy import to_minute
+from ..models.reservation import Reservation, Status
+
+
+def minute_buckets(start: time, end: time, headcount: int) -> dict[int, int]:
+    return {minute: headcount for minute in range(to_minute(start), to_minute(end))}
+
+
+class TestCapacityLedger(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='user', password='pass')
+        self.test_date = date.today() + timedelta(days=5)
+
+    def create_reservation(self, start: time, end: time, headcount: int, status=Status.CONFIRM) -> Reservation:
+        return Reservation.objects.create(
+            user=self.user,
+            test_reservation_date=self.test_date,
+            test_start_time=start,
+            test_end_time=end,
+            headcount=headcount,
+            status=status
+        )
+
+    def get_buckets(self, test_date=None) -> dict[int, int]:
+        return CapacityLedger.objects.get_stored([test_date or self.test_date]).get(test_date or self.test_date, {})
+
+    def test_confirmed_reservation_is_recorded_per_bucket(self):
+        self.create_reservation(time(10, 0), time(10, 30), 100)
+
+        self.assertEqual(self.get_buckets(), minute_buckets(time(10, 0), time(10, 30), 100))
+
+    def test_awaiting_reservation_is_not_recorded(self):
+        self.create_reservation(time(10, 0), time(11, 0), 100, status=Status.AWAIT)
+
+        self.assertEqual(self.get_buckets(), {})
+
+    def test_confirming_reservation_adds_to_ledger(self):
+        reservation = self.create_reservation(time(10, 0), time(10, 15), 100, status=Status.AWAIT)
+
+        reservation.status = Status.CONFIRM
+        reservation.save()
+
+        self.assertEqual(self.get_buckets(), minute_buckets(time(10, 0), time(10, 15), 100))
+
+    def test_updating_confirmed_reservation_moves_headcount(self):
+        reservation = self.create_reservation(time(10, 0), time(10, 15), 100)
+        new_date = self.test_date + timedelta(days=1)
+
+        reservation.test_reservation_date = new_date
+        reservation.test_start_time = time(12, 0)
+        reservation.test_end_time = time(12, 15)
+        reservation.headcount = 300
+        reservation.save()
+
+        self.assertEqual(self.get_buckets(), {})
+        self.assertEqual(self.get_buckets(new_date), minute_buckets(time(12, 0), time(12, 15), 300))
+
+    def test_deleting_confirmed_reservation_removes_headcount(self):
+        reservation = self.create_reservation(time(10, 0), time(10, 15), 100)
+        self.create_reservation(time(10, 0), time(10, 15), 50)
+
+        reservation.delete()
+
+        self.assertEqual(self.get_buckets(), minute_buckets(time(10, 0), time(10, 15), 50))
+
+    def test_deleting_user_removes_headcount(self):
+        self.create_reservation(time(10, 0), time(10, 15), 100)
+
+        self.user.delete()
+
+        self.assertEqual(self.get_buckets(), {})
+
+    def test_peak_headcount_excludes_given_reservation(self):
+        reservation = self.create_reservation(time(10, 0), time(11, 0), 100)
+        self.create_reservation(time(10, 30), time(11, 30), 50)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(CapacityLedger.objects.get_peak_headcount(self.test_date, time(10, 0), time(12, 0)), 150)
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                CapacityLedger.objects.get_peak_headcount(self.test_date, time(10, 0), time(12, 0), exclude=reservation),
+                50
+            )
+
+    def test_back_to_back_reservations_off_quarter_hours_do_not_overlap(self):
+        # 분 단위로 기록하므로 15분 경계에 맞지 않는 예약도 실제로 겹치는 시간만 더한다.
+        self.create_reservation(time(9, 0), time(9, 5), 50000)
+
+        self.assertEqual(CapacityLedger.objects.get_peak_headcount(self.test_date, time(9, 5), time(10, 0)), 0)
+        CapacityLedger.objects.validate_exceed_limit(self.test_date, time(9, 5), time(10, 0), 50000)
+        self.assertEqual(CapacityLedger.objects.get_peak_headcount(self.test_date, time(9, 4), time(10, 0)), 50000)
+
+    def test_verify_and_rebuild_command(self):
+        self.create_reservation(time(10, 0), time(11, 0), 100)
+        call_command('capacity_ledger', 'verify', stdout=StringIO())
+
+        CapacityLedger.objects.filter(bucket=600).update(headcount=1)
+        with self.assertRaises(CommandError):
+            call_command('capacity_ledger', 'verify', stdout=StringIO(), stderr=StringIO())
+
+        call_command('capacity_ledger', 'rebuild', '--date', self.test_date.isoformat(), stdout=StringIO())
+        call_command('capacity_ledger', 'verify', stdout=StringIO())
+        self.assertEqual(self.get_buckets(), minute_buckets(time(10, 0), time(11, 0), 100))
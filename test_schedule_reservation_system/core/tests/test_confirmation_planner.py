@@ -0,0 +1,95 @@
+import random
+from datetime import date, time
+
+from django.test import SimpleTestCase
+
+from ..models.confirmation_planner import admit_greedy, plan_date
+from ..models.occupancy import Occupancy
+from ..models.reservation import Reservation
+
+LIMIT = 50000
+
+
+def reservation(pk: int, start: time, end: time, headcount: int) -> Reservation:
+    return Reservation(
+        id=pk,
+        test_reservation_date=date(2025, 4, 20),
+        test_start_time=start,
+        test_end_time=end,
+        headcount=headcount
+    )
+
+
+class TestConfirmationPlanner(SimpleTestCase):
+    def setUp(self):
+        self.empty = Occupancy(15)
+
+    def seated(self, admitted: list[Reservation]) -> int:
+        return sum(r.headcount for r in admitted)
+
+    def assert_within_limit(self, admitted: list[Reservation], occupancy: Occupancy):
+        occupancy = occupancy.copy()
+        for r in admitted:
+            occupancy.add(r.test_start_time, r.test_end_time, r.headcount)
+        self.assertLessEqual(occupancy.get_peak_headcount(time(0, 0), time(23, 59)), LIMIT)
+
+    def test_prefers_larger_reservation_over_first_come(self):
+        pending = [
+            reservation(1, time(10, 0), time(11, 0), 20000),
+            reservation(2, time(10, 0), time(12, 0), 50000),
+        ]
+
+        strategy, admitted = plan_date(pending, self.empty, LIMIT)
+
+        self.assertEqual(strategy, 'largest_first')
+        self.assertEqual([r.id for r in admitted], [2])
+
+    def test_prefers_short_reservations_that_fit_together(self):
+        pending = [
+            reservation(1, time(9, 0), time(12, 0), 30000),
+            reservation(2, time(9, 0), time(10, 0), 25000),
+            reservation(3, time(11, 0), time(12, 0), 25000),
+            reservation(4, time(10, 0), time(11, 0), 25000),
+        ]
+
+        strategy, admitted = plan_date(pending, self.empty, LIMIT)
+
+        self.assertEqual([r.id for r in admitted], [2, 3, 4])
+        self.assertEqual(strategy, 'shortest_first')
+
+    def test_tie_keeps_first_come(self):
+        pending = [
+            reservation(1, time(10, 0), time(11, 0), 25000),
+            reservation(2, time(10, 0), time(11, 0), 25000),
+        ]
+
+        strategy, admitted = plan_date(pending, self.empty, LIMIT)
+
+        self.assertEqual(strategy, 'first_come')
+        self.assertEqual([r.id for r in admitted], [1, 2])
+
+    def test_existing_occupancy_is_respected(self):
+        occupancy = Occupancy(15)
+        occupancy.add(time(10, 0), time(11, 0), 45000)
+        pending = [reservation(1, time(10, 45), time(11, 30), 6000), reservation(2, time(11, 0), time(12, 0), 6000)]
+
+        _, admitted = plan_date(pending, occupancy, LIMIT)
+
+        self.assertEqual([r.id for r in admitted], [2])
+
+    def test_plan_is_never_worse_than_first_come_and_stays_within_limit(self):
+        rng = random.Random(7)
+        for use_numpy in (True, False):
+            occupancy = Occupancy(15, use_numpy=use_numpy)
+            pending = []
+            for pk in range(1, 500):
+                start = rng.randrange(0, 20 * 60, 15)
+                end = start + rng.choice((30, 60, 120, 180))
+                pending.append(reservation(
+                    pk, time(start // 60, start % 60), time(end // 60, end % 60), rng.randrange(100, 8000)
+                ))
+
+            _, admitted = plan_date(pending, occupancy, LIMIT)
+
+            self.assertGreaterEqual(self.seated(admitted), self.seated(admit_greedy(pending, occupancy, LIMIT)))
+            self.assert_within_limit(admitted, occupancy)
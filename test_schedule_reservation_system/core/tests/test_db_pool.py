@@ -0,0 +1,66 @@
+from unittest import mock, skipUnless
+
+from django.db import connection, connections
+from django.test import SimpleTestCase, TransactionTestCase
+
+from .. import db_pool
+
+
+class TestDbPoolMode(SimpleTestCase):
+    def test_mode_from_settings(self):
+        self.assertEqual(db_pool.get_mode({'CONN_MAX_AGE': 0}), 'none')
+        self.assertEqual(db_pool.get_mode({'CONN_MAX_AGE': 60}), 'persistent')
+        self.assertEqual(db_pool.get_mode({'CONN_MAX_AGE': None}), 'persistent')
+        self.assertEqual(db_pool.get_mode({'CONN_MAX_AGE': 0, 'OPTIONS': {'pool': {'max_size': 4}}}), 'pool')
+
+
+@skipUnless(connection.vendor == 'postgresql', "연결 통계는 PostgreSQL 백엔드(core.db_backend)에서만 기록됩니다.")
+class TestDbPoolStats(TransactionTestCase):
+    def setUp(self):
+        connection.close()
+        db_pool.reset_stats()
+
+    def test_records_acquire_and_release(self):
+        connection.ensure_connection()
+
+        stats = db_pool.get_stats()['default']
+        # 테스트 설정은 DB_CONN_MAX_AGE 기본값(0)이라 요청마다 연결한다.
+        self.assertEqual(stats['mode'], 'none')
+        self.assertEqual(stats['in_use'], 1)
+        self.assertEqual(stats['acquired'], 1)
+        self.assertGreater(stats['acquire_avg_ms'], 0)
+        self.assertGreaterEqual(stats['acquire_max_ms'], stats['acquire_avg_ms'])
+
+        connection.close()
+        connection.ensure_connection()
+
+        stats = db_pool.get_stats()['default']
+        self.assertEqual(stats['in_use'], 1)
+        self.assertEqual(stats['acquired'], 2)
+
+        connection.close()
+        self.assertEqual(db_pool.get_stats()['default']['in_use'], 0)
+
+    def test_mode_follows_connection_settings(self):
+        with mock.patch.dict(connection.settings_dict, {'CONN_MAX_AGE': 60}):
+            self.assertEqual(db_pool.get_stats()['default']['mode'], 'persistent')
+
+        pool = mock.Mock()
+        pool.get_stats.return_value = {}
+        options = {**connection.settings_dict['OPTIONS'], 'pool': {'max_size': 4}}
+        with mock.patch.dict(connection.settings_dict, {'OPTIONS': options, 'CONN_MAX_AGE': 0}), \
+                mock.patch.object(type(connections['default']), 'pool', pool):
+            self.assertEqual(db_pool.get_stats()['default']['mode'], 'pool')
+
+    def test_pool_stats_are_included(self):
+        pool = mock.Mock()
+        pool.get_stats.return_value = {'pool_size': 4, 'pool_available': 1, 'requests_waiting': 3}
+        options = {**connection.settings_dict['OPTIONS'], 'pool': {'max_size': 4}}
+
+        with mock.patch.dict(connection.settings_dict, {'OPTIONS': options, 'CONN_MAX_AGE': 0}), \
+                mock.patch.object(type(connections['default']), 'pool', pool):
+            stats = db_pool.get_stats()['default']
+
+        self.assertEqual(stats['mode'], 'pool')
+        self.assertEqual(stats['waiting'], 3)
+        self.assertEqual(stats['pool'], pool.get_stats.return_value)
@@ -0,0 +1,147 @@
+from datetime import time, timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.test import TransactionTestCase, override_settings
+from django.utils.timezone import now
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ..auth.token_utils import generate_tokens_for_user
+from ..checks import check_replica_pin_cache
+from ..db_router import pinned_key
+from ..models.reservation import Reservation, Status
+
+
+@override_settings(DATABASE_REPLICAS=['replica'], REPLICA_READ_YOUR_WRITES_SECONDS=5)
+class TestReplicaRouter(TransactionTestCase):
+    # 복제 대신 두 DB 에 서로 다른 값을 넣어 어느 DB 에서 읽었는지 구분한다.
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        cache.clear()
+        self.target_date = now().date() + timedelta(days=5)
+        self.user = self.create_user('user1')
+        self.other = self.create_user('user2')
+        self.client = self.client_for(self.user)
+
+    def create_user(self, username: str) -> User:
+        user = User.objects.create_user(username=username, password='pass')
+        User.objects.using('replica').create(id=user.id, username=username, password=user.password)
+        return user
+
+    def client_for(self, user: User) -> APIClient:
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION='Bearer ' + generate_tokens_for_user(user)['access_token'])
+        return client
+
+    def create_reservation(self, using: str, user: User, headcount: int, status=Status.AWAIT) -> Reservation:
+        return Reservation.objects.db_manager(using).create(
+            user_id=user.id,
+            test_reservation_date=self.target_date,
+            test_start_time=time(10, 0),
+            test_end_time=time(11, 0),
+            headcount=headcount,
+            status=status
+        )
+
+    def create_payload(self, headcount: int) -> dict:
+        return {
+            'test_reservation_date': self.target_date.isoformat(),
+            'test_start_time': '10:00',
+            'test_end_time': '11:00',
+            'headcount': headcount
+        }
+
+    def test_reads_go_to_replica(self):
+        self.create_reservation('default', self.user, 1)
+        self.create_reservation('replica', self.user, 99)
+
+        res = self.client.get('/api/reservations/my/')
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['headcount'] for item in res.data], [99])
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_reads_use_default_without_replicas(self):
+        self.create_reservation('default', self.user, 1)
+        self.create_reservation('replica', self.user, 99)
+
+        res = self.client.get('/api/reservations/my/')
+
+        self.assertEqual([item['headcount'] for item in res.data], [1])
+
+    def test_reads_after_write_use_primary_for_writer(self):
+        res = self.client.post('/api/reservations/create/', self.create_payload(10), format='json')
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+        res = self.client.get('/api/reservations/my/')
+        self.assertEqual([item['headcount'] for item in res.data], [10])
+
+        # 다른 사용자의 읽기는 계속 복제본으로 간다.
+        self.create_reservation('default', self.other, 1)
+        res = self.client_for(self.other).get('/api/reservations/my/')
+        self.assertEqual(res.data, [])
+
+    @override_settings(
+        CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'default'},
+            'pins': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'pins'},
+        },
+        REPLICA_PIN_CACHE_ALIAS='pins'
+    )
+    def test_read_your_writes_pin_uses_configured_cache(self):
+        caches['pins'].clear()
+
+        res = self.client.post('/api/reservations/create/', self.create_payload(10), format='json')
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+        self.assertTrue(caches['pins'].get(pinned_key(self.user.id)))
+        self.assertIsNone(caches['default'].get(pinned_key(self.user.id)))
+
+    def test_replicas_require_shared_pin_cache(self):
+        self.assertEqual([error.id for error in check_replica_pin_cache(None)], ['core.E002'])
+
+        with override_settings(REPLICA_READ_YOUR_WRITES_SECONDS=0):
+            self.assertEqual(check_replica_pin_cache(None), [])
+        with override_settings(DATABASE_REPLICAS=[]):
+            self.assertEqual(check_replica_pin_cache(None), [])
+
+        shared = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://'}}
+        with override_settings(CACHES=shared):
+            self.assertEqual(check_replica_pin_cache(None), [])
+
+    def test_login_after_signup_reads_primary(self):
+        # 가입한 사용자가 아직 복제본에 없는 상황
+        res = APIClient().post('/api/auth/signup/', {'username': 'new', 'password': 'pass'}, format='json')
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertFalse(User.objects.using('replica').filter(username='new').exists())
+
+        res = APIClient().post('/api/auth/login/', {'username': 'new', 'password': 'pass'}, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    @override_settings(REPLICA_READ_YOUR_WRITES_SECONDS=0)
+    def test_read_your_writes_window_is_optional(self):
+        res = self.client.post('/api/reservations/create/', self.create_payload(10), format='json')
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+        res = self.client.get('/api/reservations/my/')
+        self.assertEqual(res.data, [])
+
+    def test_admission_reads_in_write_transaction_use_primary(self):
+        # primary 장부는 가득 찼지만 복제본에는 아직 반영되지 않은 상황
+        self.create_reservation('default', self.other, 50_000, status=Status.CONFIRM)
+
+        res = self.client.post('/api/reservations/create/', self.create_payload(1), format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("50,000명을 초과합니다", str(res.data))
+
+    def test_availability_cache_is_filled_from_primary(self):
+        self.create_reservation('default', self.other, 2000, status=Status.CONFIRM)
+
+        res = self.client.get(f'/api/reservations/available/?date={self.target_date.isoformat()}')
+
+        slots = {slot['start_time']: slot['available_headcount'] for slot in res.data['available_slots']}
+        self.assertEqual(slots['10:00'], 48000)
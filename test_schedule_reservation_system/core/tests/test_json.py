@@ -0,0 +1,85 @@
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from io import BytesIO
+from unittest import mock, skipIf
+from zoneinfo import ZoneInfo
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from .. import parsers, renderers
+from ..parsers import FastJSONParser
+from ..renderers import FastJSONRenderer
+
+PAYLOAD = {
+    'date': date(2025, 4, 20),
+    'time': time(10, 0),
+    'time_with_microseconds': time(23, 59, 59, 999999),
+    'utc': datetime(2025, 4, 20, 1, 2, 3, tzinfo=timezone.utc),
+    'seoul': datetime(2025, 4, 20, 10, 2, 3, 456000, tzinfo=ZoneInfo('Asia/Seoul')),
+    'naive': datetime(2025, 4, 20, 10, 0),
+    'decimal': Decimal('12.50'),
+    'duration': timedelta(minutes=90),
+    'lazy': gettext_lazy('예약'),
+    'separators': 'a\u2028b\u2029c',
+    'nested': [{'headcount': 50000, 'status': 'CONFIRM', 'ok': True, 'none': None, 'ratio': 0.1}],
+    1: 'int key',
+}
+
+
+@skipIf(renderers.orjson is None, "orjson 이 설치되어 있지 않습니다.")
+class TestFastJSONRenderer(SimpleTestCase):
+    def test_matches_drf_json_renderer(self):
+        self.assertEqual(FastJSONRenderer().render(PAYLOAD), JSONRenderer().render(PAYLOAD))
+
+    def test_indented_output_uses_drf_renderer(self):
+        context = {'indent': 4}
+
+        self.assertEqual(
+            FastJSONRenderer().render(PAYLOAD, renderer_context=context),
+            JSONRenderer().render(PAYLOAD, renderer_context=context)
+        )
+
+    def test_unsupported_values_fall_back(self):
+        data = {'big': 2 ** 70}
+
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_none_renders_empty_body(self):
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+
+class TestFastJSONRendererWithoutOrjson(SimpleTestCase):
+    def test_falls_back_to_drf_renderer(self):
+        with mock.patch.object(renderers, 'orjson', None):
+            self.assertEqual(FastJSONRenderer().render(PAYLOAD), JSONRenderer().render(PAYLOAD))
+
+
+class TestFastJSONParser(SimpleTestCase):
+    body = '{"test_reservation_date": "2025-04-20", "headcount": 100, "ratio": 0.5, "name": "예약"}'
+
+    def parse(self, body: bytes, **context):
+        return FastJSONParser().parse(BytesIO(body), parser_context=context)
+
+    def test_matches_drf_json_parser(self):
+        self.assertEqual(
+            self.parse(self.body.encode()),
+            JSONParser().parse(BytesIO(self.body.encode()))
+        )
+
+    def test_other_encoding(self):
+        self.assertEqual(self.parse(self.body.encode('utf-16'), encoding='utf-16')['name'], '예약')
+
+    def test_invalid_json_raises_parse_error(self):
+        for body in (b'{"headcount": ', b'{"ratio": NaN}', b'\xff'):
+            with self.assertRaises(ParseError):
+                self.parse(body)
+
+    def test_falls_back_without_orjson(self):
+        with mock.patch.object(parsers, 'orjson', None):
+            self.assertEqual(self.parse(self.body.encode())['headcount'], 100)
+            with self.assertRaises(ParseError):
+                self.parse(b'{"headcount": ')
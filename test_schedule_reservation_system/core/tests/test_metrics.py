@@ -0,0 +1,120 @@
+import re
+from datetime import time, timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from django.utils.timezone import now
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .. import metrics
+from ..auth.token_utils import generate_tokens_for_user
+from ..models.reservation import Reservation, Status
+
+
+def sample(text: str, name: str, **labels) -> float:
+    # 지표 이름과 라벨이 모두 일치하는 샘플 값
+    for line in text.splitlines():
+        match = re.fullmatch(r'(\w+)\{(.*)\} (\S+)', line)
+        if match and match.group(1) == name and dict(re.findall(r'(\w+)="([^"]*)"', match.group(2))) == labels:
+            return float(match.group(3))
+    raise AssertionError(f'{name} {labels} 샘플이 없습니다.')
+
+
+class TestHistogram(SimpleTestCase):
+    def test_buckets_are_cumulative(self):
+        histogram = metrics.Histogram('test_seconds', '테스트', (0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe('view', value)
+
+        text = '\n'.join(histogram.render())
+
+        self.assertIn('# TYPE test_seconds histogram', text)
+        self.assertEqual(sample(text, 'test_seconds_bucket', view='view', le='0.1'), 2)
+        self.assertEqual(sample(text, 'test_seconds_bucket', view='view', le='1.0'), 3)
+        self.assertEqual(sample(text, 'test_seconds_bucket', view='view', le='+Inf'), 4)
+        self.assertEqual(sample(text, 'test_seconds_count', view='view'), 4)
+        self.assertAlmostEqual(sample(text, 'test_seconds_sum', view='view'), 3.65)
+
+
+class TestMetricsMiddleware(APITestCase):
+    def setUp(self):
+        cache.clear()
+        metrics.reset()
+        self.user = User.objects.create_user(username='user1', password='pass')
+        self.admin = User.objects.create_user(username='admin', password='pass', is_staff=True)
+        self.target_date = now().date() + timedelta(days=5)
+
+    def login(self, user: User):
+        tokens = generate_tokens_for_user(user)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+
+    def get_metrics(self) -> str:
+        self.client.credentials()
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], metrics.CONTENT_TYPE)
+        return response.content.decode()
+
+    def test_records_request_metrics_per_view(self):
+        self.login(self.user)
+        response = self.client.get(f'/api/reservations/available/?date={self.target_date}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        text = self.get_metrics()
+        view = 'user-reservation-get-available-slots'
+
+        self.assertEqual(sample(text, 'http_requests_total', view=view, method='GET', status='200'), 1)
+        self.assertEqual(sample(text, 'http_request_duration_seconds_count', view=view), 1)
+        # 사용자 조회와 예약 가능 인원 계산 쿼리
+        self.assertGreaterEqual(sample(text, 'http_request_db_queries_sum', view=view), 1)
+        self.assertGreater(sample(text, 'http_request_db_duration_seconds_sum', view=view), 0)
+        self.assertGreater(sample(text, 'http_response_render_duration_seconds_sum', view=view), 0)
+        self.assertEqual(sample(text, 'http_response_size_bytes_sum', view=view), len(response.content))
+
+    async def test_async_request_records_queries_run_in_other_threads(self):
+        # ASGI 에서는 뷰의 쿼리가 sync_to_async 스레드의 연결로 실행된다.
+        headers = {'Authorization': 'Bearer ' + generate_tokens_for_user(self.user)['access_token']}
+
+        for url in ('/api/reservations/my/', '/api/reservations/async/my/'):
+            response = await self.async_client.get(url, headers=headers)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        text = metrics.render()
+        for view in ('user-reservation-my-reservations', 'user-reservation-async-my'):
+            self.assertGreater(sample(text, 'http_request_db_queries_sum', view=view), 0)
+            self.assertGreater(sample(text, 'http_request_db_duration_seconds_sum', view=view), 0)
+
+    def test_streaming_response_size_is_recorded_after_stream(self):
+        Reservation.objects.create(
+            user=self.user,
+            test_reservation_date=self.target_date,
+            test_start_time=time(10, 0),
+            test_end_time=time(11, 0),
+            headcount=10,
+            status=Status.AWAIT
+        )
+        self.login(self.admin)
+        response = self.client.get('/api/admin-reservation/reservations/export/')
+        content = b''.join(response.streaming_content)
+
+        text = self.get_metrics()
+
+        self.assertEqual(sample(text, 'http_response_size_bytes_sum', view='admin-reservation-export-reservations'),
+                         len(content))
+
+    def test_unmatched_paths_share_one_label(self):
+        self.client.get('/api/unknown/1/')
+        self.client.get('/api/unknown/2/')
+
+        text = self.get_metrics()
+
+        self.assertEqual(
+            sample(text, 'http_requests_total', view=metrics.UNMATCHED_VIEW, method='GET', status='404'), 2
+        )
+
+    def test_metrics_forbidden_outside_internal_ips(self):
+        response = self.client.get('/metrics', REMOTE_ADDR='10.0.0.1')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
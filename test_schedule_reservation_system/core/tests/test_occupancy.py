@@ -0,0 +1,82 @@
+import random
+from datetime import time
+from unittest import skipIf
+
+from django.test import SimpleTestCase
+
+from ..models import occupancy
+from ..models.occupancy import Occupancy
+
+
+def random_intervals(count: int, seed: int = 0) -> list[tuple[time, time, int]]:
+    rng = random.Random(seed)
+    intervals = []
+    for _ in range(count):
+        start = rng.randrange(0, 1439)
+        end = rng.randrange(start + 1, 1440)
+        intervals.append((time(start // 60, start % 60), time(end // 60, end % 60), rng.randrange(1, 500)))
+    return intervals
+
+
+class TestOccupancy(SimpleTestCase):
+    def test_minute_occupancy_counts_overlaps(self):
+        result = Occupancy.from_intervals([
+            (time(9, 0), time(10, 0), 100),
+            (time(9, 30), time(11, 0), 200),
+        ], use_numpy=False)
+
+        self.assertEqual(result.get_peak_headcount(time(9, 0), time(9, 30)), 100)
+        self.assertEqual(result.get_peak_headcount(time(9, 0), time(11, 0)), 300)
+        self.assertEqual(result.get_peak_headcount(time(10, 0), time(11, 0)), 200)
+        self.assertEqual(result.get_peak_headcount(time(11, 0), time(12, 0)), 0)
+
+    def test_end_time_with_seconds_is_rounded_up(self):
+        result = Occupancy.from_intervals([(time(9, 0), time(9, 59, 30), 100)], use_numpy=False)
+
+        self.assertEqual(result.get_peak_headcount(time(9, 59), time(10, 0)), 100)
+        self.assertEqual(result.get_peak_headcount(time(10, 0), time(10, 1)), 0)
+
+    def test_slot_peaks(self):
+        result = Occupancy.from_intervals([(time(10, 15), time(10, 45), 100)], use_numpy=False)
+
+        hourly = result.get_slot_peaks(60)
+        quarterly = result.get_slot_peaks(15)
+
+        self.assertEqual(len(hourly), 24)
+        self.assertEqual(hourly[10], (time(10, 0), time(11, 0), 100))
+        self.assertEqual(hourly[-1], (time(23, 0), time(23, 59), 0))
+        self.assertEqual(len(quarterly), 96)
+        self.assertEqual([peak for _, _, peak in quarterly[40:44]], [0, 100, 100, 0])
+
+    def test_coarse_resolution_covers_partial_slots(self):
+        result = Occupancy.from_intervals([(time(10, 10), time(10, 20), 100)], resolution=15, use_numpy=False)
+
+        self.assertEqual(result.get_peak_headcount(time(10, 0), time(10, 15)), 100)
+        self.assertEqual(result.get_peak_headcount(time(10, 15), time(10, 30)), 100)
+        self.assertEqual(result.get_peak_headcount(time(10, 30), time(10, 45)), 0)
+
+    def test_add_updates_occupancy(self):
+        result = Occupancy(use_numpy=False)
+        result.add(time(9, 0), time(10, 0), 100)
+        result.add(time(9, 30), time(10, 30), 50)
+
+        self.assertEqual(result.get_peak_headcount(time(9, 0), time(10, 30)), 150)
+
+    def test_invalid_slot_minutes(self):
+        with self.assertRaises(ValueError):
+            Occupancy(resolution=15).get_slot_peaks(20)
+
+    @skipIf(occupancy.np is None, "numpy가 설치되지 않았습니다.")
+    def test_numpy_and_pure_python_results_are_equal(self):
+        intervals = random_intervals(500)
+
+        pure = Occupancy.from_intervals(intervals, use_numpy=False)
+        vectorized = Occupancy.from_intervals(intervals, use_numpy=True)
+
+        self.assertTrue(vectorized.use_numpy)
+        for slot_minutes in (60, 30, 15):
+            self.assertEqual(pure.get_slot_peaks(slot_minutes), vectorized.get_slot_peaks(slot_minutes))
+        self.assertEqual(
+            pure.get_peak_headcount(time(8, 0), time(17, 0)),
+            vectorized.get_peak_headcount(time(8, 0), time(17, 0))
+        )
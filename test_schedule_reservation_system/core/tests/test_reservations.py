@@ -0,0 +1,108 @@
+from datetime import date, time
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from rest_framework.exceptions import ValidationError
+
+from ..models.reservation import Reservation, Status
+from ..models.reservations import Reservations
+
+
+def make_reservation(start: time, end: time, headcount: int) -> Reservation:
+    return Reservation(
+        test_reservation_date=date(2025, 4, 20),
+        test_start_time=start,
+        test_end_time=end,
+        headcount=headcount,
+        status=Status.CONFIRM
+    )
+
+
+class TestReservationsPeakHeadcount(SimpleTestCase):
+    def test_empty_reservations(self):
+        reservations = Reservations([])
+
+        self.assertEqual(reservations.get_peak_headcount(time(9, 0), time(18, 0)), 0)
+
+    def test_back_to_back_reservations_do_not_overlap(self):
+        reservations = Reservations([
+            make_reservation(time(9, 0), time(10, 0), 30000),
+            make_reservation(time(10, 0), time(11, 0), 30000),
+        ])
+
+        self.assertEqual(reservations.get_peak_headcount(time(9, 0), time(11, 0)), 30000)
+
+    def test_overlapping_reservations_are_summed(self):
+        reservations = Reservations([
+            make_reservation(time(9, 0), time(12, 0), 10000),
+            make_reservation(time(10, 0), time(11, 0), 20000),
+            make_reservation(time(10, 30), time(13, 0), 5000),
+        ])
+
+        self.assertEqual(reservations.get_peak_headcount(time(9, 0), time(13, 0)), 35000)
+
+    def test_peak_is_limited_to_window(self):
+        reservations = Reservations([
+            make_reservation(time(9, 0), time(12, 0), 10000),
+            make_reservation(time(10, 0), time(11, 0), 20000),
+        ])
+
+        self.assertEqual(reservations.get_peak_headcount(time(11, 0), time(12, 0)), 10000)
+        self.assertEqual(reservations.get_peak_headcount(time(13, 0), time(14, 0)), 0)
+
+    def test_validate_exceed_limit_uses_peak(self):
+        reservations = Reservations([
+            make_reservation(time(9, 0), time(10, 0), 30000),
+            make_reservation(time(10, 0), time(11, 0), 30000),
+        ])
+
+        reservations.validate_exceed_limit(20000, time(9, 0), time(11, 0))
+
+        with self.assertRaises(ValidationError):
+            reservations.validate_exceed_limit(20001, time(9, 0), time(11, 0))
+
+
+class TestReservationsInDatabase(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='user', password='pass')
+        for start, end, headcount in [
+            (time(9, 0), time(10, 0), 30000),
+            (time(10, 0), time(11, 0), 30000),
+            (time(9, 30), time(10, 30), 5000),
+            (time(13, 0), time(14, 0), 1000),
+        ]:
+            reservation = make_reservation(start, end, headcount)
+            reservation.user = user
+            reservation.save()
+
+        self.queryset = Reservation.objects.filter(status=Status.CONFIRM)
+
+    def test_total_headcount_is_aggregated_in_database(self):
+        with self.assertNumQueries(1):
+            total = Reservations(self.queryset).get_total_headcount()
+
+        self.assertEqual(total, Reservations(list(self.queryset)).get_total_headcount())
+
+    def test_peak_headcount_from_queryset(self):
+        in_memory = Reservations(list(self.queryset))
+        in_database = Reservations(self.queryset)
+
+        for start, end in [(time(0, 0), time(23, 59)), (time(10, 0), time(11, 0)), (time(10, 30), time(13, 0)),
+                           (time(15, 0), time(16, 0))]:
+            with self.assertNumQueries(1):
+                peak = in_database.get_peak_headcount(start, end)
+            self.assertEqual(peak, in_memory.get_peak_headcount(start, end))
+
+    def test_validate_exceed_limit_in_database(self):
+        reservations = Reservations(self.queryset)
+
+        reservations.validate_exceed_limit(15000, time(9, 0), time(11, 0))
+
+        with self.assertRaises(ValidationError):
+            reservations.validate_exceed_limit(15001, time(9, 0), time(11, 0))
+
+    def test_available_headcount_from_queryset(self):
+        self.assertEqual(
+            Reservations(self.queryset).get_hourly_available_headcount(),
+            Reservations(list(self.queryset)).get_hourly_available_headcount()
+        )
@@ -0,0 +1,18 @@
+from collections import Counter
+from unittest import mock
+
+from django.test import SimpleTestCase
+from drf_spectacular.generators import SchemaGenerator
+
+
+class TestSchema(SimpleTestCase):
+    def test_operation_ids_are_unique(self):
+        # drf-spectacular 은 겹치는 operationId 에 번호를 붙여 숨기므로 붙이기 전의 값을 확인한다.
+        with mock.patch('drf_spectacular.generators.sanitize_result_object', side_effect=lambda result: result):
+            schema = SchemaGenerator().get_schema(request=None, public=True)
+
+        operation_ids = Counter(
+            operation['operationId'] for methods in schema['paths'].values() for operation in methods.values()
+        )
+        self.assertEqual([operation_id for operation_id, count in operation_ids.items() if count > 1], [])
+        self.assertIn('admin_reservation_confirm_bulk_partial_update', operation_ids)
@@ -0,0 +1,122 @@
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.models import Max
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from ..models.capacity_ledger import CapacityLedger
+from ..models.reservation import Reservation, Status
+from ..models.token_revocation import TokenRevocation
+
+FIELDS = ('user__username', 'test_reservation_date', 'test_start_time', 'test_end_time', 'headcount', 'status')
+
+
+class TestSeedReservations(TestCase):
+    def setUp(self):
+        self.start_date = date(2025, 3, 1)
+        self.today = self.start_date + timedelta(days=10)
+
+    def seed(self, *args, **options):
+        call_command(
+            'seed_reservations', '--users', '20', '--reservations', '2000', '--days', '20',
+            '--start-date', self.start_date.isoformat(), '--today', self.today.isoformat(), *args,
+            stdout=StringIO(), **options
+        )
+
+    def get_rows(self, fields=FIELDS) -> list[tuple]:
+        return list(Reservation.objects.order_by('id').values_list(*fields))
+
+    def test_creates_users_and_reservations(self):
+        self.seed()
+
+        self.assertEqual(User.objects.filter(username__startswith='seed_user_').count(), 20)
+        self.assertEqual(Reservation.objects.count(), 2000)
+        self.assertTrue(Reservation.objects.filter(status=Status.CONFIRM).exists())
+        self.assertTrue(Reservation.objects.filter(status=Status.AWAIT).exists())
+        self.assertFalse(Reservation.objects.filter(
+            test_reservation_date__lt=self.start_date
+        ).exists())
+
+    def test_same_seed_creates_same_reservations(self):
+        self.seed()
+        first = self.get_rows()
+
+        self.seed('--clear')
+
+        self.assertEqual(self.get_rows(), first)
+        self.seed('--clear', '--seed', '2')
+        self.assertNotEqual(self.get_rows(), first)
+
+    def test_same_options_create_same_reservations_at_any_time(self):
+        fields = (*FIELDS, 'created_at', 'updated_at')
+        now = datetime(2025, 3, 5, 12, 0, tzinfo=dt_timezone.utc)
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            self.seed()
+        first = self.get_rows(fields)
+
+        with mock.patch('django.utils.timezone.now', return_value=now + timedelta(days=30, hours=7)):
+            self.seed('--clear')
+
+        self.assertEqual(self.get_rows(fields), first)
+        cap = datetime.combine(self.today, time.min, tzinfo=dt_timezone.utc)
+        self.assertLessEqual(max(row[-1] for row in first), cap)
+
+    def test_ledger_matches_reservations(self):
+        user = User.objects.create_user(username='user', password='pass')
+        Reservation.objects.create(
+            user=user, test_reservation_date=self.start_date + timedelta(days=1), test_start_time=time(10, 0),
+            test_end_time=time(11, 0), headcount=30000, status=Status.CONFIRM
+        )
+
+        self.seed()
+
+        self.assertEqual(CapacityLedger.objects.verify(), [])
+        self.seed('--clear', '--seed', '3')
+        self.assertEqual(CapacityLedger.objects.verify(), [])
+
+    def test_confirmed_headcount_does_not_exceed_limit(self):
+        call_command(
+            'seed_reservations', '--users', '5', '--reservations', '3000', '--days', '1',
+            '--start-date', self.start_date.isoformat(), '--today', self.today.isoformat(), stdout=StringIO()
+        )
+
+        peak = max(CapacityLedger.objects.get_stored([self.start_date])[self.start_date].values())
+        self.assertLessEqual(peak, 50000)
+
+    def test_existing_prefix_requires_clear(self):
+        self.seed()
+
+        with self.assertRaises(CommandError):
+            self.seed()
+
+    def test_bulk_method(self):
+        fields = (*FIELDS, 'created_at', 'updated_at')
+        self.seed('--method', 'bulk', '--batch-size', '500')
+        bulk = self.get_rows(fields)
+
+        # 생성한 시각을 현재 시각으로 덮어쓰지 않는다.
+        cap = datetime.combine(self.today, time.min, tzinfo=dt_timezone.utc)
+        self.assertLessEqual(Reservation.objects.aggregate(latest=Max('updated_at'))['latest'], cap)
+        self.assertTrue(Reservation._meta.get_field('updated_at').auto_now)
+
+        if connection.vendor == 'postgresql':
+            self.seed('--clear', '--method', 'copy')
+            self.assertEqual(self.get_rows(fields), bulk)
+        self.assertEqual(CapacityLedger.objects.verify(), [])
+
+    def test_clear_revokes_tokens_in_one_query(self):
+        self.seed()
+        user_ids = set(User.objects.filter(username__startswith='seed_user_').values_list('id', flat=True))
+
+        with CaptureQueriesContext(connection) as queries:
+            self.seed('--clear')
+
+        revocations = [query for query in queries if TokenRevocation._meta.db_table in query['sql']]
+        self.assertEqual(len(revocations), 1)
+        self.assertEqual(set(TokenRevocation.objects.values_list('user_id', flat=True)), user_ids)
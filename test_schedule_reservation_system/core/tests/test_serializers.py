@@ -0,0 +1,54 @@
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from system_admin.reservation.serializers import ReservationSerializer as AdminReservationSerializer
+from system_user.reservation.serializers import ReservationSerializer as UserReservationSerializer
+from ..models.reservation import Reservation, Status
+from ..serializers import get_reservation_rows, serialize_reservation_rows
+
+
+class TestReservationRowSerializer(TestCase):
+    def setUp(self):
+        staff = User.objects.create_user(username='관리자', password='pass', is_staff=True)
+        user = User.objects.create_user(username='user"1', password='pass')
+
+        for i, (owner, status) in enumerate([
+            (user, Status.AWAIT),
+            (user, Status.CONFIRM),
+            (staff, Status.AWAIT),
+            (staff, Status.CONFIRM),
+        ]):
+            Reservation.objects.create(
+                user=owner,
+                test_reservation_date=date.today() + timedelta(days=i),
+                test_start_time=time(9, 30 + i, 15 * i),
+                test_end_time=time(23, 59, 59, 999999),
+                headcount=i * 1000,
+                status=status
+            )
+        # 초 단위 이하가 없는 시각과 UTC 자정 근처의 생성 시각
+        Reservation.objects.filter(headcount=0).update(
+            created_at=datetime(2025, 4, 1, 0, 0, 0, tzinfo=dt_timezone.utc)
+        )
+
+        self.queryset = Reservation.objects.select_related('user').order_by('id')
+
+    def assert_same_json(self):
+        fast = JSONRenderer().render(serialize_reservation_rows(get_reservation_rows(self.queryset)))
+        for serializer_class in (AdminReservationSerializer, UserReservationSerializer):
+            expected = JSONRenderer().render(serializer_class(self.queryset, many=True).data)
+            self.assertEqual(fast, expected)
+
+    def test_matches_reservation_serializers_byte_for_byte(self):
+        self.assert_same_json()
+
+    def test_matches_in_utc(self):
+        with timezone.override('UTC'):
+            self.assert_same_json()
+
+    def test_empty_queryset(self):
+        self.assertEqual(serialize_reservation_rows(get_reservation_rows(Reservation.objects.none())), [])
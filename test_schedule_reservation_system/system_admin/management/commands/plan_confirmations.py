@@ -0,0 +1,40 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from system_admin.reservation.services import plan_confirmations
+
+
+class Command(BaseCommand):
+    help = ("기간 내 대기 예약 중 시간대별 최대 인원을 넘지 않게 확정할 예약을 계산합니다. "
+            "날짜마다 세 가지 순서(선착순, 인원 큰 순, 시간 짧은 순)로 탐욕 배치해 확정 인원이 가장 많은 결과를 "
+            "고르는 휴리스틱이며, 확정 인원의 최대 합을 보장하지는 않습니다. "
+            "--apply 를 지정하지 않으면 계획만 출력합니다.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--from', dest='start_date', required=True, type=date.fromisoformat,
+                            help="시작 날짜 (YYYY-MM-DD)")
+        parser.add_argument('--to', dest='end_date', required=True, type=date.fromisoformat,
+                            help="종료 날짜 (YYYY-MM-DD)")
+        parser.add_argument('--apply', action='store_true', help="계획대로 예약을 확정합니다.")
+
+    def handle(self, *args, start_date, end_date, apply, verbosity, **options):
+        if end_date < start_date:
+            raise CommandError("종료 날짜는 시작 날짜보다 이전일 수 없습니다.")
+
+        plans = plan_confirmations(start_date, end_date, apply=apply)
+
+        for plan in plans:
+            self.stdout.write(
+                f"{plan['date'].isoformat()}  대기 {plan['pending']}건 중 {len(plan['planned'])}건 확정 "
+                f"({plan['seated_headcount']:,}명, {plan['strategy']})"
+            )
+            if verbosity > 1:
+                self.stdout.write(f"  {' '.join(map(str, plan['planned']))}")
+
+        planned = sum(len(plan['planned']) for plan in plans)
+        seated = sum(plan['seated_headcount'] for plan in plans)
+        if apply:
+            self.stdout.write(self.style.SUCCESS(f"{planned}건의 예약을 확정했습니다. ({seated:,}명)"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"{planned}건을 확정할 수 있습니다. ({seated:,}명, dry-run)"))
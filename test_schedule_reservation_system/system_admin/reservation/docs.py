@@ -1,6 +1,11 @@
 from drf_spectacular.utils import OpenApiParameter, OpenApiTypes, OpenApiExample
 
 from .serializers import (
+    ConfirmationPlanRequestSerializer,
+    ConfirmationPlanSerializer,
+    ReservationBulkConfirmSerializer,
+    ReservationBulkConfirmResultSerializer,
+    ReservationPageSerializer,
     ReservationSerializer,
     ReservationUpdateSerializer,
     ReservationDetailSerializer
@@ -8,7 +13,39 @@ from .serializers import (
 
 list_reservations_docs = {
     "summary": "전체 예약 목록 조회 (관리자)",
-    "description": "관리자(staff)는 모든 예약 목록을 조회할 수 있습니다.",
+    "description": "관리자(staff)는 모든 예약 목록을 예약 날짜, id 순으로 조회할 수 있습니다. "
+                   "응답의 next 로 다음 페이지를 요청하며, 마지막 페이지에서는 next 가 null 입니다.",
+    "parameters": [
+        OpenApiParameter(
+            name="cursor",
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="이전 응답의 next 에 포함된 커서 값"
+        ),
+        OpenApiParameter(
+            name="page_size",
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="페이지 크기 (기본 100, 최대 1000)"
+        ),
+        OpenApiParameter(
+            name="Authorization",
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.HEADER,
+            required=True,
+            description="JWT 인증 헤더 (예: Bearer <token>)"
+        )
+    ],
+    "responses": {200: ReservationPageSerializer}
+}
+
+export_reservations_docs = {
+    "summary": "전체 예약 내보내기 (관리자)",
+    "description": "모든 예약을 예약 날짜, id 순의 JSON 배열로 스트리밍합니다. "
+                   "정산처럼 전체 데이터가 필요한 경우에 사용하며, 서버는 일정 크기씩 나누어 읽고 전송합니다. "
+                   "ASGI 서버에서는 비동기로 읽어 전송합니다. (동기 스트리밍 응답은 ASGI 에서 전체를 메모리에 모은 뒤 전송됩니다)",
     "parameters": [
         OpenApiParameter(
             name="Authorization",
@@ -92,6 +129,88 @@ confirm_reservation_docs = {
     "responses": {200: ReservationDetailSerializer}
 }
 
+confirm_reservations_docs = {
+    # 같은 confirm 경로의 단건 확정(PATCH {id}/confirm/)과 자동 생성 operationId 가 겹치므로 직접 지정한다.
+    "operation_id": "admin_reservation_confirm_bulk_partial_update",
+    "summary": "예약 일괄 확정 (관리자)",
+    "description": "여러 예약을 한 번에 확정합니다(최대 5,000건). id 가 작은(먼저 신청된) 예약부터 차례로 인원을 검사해 "
+                   "시간대별 최대 인원(50,000명)을 넘지 않는 예약만 확정하며, 거절된 예약은 사유와 함께 반환합니다.",
+    "request": ReservationBulkConfirmSerializer,
+    "parameters": [
+        OpenApiParameter(
+            name="Authorization",
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.HEADER,
+            required=True,
+            description="JWT 액세스 토큰 (어드민 권한 필요). 예: Bearer <your_token>"
+        )
+    ],
+    "examples": [
+        OpenApiExample(
+            name="예약 일괄 확정 요청",
+            value={"ids": [1, 2, 3, 4]},
+            request_only=True
+        ),
+        OpenApiExample(
+            name="예약 일괄 확정 응답",
+            value={
+                "message": "2건의 예약이 확정되었습니다.",
+                "confirmed": [1, 2],
+                "rejected": [
+                    {"id": 3, "reason": "해당 시간대의 예약 인원이 50,000명을 초과합니다."},
+                    {"id": 4, "reason": "이미 확정된 예약입니다."}
+                ]
+            },
+            response_only=True
+        )
+    ],
+    "responses": {200: ReservationBulkConfirmResultSerializer}
+}
+
+plan_confirmations_docs = {
+    "summary": "예약 확정 계획 (관리자)",
+    "description": "기간 내 대기 예약 중 시간대별 최대 인원(50,000명)을 넘지 않게 확정할 예약을 계산합니다. "
+                   "날짜마다 세 가지 순서(first_come, largest_first, shortest_first)로 탐욕 배치해 확정 인원이 가장 많은 "
+                   "결과를 고르는 휴리스틱이며(strategy 에 고른 순서를 반환), 확정 인원의 최대 합을 보장하지는 않습니다. "
+                   "기본은 계획만 반환하며(dry-run), apply 가 true 이면 계획대로 확정합니다. 최대 31일까지 지정할 수 있습니다.",
+    "request": ConfirmationPlanRequestSerializer,
+    "parameters": [
+        OpenApiParameter(
+            name="Authorization",
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.HEADER,
+            required=True,
+            description="JWT 액세스 토큰 (어드민 권한 필요). 예: Bearer <your_token>"
+        )
+    ],
+    "examples": [
+        OpenApiExample(
+            name="확정 계획 요청",
+            value={"start_date": "2025-04-20", "end_date": "2025-04-21", "apply": False},
+            request_only=True
+        ),
+        OpenApiExample(
+            name="확정 계획 응답",
+            value={
+                "applied": False,
+                "planned_count": 2,
+                "seated_headcount": 50000,
+                "dates": [
+                    {
+                        "date": "2025-04-20",
+                        "strategy": "largest_first",
+                        "pending": 3,
+                        "planned": [2, 3],
+                        "seated_headcount": 50000
+                    }
+                ]
+            },
+            response_only=True
+        )
+    ],
+    "responses": {200: ConfirmationPlanSerializer}
+}
+
 delete_reservation_docs = {
     "summary": "예약 삭제 (관리자)",
     "description": "예약을 삭제합니다. 존재하지 않는 예약을 삭제할 경우 예외가 발생합니다.",
@@ -106,3 +225,67 @@ delete_reservation_docs = {
     ],
     "responses": {204: OpenApiTypes.NONE}
 }
+
+availability_cache_stats_docs = {
+    "summary": "예약 가능 인원 캐시 통계 (관리자)",
+    "description": "시간대별 예약 가능 인원 캐시의 적중/미적중 횟수를 조회합니다. 값은 요청을 처리한 서버 프로세스 기준입니다.",
+    "parameters": [
+        OpenApiParameter(
+            name="Authorization",
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.HEADER,
+            required=True,
+            description="JWT 액세스 토큰 (어드민 권한 필요). 예: Bearer <your_token>"
+        )
+    ],
+    "examples": [
+        OpenApiExample(
+            name="캐시 통계 응답",
+            value={
+                "hits": 1520,
+                "misses": 80,
+                "hit_ratio": 0.95
+            },
+            response_only=True
+        )
+    ],
+    "responses": {200: OpenApiTypes.OBJECT}
+}
+
+db_pool_stats_docs = {
+    "summary": "DB 연결 풀 통계 (관리자)",
+    "description": (
+        "DB alias 별 연결 재사용 방식(pool: psycopg 연결 풀, persistent: 지속 연결, none: 요청마다 연결)과 "
+        "사용 중인 연결 수, 연결을 기다리는 요청 수, 연결 획득 시간(평균/최대, ms)을 조회합니다. "
+        "풀을 사용하면 pool 에 psycopg_pool 의 통계가 함께 포함됩니다. 값은 요청을 처리한 서버 프로세스 기준입니다."
+    ),
+    "parameters": [
+        OpenApiParameter(
+            name="Authorization",
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.HEADER,
+            required=True,
+            description="JWT 액세스 토큰 (어드민 권한 필요). 예: Bearer <your_token>"
+        )
+    ],
+    "examples": [
+        OpenApiExample(
+            name="연결 풀 통계 응답",
+            value={
+                "default": {
+                    "mode": "persistent",
+                    "conn_max_age": 60,
+                    "health_checks": True,
+                    "in_use": 4,
+                    "waiting": 0,
+                    "acquired": 12,
+                    "acquire_avg_ms": 6.412,
+                    "acquire_max_ms": 15.08,
+                    "pool": None
+                }
+            },
+            response_only=True
+        )
+    ],
+    "responses": {200: OpenApiTypes.OBJECT}
+}
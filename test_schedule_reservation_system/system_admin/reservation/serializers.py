@@ -33,6 +33,58 @@ class ReservationSerializer(serializers.ModelSerializer):
         ]
 
 
+class ReservationPageSerializer(serializers.Serializer):
+    next = serializers.URLField(allow_null=True)
+    results = ReservationSerializer(many=True)
+
+
+class ReservationBulkConfirmSerializer(serializers.Serializer):
+    MAX_IDS = 5000
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=MAX_IDS
+    )
+
+
+class ReservationBulkConfirmResultSerializer(serializers.Serializer):
+    message = serializers.CharField()
+    confirmed = serializers.ListField(child=serializers.IntegerField())
+    rejected = serializers.ListField(child=serializers.DictField())
+
+
+class ConfirmationPlanRequestSerializer(serializers.Serializer):
+    MAX_DAYS = 31
+
+    start_date = serializers.DateField()
+    end_date = serializers.DateField()
+    apply = serializers.BooleanField(default=False)
+
+    def validate(self, data):
+        days = (data['end_date'] - data['start_date']).days + 1
+        if days < 1:
+            raise ValidationError("종료일은 시작일보다 이전일 수 없습니다.")
+        if days > self.MAX_DAYS:
+            raise ValidationError(f"한 번에 최대 {self.MAX_DAYS}일까지 계획할 수 있습니다.")
+        return data
+
+
+class ConfirmationPlanDateSerializer(serializers.Serializer):
+    date = serializers.DateField()
+    strategy = serializers.CharField()
+    pending = serializers.IntegerField()
+    planned = serializers.ListField(child=serializers.IntegerField())
+    seated_headcount = serializers.IntegerField()
+
+
+class ConfirmationPlanSerializer(serializers.Serializer):
+    applied = serializers.BooleanField()
+    planned_count = serializers.IntegerField()
+    seated_headcount = serializers.IntegerField()
+    dates = ConfirmationPlanDateSerializer(many=True)
+
+
 class ReservationUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Reservation
@@ -1,25 +1,85 @@
+from datetime import date
+from itertools import groupby, islice
+from typing import AsyncIterator, Iterator
+
+from core.locks import lock_reservation_dates
+from core.models.capacity_ledger import CapacityLedger
+from core.models.confirmation_planner import plan_date
+from core.models.occupancy import Occupancy
 from core.models.reservation import Reservation, Status
 from core.models.reservations import Reservations
+from core.renderers import FastJSONRenderer
+from core.serializers import get_reservation_rows, serialize_reservation_rows
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils.timezone import now
 from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.utils.serializer_helpers import ReturnDict
 
-from .serializers import ReservationSerializer, ReservationUpdateSerializer
+from .serializers import ReservationBulkConfirmSerializer, ReservationUpdateSerializer
 
 
-def get_reservation_by_id(reservation_id: int) -> Reservation:
+def get_reservation_by_id(reservation_id: int, for_update: bool = False) -> Reservation:
+    reservations = Reservation.objects.select_for_update() if for_update else Reservation.objects
     try:
-        return Reservation.objects.get(pk=reservation_id)
+        return reservations.get(pk=reservation_id)
     except Reservation.DoesNotExist:
         raise NotFound("해당 예약이 존재하지 않습니다.")
 
 
-def get_all_reservations() -> ReservationSerializer:
-    reservations = Reservation.objects.select_related('user').all()
-    return ReservationSerializer(reservations, many=True)
+def get_all_reservations() -> QuerySet:
+    return get_reservation_rows(Reservation.objects.all())
 
 
+EXPORT_CHUNK_SIZE = 2000
+
+
+def get_export_rows() -> QuerySet:
+    return get_all_reservations().order_by('test_reservation_date', 'id')
+
+
+def render_export_chunk(renderer: FastJSONRenderer, chunk: list, first: bool) -> bytes:
+    # 배열의 대괄호를 뺀 항목들. 두 번째 조각부터는 앞에 쉼표를 붙인다.
+    return (b'' if first else b',') + renderer.render(serialize_reservation_rows(chunk))[1:-1]
+
+
+def stream_all_reservations(chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[bytes]:
+    # 전체 목록을 메모리에 올리지 않도록 chunk 단위로 읽고 직렬화해 JSON 배열 조각을 내보낸다.
+    rows = get_export_rows().iterator(chunk_size=chunk_size)
+    renderer = FastJSONRenderer()
+
+    yield b'['
+    first = True
+    while chunk := list(islice(rows, chunk_size)):
+        yield render_export_chunk(renderer, chunk, first)
+        first = False
+    yield b']'
+
+
+async def astream_all_reservations(chunk_size: int = EXPORT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    stream_all_reservations 의 비동기 버전. ASGI 는 동기 이터레이터의 스트리밍 응답을 한꺼번에 list 로 모아
+    보내므로, ASGI 로 처리하는 요청에서는 이 이터레이터를 사용해야 chunk 단위로 전송된다.
+    """
+    renderer = FastJSONRenderer()
+
+    yield b'['
+    first = True
+    chunk = []
+    async for row in get_export_rows().aiterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield render_export_chunk(renderer, chunk, first)
+            first = False
+            chunk = []
+    if chunk:
+        yield render_export_chunk(renderer, chunk, first)
+    yield b']'
+
+
+@transaction.atomic
 def update_reservation(reservation_id: int, data: ReturnDict) -> Reservation:
-    reservation = get_reservation_by_id(reservation_id)
+    reservation = get_reservation_by_id(reservation_id, for_update=True)
 
     serializer = ReservationUpdateSerializer(data=data)
     serializer.is_valid(raise_exception=True)
@@ -28,14 +88,14 @@ def update_reservation(reservation_id: int, data: ReturnDict) -> Reservation:
     new_test_end_time = serializer.validated_data['test_end_time']
     new_headcount = serializer.validated_data['headcount']
 
-    reservations_in_time = Reservations(list(Reservation.objects.filter(
-        test_reservation_date=new_test_reservation_date,
-        test_start_time__lt=new_test_end_time,
-        test_end_time__gt=new_test_start_time,
-        status=Status.CONFIRM
-    ).exclude(pk=reservation.pk)))
-
-    reservations_in_time.validate_exceed_limit(new_headcount)
+    lock_reservation_dates(new_test_reservation_date)
+    CapacityLedger.objects.validate_exceed_limit(
+        new_test_reservation_date,
+        new_test_start_time,
+        new_test_end_time,
+        new_headcount,
+        exclude=reservation
+    )
 
     for attr, value in serializer.validated_data.items():
         setattr(reservation, attr, value)
@@ -44,26 +104,132 @@ def update_reservation(reservation_id: int, data: ReturnDict) -> Reservation:
     return reservation
 
 
+@transaction.atomic
 def confirm_reservation_by_id(reservation_id: int) -> Reservation:
-    reservation = get_reservation_by_id(reservation_id)
+    reservation = get_reservation_by_id(reservation_id, for_update=True)
 
     if reservation.is_confirmed():
         raise ValidationError("이미 확정된 예약입니다.")
 
-    reservations_in_time = Reservations(Reservation.objects.filter(
-        test_reservation_date=reservation.test_reservation_date,
-        test_start_time__lt=reservation.test_end_time,
-        test_end_time__gt=reservation.test_start_time,
-        status=Status.CONFIRM
-    ))
-
-    reservations_in_time.validate_exceed_limit(reservation.headcount)
+    lock_reservation_dates(reservation.test_reservation_date)
+    CapacityLedger.objects.validate_exceed_limit(
+        reservation.test_reservation_date,
+        reservation.test_start_time,
+        reservation.test_end_time,
+        reservation.headcount
+    )
 
     reservation.status = Status.CONFIRM
     reservation.save()
     return reservation
 
 
+CONFIRM_UPDATE_BATCH_SIZE = 10_000
+
+
+def apply_confirmations(reservations: list[Reservation]):
+    # 잠금과 인원 검사를 마친 예약들을 확정한다.
+    # update() 는 시그널을 거치지 않으므로 확정 인원 장부에 직접 반영한다.
+    ids = [reservation.id for reservation in reservations]
+    for i in range(0, len(ids), CONFIRM_UPDATE_BATCH_SIZE):
+        Reservation.objects.filter(id__in=ids[i:i + CONFIRM_UPDATE_BATCH_SIZE]).update(
+            status=Status.CONFIRM,
+            updated_at=now()
+        )
+
+    added = {}
+    for reservation in reservations:
+        added.setdefault(reservation.test_reservation_date, Occupancy(CapacityLedger.BUCKET_MINUTES)).add(
+            reservation.test_start_time,
+            reservation.test_end_time,
+            reservation.headcount
+        )
+    CapacityLedger.objects.add_occupancies(added)
+
+
+@transaction.atomic
+def confirm_reservations(data: ReturnDict) -> dict:
+    serializer = ReservationBulkConfirmSerializer(data=data)
+    serializer.is_valid(raise_exception=True)
+    ids = list(dict.fromkeys(serializer.validated_data['ids']))
+
+    # 먼저 신청된(id 가 작은) 예약부터 수용한다. 행을 먼저 잠그고 날짜를 잠가 단건 확정과 같은 순서를 따른다.
+    reservations = list(Reservation.objects.select_for_update().filter(id__in=ids).order_by('id'))
+    found = {reservation.id for reservation in reservations}
+    rejected = [{'id': pk, 'reason': "해당 예약이 존재하지 않습니다."} for pk in ids if pk not in found]
+
+    pending = []
+    for reservation in reservations:
+        if reservation.is_confirmed():
+            rejected.append({'id': reservation.id, 'reason': "이미 확정된 예약입니다."})
+        else:
+            pending.append(reservation)
+
+    dates = {reservation.test_reservation_date for reservation in pending}
+    lock_reservation_dates(*dates)
+    occupancies = CapacityLedger.objects.get_occupancies(dates) if dates else {}
+
+    confirmed = []
+    for reservation in pending:
+        occupancy = occupancies[reservation.test_reservation_date]
+        start, end, headcount = reservation.test_start_time, reservation.test_end_time, reservation.headcount
+
+        if occupancy.get_peak_headcount(start, end) + headcount > Reservations.MAX_AVAILABLE_LIMIT:
+            rejected.append({'id': reservation.id, 'reason': "해당 시간대의 예약 인원이 50,000명을 초과합니다."})
+            continue
+
+        occupancy.add(start, end, headcount)
+        confirmed.append(reservation)
+
+    apply_confirmations(confirmed)
+
+    order = {pk: index for index, pk in enumerate(ids)}
+    return {
+        'confirmed': [reservation.id for reservation in confirmed],
+        'rejected': sorted(rejected, key=lambda result: order[result['id']])
+    }
+
+
+@transaction.atomic
+def plan_confirmations(start_date: date, end_date: date, apply: bool = False) -> list[dict]:
+    pending = Reservation.objects.filter(
+        status=Status.AWAIT,
+        test_reservation_date__gte=start_date,
+        test_reservation_date__lte=end_date
+    ).order_by('test_reservation_date', 'id')
+
+    # 적용할 때는 확정과 같은 순서로 행, 날짜를 잠근 뒤 계획을 세운다.
+    if apply:
+        pending = pending.select_for_update()
+    # 수십만 건의 모델 인스턴스를 만드는 비용을 피하려고 필요한 컬럼만 이름 있는 튜플로 읽는다.
+    pending = list(pending.values_list(
+        'id', 'test_reservation_date', 'test_start_time', 'test_end_time', 'headcount', named=True
+    ))
+
+    dates = sorted({reservation.test_reservation_date for reservation in pending})
+    if apply:
+        lock_reservation_dates(*dates)
+    occupancies = CapacityLedger.objects.get_occupancies(dates) if dates else {}
+
+    plans, planned = [], []
+    for test_date, group in groupby(pending, key=lambda reservation: reservation.test_reservation_date):
+        group = list(group)
+        strategy, admitted = plan_date(group, occupancies[test_date], Reservations.MAX_AVAILABLE_LIMIT)
+        planned += admitted
+        plans.append({
+            'date': test_date,
+            'strategy': strategy,
+            'pending': len(group),
+            'planned': [reservation.id for reservation in admitted],
+            'seated_headcount': sum(reservation.headcount for reservation in admitted),
+        })
+
+    if apply:
+        apply_confirmations(planned)
+    return plans
+
+
+@transaction.atomic
 def delete_reservation(reservation_id: int):
     reservation = get_reservation_by_id(reservation_id)
     reservation.delete()
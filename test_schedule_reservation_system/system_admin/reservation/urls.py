@@ -1,7 +1,11 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
-from .views import ReservationAdminViewSet
+from .views import ReservationAdminViewSet, ReservationListAsyncView
 
 router = DefaultRouter()
 router.register('', ReservationAdminViewSet, basename='admin-reservation')
 
-urlpatterns = router.urls
\ No newline at end of file
+urlpatterns = [
+    # ASGI 에서 DB 를 기다리는 동안 워커를 점유하지 않는 비동기 조회 (응답은 동기 API 와 같다)
+    path('async/reservations/', ReservationListAsyncView.as_view(), name='admin-reservation-async-list'),
+] + router.urls
\ No newline at end of file
@@ -1,23 +1,42 @@
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
 from drf_spectacular.utils import extend_schema
 from rest_framework.viewsets import ViewSet
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
+from core import availability_cache, db_pool
+from core.async_views import AsyncAPIView
 from core.models.reservation import Reservation, Status
+from core.pagination import KeysetPagination
+from core.serializers import serialize_reservation_rows
 from ..permissions import IsStaffUser
 from .services import (
     get_all_reservations,
+    stream_all_reservations,
+    astream_all_reservations,
     update_reservation,
     confirm_reservation_by_id,
+    confirm_reservations,
+    plan_confirmations,
     delete_reservation
 )
 from .docs import (
     list_reservations_docs,
+    export_reservations_docs,
     update_reservation_docs,
     confirm_reservation_docs,
-    delete_reservation_docs
+    confirm_reservations_docs,
+    plan_confirmations_docs,
+    delete_reservation_docs,
+    availability_cache_stats_docs,
+    db_pool_stats_docs
+)
+from .serializers import (
+    ConfirmationPlanRequestSerializer,
+    ConfirmationPlanSerializer,
+    ReservationDetailSerializer
 )
-from .serializers import ReservationDetailSerializer
 
 class ReservationAdminViewSet(ViewSet):
     permission_classes = [IsStaffUser]
@@ -25,8 +44,16 @@ class ReservationAdminViewSet(ViewSet):
     @extend_schema(**list_reservations_docs)
     @action(detail=False, methods=['get'], url_path='reservations')
     def list_reservations(self, request):
-        serializer = get_all_reservations()
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(get_all_reservations(), request, view=self)
+        return paginator.get_paginated_response(serialize_reservation_rows(page))
+
+    @extend_schema(**export_reservations_docs)
+    @action(detail=False, methods=['get'], url_path='reservations/export')
+    def export_reservations(self, request):
+        if isinstance(request._request, ASGIRequest):
+            return StreamingHttpResponse(astream_all_reservations(), content_type='application/json')
+        return StreamingHttpResponse(stream_all_reservations(), content_type='application/json')
 
     @extend_schema(**update_reservation_docs)
     @action(detail=True, methods=['patch'], url_path='update')
@@ -48,8 +75,51 @@ class ReservationAdminViewSet(ViewSet):
             'reservation': serializer.data
         }, status=status.HTTP_200_OK)
 
+    @extend_schema(**confirm_reservations_docs)
+    @action(detail=False, methods=['patch'], url_path='confirm')
+    def confirm_reservations(self, request):
+        results = confirm_reservations(request.data)
+        return Response({
+            'message': f"{len(results['confirmed'])}건의 예약이 확정되었습니다.",
+            **results
+        }, status=status.HTTP_200_OK)
+
+    @extend_schema(**plan_confirmations_docs)
+    @action(detail=False, methods=['post'], url_path='confirm/plan')
+    def plan_confirmations(self, request):
+        serializer = ConfirmationPlanRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        plans = plan_confirmations(**serializer.validated_data)
+        return Response(ConfirmationPlanSerializer({
+            'applied': serializer.validated_data['apply'],
+            'planned_count': sum(len(plan['planned']) for plan in plans),
+            'seated_headcount': sum(plan['seated_headcount'] for plan in plans),
+            'dates': plans
+        }).data, status=status.HTTP_200_OK)
+
     @extend_schema(**delete_reservation_docs)
     @action(detail=True, methods=['delete'], url_path='delete')
     def delete_reservation(self, request, pk=None):
         delete_reservation(pk)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @extend_schema(**availability_cache_stats_docs)
+    @action(detail=False, methods=['get'], url_path='availability-cache')
+    def availability_cache_stats(self, request):
+        return Response(availability_cache.get_stats(), status=status.HTTP_200_OK)
+
+    @extend_schema(**db_pool_stats_docs)
+    @action(detail=False, methods=['get'], url_path='db-pool')
+    def db_pool_stats(self, request):
+        return Response(db_pool.get_stats(), status=status.HTTP_200_OK)
+
+
+class ReservationListAsyncView(AsyncAPIView):
+    permission_classes = [IsStaffUser]
+
+    @extend_schema(**list_reservations_docs)
+    async def get(self, request):
+        paginator = KeysetPagination()
+        page = await paginator.apaginate_queryset(get_all_reservations(), request, view=self)
+        return paginator.get_paginated_response(serialize_reservation_rows(page))
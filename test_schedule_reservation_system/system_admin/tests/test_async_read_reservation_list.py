@@ -0,0 +1,66 @@
+from datetime import date, time, timedelta
+
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.auth.token_utils import generate_tokens_for_user
+from core.models.reservation import Reservation
+
+
+class TestReservationAdminAsyncList(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', password='adminpass', is_staff=True)
+        self.user = User.objects.create_user(username='normal', password='userpass')
+
+        Reservation.objects.bulk_create([
+            Reservation(
+                user=self.user,
+                test_reservation_date=date.today() + timedelta(days=i % 3),
+                test_start_time=time(9, 0),
+                test_end_time=time(10, 0),
+                headcount=i + 1
+            )
+            for i in range(7)
+        ])
+
+        self.url = '/api/admin-reservation/async/reservations/'
+        self.sync_url = '/api/admin-reservation/reservations/'
+
+    def authenticate(self, user: User):
+        tokens = generate_tokens_for_user(user)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+
+    def test_pages_match_sync_list(self):
+        self.authenticate(self.admin)
+
+        async_url, sync_url = self.url + '?page_size=3', self.sync_url + '?page_size=3'
+        while async_url:
+            async_page = self.client.get(async_url)
+            sync_page = self.client.get(sync_url)
+
+            self.assertEqual(async_page.status_code, status.HTTP_200_OK)
+            self.assertEqual(async_page.data['results'], sync_page.data['results'])
+            async_url, sync_url = async_page.data['next'], sync_page.data['next']
+
+        self.assertIsNone(sync_url)
+
+    def test_invalid_cursor_returns_error(self):
+        self.authenticate(self.admin)
+
+        response = self.client.get(self.url + '?cursor=invalid')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("잘못된 커서입니다.", str(response.data))
+
+    def test_normal_user_cannot_see_reservations(self):
+        self.authenticate(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_unauthenticated_user_cannot_access(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
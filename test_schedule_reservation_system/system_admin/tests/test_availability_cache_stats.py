@@ -0,0 +1,28 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from core.auth.token_utils import generate_tokens_for_user
+
+
+class TestAvailabilityCacheStats(APITestCase):
+    def setUp(self):
+        self.url = '/api/admin-reservation/availability-cache/'
+        self.admin = User.objects.create_user(username='admin', password='adminpass', is_staff=True)
+        self.user = User.objects.create_user(username='user', password='userpass', is_staff=False)
+
+    def test_admin_can_see_cache_stats(self):
+        tokens = generate_tokens_for_user(self.admin)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data.keys()), {'hits', 'misses', 'hit_ratio'})
+
+    def test_normal_user_cannot_see_cache_stats(self):
+        tokens = generate_tokens_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
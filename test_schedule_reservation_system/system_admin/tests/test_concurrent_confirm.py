@@ -0,0 +1,121 @@
+import threading
+from datetime import date, time, timedelta
+from unittest import skipUnless
+
+from django.contrib.auth.models import User
+from django.db import connection, connections
+from django.test import TransactionTestCase
+from rest_framework.exceptions import ValidationError
+
+from core.models.capacity_ledger import CapacityLedger
+from core.models.reservation import Reservation, Status
+from core.models.reservations import Reservations
+from ..reservation.services import confirm_reservation_by_id, confirm_reservations
+
+
+@skipUnless(connection.vendor == 'postgresql', "advisory lock 은 PostgreSQL 에서만 동작합니다.")
+class TestConcurrentConfirmReservation(TransactionTestCase):
+    THREADS = 16
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='user', password='pass')
+        self.test_date = date.today() + timedelta(days=5)
+
+    def create_pending(self, test_date: date, count: int, headcount: int) -> list[int]:
+        return [
+            Reservation.objects.create(
+                user=self.user,
+                test_reservation_date=test_date,
+                test_start_time=time(10, 0),
+                test_end_time=time(11, 0),
+                headcount=headcount,
+                status=Status.AWAIT
+            ).id
+            for _ in range(count)
+        ]
+
+    def confirm_concurrently(self, reservation_ids: list[int]) -> tuple[list[int], list[int]]:
+        barrier = threading.Barrier(len(reservation_ids))
+        confirmed, rejected = [], []
+
+        def confirm(reservation_id: int):
+            try:
+                barrier.wait()
+                confirm_reservation_by_id(reservation_id)
+                confirmed.append(reservation_id)
+            except ValidationError:
+                rejected.append(reservation_id)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=confirm, args=(pk,)) for pk in reservation_ids]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return confirmed, rejected
+
+    def get_confirmed_peak(self, test_date: date) -> int:
+        return Reservations(Reservation.objects.filter(
+            test_reservation_date=test_date,
+            status=Status.CONFIRM
+        )).get_peak_headcount(time(0, 0), time(23, 59))
+
+    def test_concurrent_confirms_do_not_oversell(self):
+        reservation_ids = self.create_pending(self.test_date, self.THREADS, 10000)
+
+        confirmed, rejected = self.confirm_concurrently(reservation_ids)
+
+        self.assertEqual(len(confirmed), 5)
+        self.assertEqual(len(rejected), self.THREADS - 5)
+        self.assertEqual(self.get_confirmed_peak(self.test_date), 50000)
+        self.assertEqual(CapacityLedger.objects.verify([self.test_date]), [])
+
+    def test_different_dates_are_admitted_independently(self):
+        other_date = self.test_date + timedelta(days=1)
+        reservation_ids = (
+            self.create_pending(self.test_date, self.THREADS // 2, 20000)
+            + self.create_pending(other_date, self.THREADS // 2, 20000)
+        )
+
+        confirmed, rejected = self.confirm_concurrently(reservation_ids)
+
+        self.assertEqual(len(confirmed), 4)
+        self.assertEqual(self.get_confirmed_peak(self.test_date), 40000)
+        self.assertEqual(self.get_confirmed_peak(other_date), 40000)
+        self.assertEqual(CapacityLedger.objects.verify([self.test_date, other_date]), [])
+
+    def test_concurrent_bulk_and_single_confirms_do_not_oversell(self):
+        reservation_ids = self.create_pending(self.test_date, 12, 10000)
+        batches = [reservation_ids[0:4], reservation_ids[4:8]]
+        singles = reservation_ids[8:]
+        barrier = threading.Barrier(len(batches) + len(singles))
+
+        def confirm_batch(ids: list[int]):
+            try:
+                barrier.wait()
+                confirm_reservations({'ids': ids})
+            finally:
+                connections.close_all()
+
+        def confirm_single(reservation_id: int):
+            try:
+                barrier.wait()
+                confirm_reservation_by_id(reservation_id)
+            except ValidationError:
+                pass
+            finally:
+                connections.close_all()
+
+        threads = (
+            [threading.Thread(target=confirm_batch, args=(ids,)) for ids in batches]
+            + [threading.Thread(target=confirm_single, args=(pk,)) for pk in singles]
+        )
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(Reservation.objects.filter(status=Status.CONFIRM).count(), 5)
+        self.assertEqual(self.get_confirmed_peak(self.test_date), 50000)
+        self.assertEqual(CapacityLedger.objects.verify([self.test_date]), [])
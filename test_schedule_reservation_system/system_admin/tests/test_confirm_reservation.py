@@ -1,9 +1,14 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.contrib.auth.models import User
+from core.models.capacity_ledger import CapacityLedger
 from core.models.reservation import Reservation, Status
-from datetime import date, time
+from datetime import date, time, timedelta
 from core.auth.token_utils import generate_tokens_for_user
+from system_user.reservation.services import get_available_slots
 
 
 class TestConfirmReservation(APITestCase):
@@ -92,3 +97,109 @@ class TestConfirmReservation(APITestCase):
         response = self.client.patch(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TestBulkConfirmReservation(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(username='admin', password='adminpass', is_staff=True)
+        self.user = User.objects.create_user(username='user', password='userpass', is_staff=False)
+        self.test_date = date.today() + timedelta(days=5)
+        self.url = '/api/admin-reservation/confirm/'
+
+        tokens = generate_tokens_for_user(self.admin)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+
+    def create_reservation(self, headcount: int, start=time(10, 0), end=time(11, 0), test_date=None,
+                           status=Status.AWAIT) -> Reservation:
+        return Reservation.objects.create(
+            user=self.user,
+            test_reservation_date=test_date or self.test_date,
+            test_start_time=start,
+            test_end_time=end,
+            headcount=headcount,
+            status=status
+        )
+
+    def test_confirms_in_id_order_until_limit(self):
+        first = self.create_reservation(30000)
+        second = self.create_reservation(30000)
+        third = self.create_reservation(20000)
+        other_time = self.create_reservation(40000, start=time(13, 0), end=time(14, 0))
+
+        response = self.client.patch(
+            self.url, {'ids': [third.id, second.id, first.id, other_time.id]}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['confirmed'], [first.id, third.id, other_time.id])
+        self.assertEqual(response.data['rejected'], [
+            {'id': second.id, 'reason': "해당 시간대의 예약 인원이 50,000명을 초과합니다."}
+        ])
+        self.assertEqual(
+            set(Reservation.objects.filter(status=Status.CONFIRM).values_list('id', flat=True)),
+            {first.id, third.id, other_time.id}
+        )
+
+    def test_existing_confirmed_headcount_is_respected(self):
+        self.create_reservation(45000, status=Status.CONFIRM)
+        small = self.create_reservation(5000, start=time(10, 30), end=time(11, 30))
+        large = self.create_reservation(6000, start=time(10, 30), end=time(11, 30))
+
+        response = self.client.patch(self.url, {'ids': [small.id, large.id]}, format='json')
+
+        self.assertEqual(response.data['confirmed'], [small.id])
+        self.assertEqual([result['id'] for result in response.data['rejected']], [large.id])
+
+    def test_ledger_and_availability_are_updated(self):
+        other_date = self.test_date + timedelta(days=1)
+        reservations = [
+            self.create_reservation(1000, start=time(9, 10), end=time(10, 20)),
+            self.create_reservation(2000, start=time(10, 0), end=time(10, 30)),
+            self.create_reservation(3000, test_date=other_date),
+        ]
+        available = get_available_slots(self.test_date.isoformat())
+        self.assertTrue(all(slot[2] == 50000 for slot in available['available_slots']))
+
+        self.client.patch(self.url, {'ids': [r.id for r in reservations]}, format='json')
+
+        self.assertEqual(CapacityLedger.objects.verify(), [])
+        available = get_available_slots(self.test_date.isoformat())
+        slots = {start: headcount for start, _, headcount in available['available_slots']}
+        self.assertEqual(slots[time(9, 0)], 49000)
+        self.assertEqual(slots[time(10, 0)], 47000)
+        self.assertEqual(slots[time(11, 0)], 50000)
+
+    def test_missing_and_already_confirmed_are_rejected(self):
+        confirmed = self.create_reservation(100, status=Status.CONFIRM)
+
+        response = self.client.patch(self.url, {'ids': [999999, confirmed.id]}, format='json')
+
+        self.assertEqual(response.data['confirmed'], [])
+        self.assertEqual(response.data['rejected'], [
+            {'id': 999999, 'reason': "해당 예약이 존재하지 않습니다."},
+            {'id': confirmed.id, 'reason': "이미 확정된 예약입니다."},
+        ])
+
+    def confirm_and_count_queries(self, count: int) -> int:
+        ids = [self.create_reservation(10).id for _ in range(count)]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(self.url, {'ids': ids}, format='json')
+        self.assertEqual(len(response.data['confirmed']), count)
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_ids(self):
+        self.assertEqual(self.confirm_and_count_queries(200), self.confirm_and_count_queries(5))
+
+    def test_empty_ids_returns_error(self):
+        response = self.client.patch(self.url, {'ids': []}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_normal_user_cannot_bulk_confirm(self):
+        tokens = generate_tokens_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+
+        response = self.client.patch(self.url, {'ids': [1]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
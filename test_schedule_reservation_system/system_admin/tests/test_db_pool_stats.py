@@ -0,0 +1,32 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from core.auth.token_utils import generate_tokens_for_user
+
+
+class TestDbPoolStats(APITestCase):
+    def setUp(self):
+        self.url = '/api/admin-reservation/db-pool/'
+        self.admin = User.objects.create_user(username='admin', password='adminpass', is_staff=True)
+        self.user = User.objects.create_user(username='user', password='userpass', is_staff=False)
+
+    def test_admin_can_see_pool_stats(self):
+        tokens = generate_tokens_for_user(self.admin)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data.keys()), {'default'})
+        self.assertEqual(set(response.data['default'].keys()), {
+            'mode', 'conn_max_age', 'health_checks', 'in_use', 'waiting',
+            'acquired', 'acquire_avg_ms', 'acquire_max_ms', 'pool'
+        })
+
+    def test_normal_user_cannot_see_pool_stats(self):
+        tokens = generate_tokens_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
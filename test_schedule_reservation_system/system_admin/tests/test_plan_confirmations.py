@@ -0,0 +1,103 @@
+from datetime import date, time, timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.auth.token_utils import generate_tokens_for_user
+from core.models.capacity_ledger import CapacityLedger
+from core.models.reservation import Reservation, Status
+
+
+class TestPlanConfirmations(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(username='admin', password='adminpass', is_staff=True)
+        self.user = User.objects.create_user(username='user', password='userpass', is_staff=False)
+        self.test_date = date.today() + timedelta(days=5)
+        self.url = '/api/admin-reservation/confirm/plan/'
+
+        tokens = generate_tokens_for_user(self.admin)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+
+        # 선착순이면 첫 예약만 확정되지만, 뒤의 두 예약을 고르면 더 많은 인원을 받을 수 있다.
+        self.first = self.create_reservation(30000, time(10, 0), time(12, 0))
+        self.second = self.create_reservation(25000, time(10, 0), time(11, 0))
+        self.third = self.create_reservation(25000, time(11, 0), time(12, 0))
+        self.other_date = self.create_reservation(1000, time(10, 0), time(11, 0), self.test_date + timedelta(days=1))
+
+    def create_reservation(self, headcount: int, start: time, end: time, test_date=None,
+                           status=Status.AWAIT) -> Reservation:
+        return Reservation.objects.create(
+            user=self.user,
+            test_reservation_date=test_date or self.test_date,
+            test_start_time=start,
+            test_end_time=end,
+            headcount=headcount,
+            status=status
+        )
+
+    def request_plan(self, apply: bool = False, days: int = 1):
+        return self.client.post(self.url, {
+            'start_date': self.test_date.isoformat(),
+            'end_date': (self.test_date + timedelta(days=days)).isoformat(),
+            'apply': apply
+        }, format='json')
+
+    def confirmed_ids(self) -> set[int]:
+        return set(Reservation.objects.filter(status=Status.CONFIRM).values_list('id', flat=True))
+
+    def test_dry_run_returns_plan_without_confirming(self):
+        response = self.request_plan()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data['applied'])
+        self.assertEqual(response.data['planned_count'], 3)
+        self.assertEqual(response.data['seated_headcount'], 51000)
+        self.assertEqual(response.data['dates'][0]['planned'], [self.second.id, self.third.id])
+        self.assertEqual(response.data['dates'][0]['pending'], 3)
+        self.assertEqual(self.confirmed_ids(), set())
+
+    def test_apply_confirms_plan_and_updates_ledger(self):
+        response = self.request_plan(apply=True)
+
+        self.assertTrue(response.data['applied'])
+        self.assertEqual(self.confirmed_ids(), {self.second.id, self.third.id, self.other_date.id})
+        self.assertEqual(CapacityLedger.objects.verify(), [])
+
+    def test_plan_respects_already_confirmed_headcount(self):
+        self.create_reservation(30000, time(10, 0), time(10, 30), status=Status.CONFIRM)
+
+        response = self.request_plan(days=0)
+
+        self.assertEqual(response.data['dates'][0]['planned'], [self.third.id])
+
+    def test_range_longer_than_limit_returns_error(self):
+        response = self.request_plan(days=31)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_normal_user_cannot_plan(self):
+        tokens = generate_tokens_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+
+        self.assertEqual(self.request_plan().status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_command_dry_run_and_apply(self):
+        out = StringIO()
+        call_command(
+            'plan_confirmations', '--from', self.test_date.isoformat(), '--to', self.test_date.isoformat(),
+            verbosity=2, stdout=out
+        )
+        self.assertIn("대기 3건 중 2건 확정", out.getvalue())
+        self.assertIn(f"{self.second.id} {self.third.id}", out.getvalue())
+        self.assertEqual(self.confirmed_ids(), set())
+
+        call_command(
+            'plan_confirmations', '--from', self.test_date.isoformat(), '--to', self.test_date.isoformat(),
+            '--apply', stdout=StringIO()
+        )
+        self.assertEqual(self.confirmed_ids(), {self.second.id, self.third.id})
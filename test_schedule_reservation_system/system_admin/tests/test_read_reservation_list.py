@@ -1,9 +1,15 @@
+import json
+
+from asgiref.sync import sync_to_async
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.contrib.auth.models import User
 from core.models.reservation import Reservation, Status
-from datetime import date, time
+from datetime import date, time, timedelta
 from core.auth.token_utils import generate_tokens_for_user
+from ..reservation.serializers import ReservationSerializer
+from ..reservation.services import astream_all_reservations, stream_all_reservations
 
 
 class TestReservationAdminList(APITestCase):
@@ -47,7 +53,8 @@ class TestReservationAdminList(APITestCase):
         response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNone(response.data['next'])
 
     def test_normal_user_cannot_see_reservations(self):
         tokens = generate_tokens_for_user(self.user)
@@ -58,3 +65,141 @@ class TestReservationAdminList(APITestCase):
         response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TestReservationAdminListPagination(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', password='adminpass', is_staff=True)
+        self.user = User.objects.create_user(username='normal', password='userpass', is_staff=False)
+
+        # 같은 날짜에 여러 건을 두어 날짜가 같을 때 id 순으로 이어지는지 확인한다.
+        Reservation.objects.bulk_create([
+            Reservation(
+                user=self.user,
+                test_reservation_date=date.today() + timedelta(days=i % 3),
+                test_start_time=time(9, 0),
+                test_end_time=time(10, 0),
+                headcount=i + 1
+            )
+            for i in range(7)
+        ])
+
+        tokens = generate_tokens_for_user(self.admin)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+        self.url = '/api/admin-reservation/reservations/'
+
+    def test_pages_follow_date_and_id_order_without_gaps(self):
+        ids = []
+        url = self.url + '?page_size=3'
+        pages = 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [reservation['id'] for reservation in response.data['results']]
+            url = response.data['next']
+            pages += 1
+
+        expected = list(
+            Reservation.objects.order_by('test_reservation_date', 'id').values_list('id', flat=True)
+        )
+        self.assertEqual(pages, 3)
+        self.assertEqual(ids, expected)
+
+    def test_page_does_not_count_rows(self):
+        first = self.client.get(self.url + '?page_size=2')
+
+        with self.assertNumQueries(2):  # 인증 사용자 조회 + 페이지 조회
+            response = self.client.get(first.data['next'])
+
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_page_size_is_capped(self):
+        response = self.client.get(self.url + '?page_size=100000')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 7)
+
+    def test_invalid_cursor_returns_error(self):
+        response = self.client.get(self.url + '?cursor=not-a-cursor')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("잘못된 커서입니다.", str(response.data))
+
+    def test_invalid_page_size_returns_error(self):
+        for value in ('0', '-1', 'abc', '²', '١٠'):
+            with self.subTest(value=value):
+                response = self.client.get(self.url, {'page_size': value})
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestReservationAdminExport(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', password='adminpass', is_staff=True)
+        self.user = User.objects.create_user(username='일반사용자', password='userpass', is_staff=False)
+
+        Reservation.objects.bulk_create([
+            Reservation(
+                user=self.user,
+                test_reservation_date=date.today() + timedelta(days=i % 4),
+                test_start_time=time(9, 0),
+                test_end_time=time(10, 0),
+                headcount=i + 1,
+                status=Status.CONFIRM if i % 2 else Status.AWAIT
+            )
+            for i in range(5)
+        ])
+
+        self.url = '/api/admin-reservation/reservations/export/'
+
+    def export(self, user: User):
+        tokens = generate_tokens_for_user(user)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+        return self.client.get(self.url)
+
+    def test_admin_can_export_all_reservations(self):
+        response = self.export(self.admin)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+        body = b''.join(response.streaming_content)
+        expected = ReservationSerializer(
+            Reservation.objects.select_related('user').order_by('test_reservation_date', 'id'),
+            many=True
+        ).data
+        self.assertEqual(body, JSONRenderer().render(expected))
+
+    def test_export_is_split_into_chunks(self):
+        chunks = list(stream_all_reservations(chunk_size=2))
+
+        self.assertEqual(len(chunks), 5)  # '[', 2건, 2건, 1건, ']'
+        self.assertEqual(len(json.loads(b''.join(chunks))), 5)
+
+    async def test_asgi_export_streams_async_chunks(self):
+        # ASGI 에서는 동기 이터레이터를 list 로 모으므로 비동기 이터레이터로 응답해야 한다.
+        access_token = generate_tokens_for_user(self.admin)['access_token']
+
+        response = await self.async_client.get(self.url, headers={'Authorization': 'Bearer ' + access_token})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.is_async)
+        body = b''.join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(len(json.loads(body)), 5)
+
+    async def test_async_export_is_split_into_chunks(self):
+        chunks = [chunk async for chunk in astream_all_reservations(chunk_size=2)]
+        sync_chunks = await sync_to_async(lambda: list(stream_all_reservations(chunk_size=2)))()
+
+        self.assertEqual(chunks, sync_chunks)
+
+    def test_empty_table_exports_empty_array(self):
+        Reservation.objects.all().delete()
+
+        self.assertEqual(b''.join(stream_all_reservations()), b'[]')
+
+    def test_normal_user_cannot_export_reservations(self):
+        response = self.export(self.user)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
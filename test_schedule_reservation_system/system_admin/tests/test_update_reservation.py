@@ -92,3 +92,23 @@ class TestAdminUpdateReservation(APITestCase):
         }, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("해당 시간대의 예약 인원이 50,000명을 초과합니다.", str(response.data))
+
+    def test_update_confirmed_reservation_excludes_its_own_headcount(self):
+        three_days_later = date.today() + timedelta(days=3)
+        confirmed = Reservation.objects.create(
+            user=self.admin,
+            test_reservation_date=three_days_later,
+            test_start_time=time(10, 0),
+            test_end_time=time(12, 0),
+            headcount=45000,
+            status=Status.CONFIRM
+        )
+
+        response = self.client.patch(f"/api/admin-reservation/{confirmed.id}/update/", {
+            "test_reservation_date": three_days_later,
+            "test_start_time": "10:00",
+            "test_end_time": "12:00",
+            "headcount": 48000
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
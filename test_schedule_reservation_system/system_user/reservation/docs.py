@@ -5,6 +5,7 @@ from .serializers import (
     ReservationSerializer,
     ReservationUpdateSerializer,
     ReservationAvailabilityResponseSerializer,
+    ReservationAvailabilityRangeResponseSerializer,
     ReservationDetailSerializer
 )
 
@@ -46,10 +47,67 @@ create_reservation_docs = {
     }
 }
 
+create_reservations_docs = {
+    "summary": "예약 일괄 생성",
+    "description": "여러 예약을 한 번에 신청합니다(최대 100건). 각 항목은 단건 생성과 같은 기준으로 따로 검사되며, "
+                   "통과한 항목만 생성되고 항목별 결과가 요청 순서대로 반환됩니다. "
+                   "한 건이라도 생성되면 201, 모두 실패하면 400을 반환합니다.",
+    "request": ReservationCreateSerializer(many=True),
+    "parameters": [
+        OpenApiParameter(
+            name="Authorization",
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.HEADER,
+            required=True,
+            description="JWT 액세스 토큰 (기업 사용자 권한 필요). 예: Bearer <your_token>"
+        )
+    ],
+    "examples": [
+        OpenApiExample(
+            name="예약 일괄 생성 응답 예시",
+            value={
+                "message": "2건 중 1건의 예약이 신청되었습니다.",
+                "results": [
+                    {
+                        "index": 0,
+                        "reservation": {
+                            "id": 17,
+                            "user": "company_user1",
+                            "test_reservation_date": "2025-04-25",
+                            "test_start_time": "10:00:00",
+                            "test_end_time": "11:00:00",
+                            "headcount": 200,
+                            "status": "AWAIT",
+                            "created_at": "2025-04-20T10:00:00Z",
+                            "updated_at": "2025-04-20T10:00:00Z"
+                        }
+                    },
+                    {
+                        "index": 1,
+                        "errors": ["해당 시간대의 예약 인원이 50,000명을 초과합니다."]
+                    }
+                ]
+            },
+            response_only=True
+        )
+    ],
+    "responses": {
+        201: OpenApiTypes.OBJECT,
+        400: OpenApiTypes.OBJECT
+    }
+}
+
 my_reservations_docs = {
     "summary": "내 예약 목록 조회",
-    "description": "자신이 등록한 예약을 조회합니다.",
+    "description": "자신이 등록한 예약을 조회합니다. 응답의 ETag 를 If-None-Match 로 보내면 변경이 없을 때 304를 반환합니다.",
     "parameters": [
+        OpenApiParameter(
+            name="If-None-Match",
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.HEADER,
+            required=False,
+            description="이전 응답의 ETag. 그 뒤로 바뀐 내용이 없으면 본문 없이 304를 반환합니다."
+        ),
         OpenApiParameter(
             name="Authorization",
             type=OpenApiTypes.STR,
@@ -59,7 +117,8 @@ my_reservations_docs = {
         )
     ],
     "responses": {
-        200: ReservationSerializer(many=True)
+        200: ReservationSerializer(many=True),
+        304: OpenApiTypes.NONE
     }
 }
 
@@ -120,7 +179,8 @@ delete_reservation_docs = {
 
 available_slots_docs = {
     "summary": "시간대별 예약 가능 인원 조회",
-    "description": "입력한 날짜에 대해 00:00부터 23:59까지 각 시간대별로 예약 가능 인원을 조회합니다.",
+    "description": "입력한 날짜에 대해 00:00부터 23:59까지 각 시간대별로 예약 가능 인원을 조회합니다. "
+                   "응답의 ETag 를 If-None-Match 로 보내면 변경이 없을 때 304를 반환합니다.",
     "parameters": [
         OpenApiParameter(
             name="date",
@@ -129,6 +189,69 @@ available_slots_docs = {
             required=True,
             description="조회할 날짜 (예: 2025-04-10)"
         ),
+        OpenApiParameter(
+            name="interval",
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            enum=[60, 30, 15],
+            description="시간대 단위(분). 기본값은 60"
+        ),
+        OpenApiParameter(
+            name="If-None-Match",
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.HEADER,
+            required=False,
+            description="이전 응답의 ETag. 그 뒤로 바뀐 내용이 없으면 본문 없이 304를 반환합니다."
+        ),
+        OpenApiParameter(
+            name="Authorization",
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.HEADER,
+            required=True,
+            description="JWT 액세스 토큰 (기업 사용자 권한 필요). 예: Bearer <your_token>"
+        )
+    ],
+    "responses": {
+        200: ReservationAvailabilityResponseSerializer,
+        304: OpenApiTypes.NONE
+    }
+}
+
+available_slots_range_docs = {
+    "summary": "기간별 시간대 예약 가능 인원 조회",
+    "description": "시작일부터 종료일까지 날짜마다 시간대별 예약 가능 인원을 한 번에 조회합니다. 최대 31일까지 조회할 수 있습니다. "
+                   "응답의 ETag 를 If-None-Match 로 보내면 변경이 없을 때 304를 반환합니다.",
+    "parameters": [
+        OpenApiParameter(
+            name="from",
+            type=OpenApiTypes.DATE,
+            location=OpenApiParameter.QUERY,
+            required=True,
+            description="조회 시작일 (예: 2025-04-01)"
+        ),
+        OpenApiParameter(
+            name="to",
+            type=OpenApiTypes.DATE,
+            location=OpenApiParameter.QUERY,
+            required=True,
+            description="조회 종료일 (예: 2025-04-30)"
+        ),
+        OpenApiParameter(
+            name="interval",
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            enum=[60, 30, 15],
+            description="시간대 단위(분). 기본값은 60"
+        ),
+        OpenApiParameter(
+            name="If-None-Match",
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.HEADER,
+            required=False,
+            description="이전 응답의 ETag. 그 뒤로 바뀐 내용이 없으면 본문 없이 304를 반환합니다."
+        ),
         OpenApiParameter(
             name="Authorization",
             type=OpenApiTypes.STR,
@@ -138,6 +261,7 @@ available_slots_docs = {
         )
     ],
     "responses": {
-        200: ReservationAvailabilityResponseSerializer
+        200: ReservationAvailabilityRangeResponseSerializer,
+        304: OpenApiTypes.NONE
     }
 }
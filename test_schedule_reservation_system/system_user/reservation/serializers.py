@@ -102,6 +102,19 @@ class ReservationAvailabilityResponseSerializer(serializers.Serializer):
     date = serializers.DateField()
     available_slots = AvailableSlotSerializer(many=True)
 
+
+class ReservationAvailabilityRangeResponseSerializer(serializers.Serializer):
+    days = ReservationAvailabilityResponseSerializer(many=True)
+
+    def get_fields(self):
+        # from 은 파이썬 예약어라 클래스 속성으로 선언할 수 없다.
+        return {
+            'from': serializers.DateField(),
+            'to': serializers.DateField(),
+            **super().get_fields()
+        }
+
+
 class ReservationDetailSerializer(serializers.ModelSerializer):
     user = serializers.StringRelatedField()
 
@@ -1,13 +1,20 @@
-from core.models.reservation import Reservation, Status
+from core import availability_cache
+from core.conditional import make_etag
+from core.models.capacity_ledger import CapacityLedger
 from core.models.reservations import Reservations
+from core.models.reservation import Reservation, Status
+from core.serializers import get_reservation_rows, serialize_reservation_rows
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Count, Max
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 from rest_framework.utils.serializer_helpers import ReturnDict
 
-from .serializers import ReservationSerializer, ReservationUpdateSerializer, ReservationCreateSerializer
+from .serializers import ReservationUpdateSerializer, ReservationCreateSerializer
 from ..utils import date_utils
 
 
+@transaction.atomic
 def create_reservation(data: ReturnDict, user: User) -> Reservation:
     serializer = ReservationCreateSerializer(data=data)
     serializer.is_valid(raise_exception=True)
@@ -17,14 +24,7 @@ def create_reservation(data: ReturnDict, user: User) -> Reservation:
     test_end = serializer.validated_data['test_end_time']
     headcount = serializer.validated_data['headcount']
 
-    reservations_in_time = Reservations(Reservation.objects.filter(
-        test_reservation_date=test_date,
-        test_start_time__lt=test_end,
-        test_end_time__gt=test_start,
-        status=Status.CONFIRM
-    ))
-
-    reservations_in_time.validate_exceed_limit(headcount)
+    CapacityLedger.objects.validate_exceed_limit(test_date, test_start, test_end, headcount)
 
     reservation = Reservation.objects.create(
         user=user,
@@ -37,9 +37,65 @@ def create_reservation(data: ReturnDict, user: User) -> Reservation:
     return reservation
 
 
-def get_my_reservations(user: User) -> ReservationSerializer:
+BULK_CREATE_LIMIT = 100
+
+
+@transaction.atomic
+def create_reservations(data: list, user: User) -> list[dict]:
+    if not isinstance(data, list) or not data:
+        raise ValidationError("신청할 예약을 1건 이상 배열로 입력해주세요.")
+    if len(data) > BULK_CREATE_LIMIT:
+        raise ValidationError(f"한 번에 최대 {BULK_CREATE_LIMIT}건까지 신청할 수 있습니다.")
+
+    serializer = ReservationCreateSerializer(many=True)
+    results = []
+    for index, item in enumerate(data):
+        try:
+            results.append({'index': index, 'data': serializer.run_child_validation(item)})
+        except ValidationError as e:
+            results.append({'index': index, 'errors': e.detail})
+
+    # 검증을 통과한 항목들의 날짜별 확정 인원을 한 번에 읽어 각 항목을 따로 검사한다.
+    valid = [result for result in results if 'data' in result]
+    occupancies = CapacityLedger.objects.get_occupancies(
+        {result['data']['test_reservation_date'] for result in valid}
+    ) if valid else {}
+
+    accepted = []
+    for result in valid:
+        item = result.pop('data')
+        occupancy = occupancies[item['test_reservation_date']]
+        peak = occupancy.get_peak_headcount(item['test_start_time'], item['test_end_time'])
+        if peak + item['headcount'] > Reservations.MAX_AVAILABLE_LIMIT:
+            result['errors'] = ValidationError("해당 시간대의 예약 인원이 50,000명을 초과합니다.").detail
+            continue
+
+        result['reservation'] = Reservation(user=user, status=Status.AWAIT, **item)
+        accepted.append(result['reservation'])
+
+    Reservation.objects.bulk_create(accepted)
+    return results
+
+
+def get_my_reservations(user: User) -> list[dict]:
+    reservations = Reservation.objects.filter(user=user).order_by('-test_reservation_date')
+    return serialize_reservation_rows(get_reservation_rows(reservations))
+
+
+async def aget_my_reservations(user: User) -> list[dict]:
     reservations = Reservation.objects.filter(user=user).order_by('-test_reservation_date')
-    return ReservationSerializer(reservations, many=True)
+    return serialize_reservation_rows([row async for row in get_reservation_rows(reservations)])
+
+
+def get_my_reservations_etag(user: User) -> str:
+    # 수정·확정은 updated_at 을, 삭제는 건수를 바꾸므로 둘로 목록 변경을 알 수 있다. (reservation_user_date_upd_idx 만 읽음)
+    version = Reservation.objects.filter(user=user).aggregate(count=Count('*'), updated_at=Max('updated_at'))
+    return make_etag('my', user.pk, user.username, user.is_staff, version['count'], version['updated_at'])
+
+
+async def aget_my_reservations_etag(user: User) -> str:
+    version = await Reservation.objects.filter(user=user).aaggregate(count=Count('*'), updated_at=Max('updated_at'))
+    return make_etag('my', user.pk, user.username, user.is_staff, version['count'], version['updated_at'])
 
 
 def get_reservation_by_id(reservation_id: int) -> Reservation:
@@ -57,6 +113,7 @@ def is_manipulate(reservation: Reservation, user: User, message: str):
         raise ValidationError(f"확정된 예약은 {message}할 수 없습니다.")
 
 
+@transaction.atomic
 def update_reservation(reservation_id: int, data: ReturnDict, user: User) -> Reservation:
     reservation = get_reservation_by_id(reservation_id)
     is_manipulate(reservation, user, '수정')
@@ -69,14 +126,12 @@ def update_reservation(reservation_id: int, data: ReturnDict, user: User) -> Res
     new_test_end_time = serializer.validated_data['test_end_time']
     new_headcount = serializer.validated_data['headcount']
 
-    reservations_in_time = Reservations(list(Reservation.objects.filter(
-        test_reservation_date=new_test_reservation_date,
-        test_start_time__lt=new_test_end_time,
-        test_end_time__gt=new_test_start_time,
-        status=Status.CONFIRM
-    ).exclude(pk=reservation.pk)))
-
-    reservations_in_time.validate_exceed_limit(new_headcount)
+    CapacityLedger.objects.validate_exceed_limit(
+        new_test_reservation_date,
+        new_test_start_time,
+        new_test_end_time,
+        new_headcount
+    )
 
     for attr, value in serializer.validated_data.items():
         setattr(reservation, attr, value)
@@ -85,6 +140,7 @@ def update_reservation(reservation_id: int, data: ReturnDict, user: User) -> Res
     return reservation
 
 
+@transaction.atomic
 def delete_reservation(reservation_id: int, user: User):
     reservation = get_reservation_by_id(reservation_id)
     is_manipulate(reservation, user, '삭제')
@@ -92,16 +148,70 @@ def delete_reservation(reservation_id: int, user: User):
     reservation.delete()
 
 
-def get_available_slots(date: str) -> dict:
+def get_available_slots(date: str, interval: str = None) -> dict:
     date = date_utils.parse_and_validate_date(date)
+    slot_minutes = date_utils.parse_slot_minutes(interval)
+
+    occupancy = availability_cache.get_occupancy(date, CapacityLedger.objects.get_occupancies)
+    available_slots = occupancy.get_available_headcount(slot_minutes, Reservations.MAX_AVAILABLE_LIMIT)
+    return {
+        "date": date,
+        "available_slots": available_slots
+    }
 
-    reservations_on_date = Reservations(list(Reservation.objects.filter(
-        test_reservation_date=date,
-        status=Status.CONFIRM
-    )))
 
-    available_slots = reservations_on_date.get_hourly_available_headcount()
+async def aget_available_slots(date: str, interval: str = None) -> dict:
+    date = date_utils.parse_and_validate_date(date)
+    slot_minutes = date_utils.parse_slot_minutes(interval)
+
+    occupancy = await availability_cache.aget_occupancy(date, CapacityLedger.objects.aget_occupancies)
+    available_slots = occupancy.get_available_headcount(slot_minutes, Reservations.MAX_AVAILABLE_LIMIT)
     return {
         "date": date,
         "available_slots": available_slots
     }
+
+
+def get_available_slots_etag(date: str, interval: str = None) -> str:
+    # 응답을 만드는 캐시된 점유 배열의 내용으로 만든다. 캐시에 있으면 DB 를 조회하지 않고,
+    # 다른 워커의 변경으로 캐시 버전이 오르지 않았어도 다시 읽은 내용이 다르면 ETag 도 달라진다.
+    date = date_utils.parse_and_validate_date(date)
+    slot_minutes = date_utils.parse_slot_minutes(interval)
+    occupancy = availability_cache.get_occupancy(date, CapacityLedger.objects.get_occupancies)
+    return make_etag('available', date, slot_minutes, occupancy.fingerprint())
+
+
+async def aget_available_slots_etag(date: str, interval: str = None) -> str:
+    date = date_utils.parse_and_validate_date(date)
+    slot_minutes = date_utils.parse_slot_minutes(interval)
+    occupancy = await availability_cache.aget_occupancy(date, CapacityLedger.objects.aget_occupancies)
+    return make_etag('available', date, slot_minutes, occupancy.fingerprint())
+
+
+def get_available_slots_range(date_from: str, date_to: str, interval: str = None) -> dict:
+    dates = date_utils.parse_date_range(date_from, date_to)
+    slot_minutes = date_utils.parse_slot_minutes(interval)
+
+    # 캐시에 없는 날짜들만 모아 장부에서 한 번에 읽는다.
+    occupancies = availability_cache.get_occupancies(dates, CapacityLedger.objects.get_occupancies)
+    return {
+        "from": dates[0],
+        "to": dates[-1],
+        "days": [
+            {
+                "date": date,
+                "available_slots": occupancies[date].get_available_headcount(
+                    slot_minutes,
+                    Reservations.MAX_AVAILABLE_LIMIT
+                )
+            }
+            for date in dates
+        ]
+    }
+
+
+def get_available_slots_range_etag(date_from: str, date_to: str, interval: str = None) -> str:
+    dates = date_utils.parse_date_range(date_from, date_to)
+    slot_minutes = date_utils.parse_slot_minutes(interval)
+    occupancies = availability_cache.get_occupancies(dates, CapacityLedger.objects.get_occupancies)
+    return make_etag('available_range', slot_minutes, [(date, occupancies[date].fingerprint()) for date in dates])
@@ -3,25 +3,39 @@ from rest_framework.viewsets import ViewSet
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
+from core.async_views import AsyncAPIView
+from core.conditional import aconditional_response, conditional_response
 from core.models.reservation import Reservation, Status
 
 from ..permissions import IsCorporateUser
 from .docs import (
     create_reservation_docs,
+    create_reservations_docs,
     my_reservations_docs,
     update_reservation_docs,
     delete_reservation_docs,
-    available_slots_docs
+    available_slots_docs,
+    available_slots_range_docs
 )
 from .services import (
+    aget_available_slots,
+    aget_available_slots_etag,
+    aget_my_reservations,
+    aget_my_reservations_etag,
     create_reservation,
+    create_reservations,
     get_my_reservations,
+    get_my_reservations_etag,
     delete_reservation,
     update_reservation,
-    get_available_slots
+    get_available_slots,
+    get_available_slots_etag,
+    get_available_slots_range,
+    get_available_slots_range_etag
 )
 from .serializers import (
     ReservationAvailabilityResponseSerializer,
+    ReservationAvailabilityRangeResponseSerializer,
     ReservationDetailSerializer
 )
 
@@ -40,11 +54,29 @@ class ReservationAdminViewSet(ViewSet):
             'reservation': serializer.data
         }, status=status.HTTP_201_CREATED)
 
+    @extend_schema(**create_reservations_docs)
+    @action(detail=False, methods=['post'], url_path='create/bulk')
+    def create_reservations(self, request):
+        results = create_reservations(request.data, request.user)
+        created = 0
+        for result in results:
+            if 'reservation' in result:
+                result['reservation'] = ReservationDetailSerializer(result['reservation']).data
+                created += 1
+
+        return Response({
+            'message': f'{len(results)}건 중 {created}건의 예약이 신청되었습니다.',
+            'results': results
+        }, status=status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST)
+
     @extend_schema(**my_reservations_docs)
     @action(detail=False, methods=['get'], url_path='my')
     def my_reservations(self, request):
-        serializer = get_my_reservations(request.user)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return conditional_response(
+            request,
+            get_my_reservations_etag(request.user),
+            lambda: get_my_reservations(request.user)
+        )
 
     @extend_schema(**update_reservation_docs)
     @action(detail=True, methods=['patch'], url_path='update')
@@ -66,6 +98,47 @@ class ReservationAdminViewSet(ViewSet):
     @extend_schema(**available_slots_docs)
     @action(detail=False, methods=['get'], url_path='available')
     def get_available_slots(self, request):
-        available_slots = get_available_slots(request.query_params.get('date'))
-        serializer = ReservationAvailabilityResponseSerializer(available_slots)
-        return Response(serializer.data)
+        date, interval = request.query_params.get('date'), request.query_params.get('interval')
+        return conditional_response(
+            request,
+            get_available_slots_etag(date, interval),
+            lambda: ReservationAvailabilityResponseSerializer(get_available_slots(date, interval)).data
+        )
+
+    @extend_schema(**available_slots_range_docs)
+    @action(detail=False, methods=['get'], url_path='available/range')
+    def get_available_slots_range(self, request):
+        date_from, date_to = request.query_params.get('from'), request.query_params.get('to')
+        interval = request.query_params.get('interval')
+        return conditional_response(
+            request,
+            get_available_slots_range_etag(date_from, date_to, interval),
+            lambda: ReservationAvailabilityRangeResponseSerializer(
+                get_available_slots_range(date_from, date_to, interval)
+            ).data
+        )
+
+
+class MyReservationsAsyncView(AsyncAPIView):
+    permission_classes = [IsCorporateUser]
+
+    @extend_schema(**my_reservations_docs)
+    async def get(self, request):
+        return await aconditional_response(
+            request,
+            await aget_my_reservations_etag(request.user),
+            lambda: aget_my_reservations(request.user)
+        )
+
+
+class AvailableSlotsAsyncView(AsyncAPIView):
+    permission_classes = [IsCorporateUser]
+
+    @extend_schema(**available_slots_docs)
+    async def get(self, request):
+        date, interval = request.query_params.get('date'), request.query_params.get('interval')
+
+        async def get_data():
+            return ReservationAvailabilityResponseSerializer(await aget_available_slots(date, interval)).data
+
+        return await aconditional_response(request, await aget_available_slots_etag(date, interval), get_data)
@@ -0,0 +1,81 @@
+from datetime import time, timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.utils.timezone import now
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.auth.token_utils import generate_tokens_for_user
+from core.models.reservation import Reservation, Status
+
+
+class TestAsyncUserReads(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='user1', password='pass')
+        self.other = User.objects.create_user(username='user2', password='pass')
+        tokens = generate_tokens_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+
+        self.target_date = now().date() + timedelta(days=5)
+        for user, headcount in ((self.user, 1000), (self.user, 2000), (self.other, 3000)):
+            Reservation.objects.create(
+                user=user,
+                test_reservation_date=self.target_date,
+                test_start_time=time(10, 0),
+                test_end_time=time(11, 0),
+                headcount=headcount,
+                status=Status.CONFIRM
+            )
+
+    def test_my_reservations_match_sync_response(self):
+        async_response = self.client.get('/api/reservations/async/my/')
+        sync_response = self.client.get('/api/reservations/my/')
+
+        self.assertEqual(async_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(async_response.data, sync_response.data)
+        self.assertEqual(len(async_response.data), 2)
+        self.assertEqual(async_response['ETag'], sync_response['ETag'])
+
+    def test_my_reservations_not_modified(self):
+        etag = self.client.get('/api/reservations/async/my/')['ETag']
+
+        response = self.client.get('/api/reservations/async/my/', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_available_slots_match_sync_response(self):
+        query = f'?date={self.target_date.isoformat()}&interval=30'
+        async_response = self.client.get('/api/reservations/async/available/' + query)
+        sync_response = self.client.get('/api/reservations/available/' + query)
+
+        self.assertEqual(async_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(async_response.data, sync_response.data)
+        self.assertEqual(async_response['ETag'], sync_response['ETag'])
+
+        slots = {slot['start_time']: slot['available_headcount'] for slot in async_response.data['available_slots']}
+        self.assertEqual(slots['10:00'], 44000)
+        self.assertEqual(slots['11:00'], 50000)
+
+    def test_available_slots_validation_error(self):
+        past_date = (now().date() - timedelta(days=1)).isoformat()
+
+        response = self.client.get(f'/api/reservations/async/available/?date={past_date}')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("현재 날짜보다 이전 날짜는 조회할 수 없습니다.", str(response.data))
+
+    def test_admin_user_cannot_access(self):
+        admin = User.objects.create_user(username='admin', password='adminpass', is_staff=True)
+        tokens = generate_tokens_for_user(admin)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+
+        self.assertEqual(self.client.get('/api/reservations/async/my/').status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_unauthenticated_user_cannot_access(self):
+        self.client.credentials()
+
+        response = self.client.get('/api/reservations/async/available/')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -64,3 +64,125 @@ class TestUserReservationCreate(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("해당 시간대의 예약 인원이 50,000명을 초과합니다.", str(response.data))
+
+    def test_create_reservation_between_back_to_back_confirmed_reservations(self):
+        test_date = date.today() + timedelta(days=5)
+        for start, end in [(time(9, 0), time(10, 0)), (time(10, 0), time(11, 0))]:
+            Reservation.objects.create(
+                user=self.user,
+                test_reservation_date=test_date,
+                test_start_time=start,
+                test_end_time=end,
+                headcount=30000,
+                status=Status.CONFIRM
+            )
+
+        data = {
+            "test_reservation_date": test_date.strftime('%Y-%m-%d'),
+            "test_start_time": "09:00",
+            "test_end_time": "11:00",
+            "headcount": 20000
+        }
+
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_create_reservation_after_confirmed_reservation_ending_off_quarter_hour(self):
+        test_date = date.today() + timedelta(days=5)
+        Reservation.objects.create(
+            user=self.user,
+            test_reservation_date=test_date,
+            test_start_time=time(9, 0),
+            test_end_time=time(9, 5),
+            headcount=50000,
+            status=Status.CONFIRM
+        )
+
+        data = {
+            "test_reservation_date": test_date.strftime('%Y-%m-%d'),
+            "test_start_time": "09:05",
+            "test_end_time": "10:00",
+            "headcount": 50000
+        }
+
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+
+class TestUserReservationBulkCreate(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="user", password="pass")
+        self.url = "/api/reservations/create/bulk/"
+        token = generate_tokens_for_user(self.user)['access_token']
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + token)
+        self.test_date = date.today() + timedelta(days=5)
+
+    def item(self, days: int = 5, start: str = "10:00", end: str = "11:00", headcount: int = 100) -> dict:
+        return {
+            "test_reservation_date": (date.today() + timedelta(days=days)).strftime('%Y-%m-%d'),
+            "test_start_time": start,
+            "test_end_time": end,
+            "headcount": headcount
+        }
+
+    def test_bulk_create_success(self):
+        data = [self.item(days=5 + i % 3, headcount=100 + i) for i in range(50)]
+
+        # 인증 사용자 조회 + 장부 조회 + 일괄 INSERT (+ 트랜잭션 savepoint)
+        with self.assertNumQueries(5):
+            response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['message'], '50건 중 50건의 예약이 신청되었습니다.')
+        self.assertEqual(Reservation.objects.filter(user=self.user, status=Status.AWAIT).count(), 50)
+        self.assertEqual([result['index'] for result in response.data['results']], list(range(50)))
+        self.assertEqual(response.data['results'][3]['reservation']['headcount'], 103)
+        self.assertIsNotNone(response.data['results'][3]['reservation']['id'])
+
+    def test_invalid_items_are_reported_and_others_created(self):
+        Reservation.objects.create(
+            user=self.user,
+            test_reservation_date=self.test_date,
+            test_start_time=time(9, 0),
+            test_end_time=time(12, 0),
+            headcount=49000,
+            status=Status.CONFIRM
+        )
+        data = [
+            self.item(),
+            self.item(days=2),
+            self.item(headcount=2000),
+            self.item(start="13:00", end="14:00", headcount=2000),
+        ]
+
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['message'], '4건 중 2건의 예약이 신청되었습니다.')
+        results = response.data['results']
+        self.assertIn('reservation', results[0])
+        self.assertIn("예약은 최소 3일 이후로만 가능합니다.", str(results[1]['errors']))
+        self.assertIn("50,000명을 초과합니다", str(results[2]['errors']))
+        self.assertIn('reservation', results[3])
+        self.assertEqual(Reservation.objects.filter(status=Status.AWAIT).count(), 2)
+
+    def test_all_items_rejected_returns_bad_request(self):
+        response = self.client.post(self.url, [self.item(days=1), self.item(start="25:00")], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertFalse(Reservation.objects.exists())
+
+    def test_too_many_items_returns_error(self):
+        response = self.client.post(self.url, [self.item()] * 101, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("한 번에 최대 100건까지 신청할 수 있습니다.", str(response.data))
+
+    def test_non_list_body_returns_error(self):
+        response = self.client.post(self.url, self.item(), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("배열로 입력해주세요", str(response.data))
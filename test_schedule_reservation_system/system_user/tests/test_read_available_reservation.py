@@ -1,14 +1,20 @@
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
 from django.utils.timezone import now
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.contrib.auth.models import User
 from core.models.reservation import Reservation, Status
 from datetime import date, time, timedelta
+from core import availability_cache
 from core.auth.token_utils import generate_tokens_for_user
 
 
 class TestReservationAvailabilityAPI(APITestCase):
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(username='user1', password='pass')
         tokens = generate_tokens_for_user(self.user)
         self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
@@ -55,3 +61,199 @@ class TestReservationAvailabilityAPI(APITestCase):
         res = self.client.get(self.base_url + f'?date={past_date}')
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("현재 날짜보다 이전 날짜는 조회할 수 없습니다.", str(res.data))
+
+    def test_available_headcount_by_interval(self):
+        Reservation.objects.create(
+            user=self.user,
+            test_reservation_date=date.fromisoformat(self.target_date),
+            test_start_time=time(10, 0),
+            test_end_time=time(10, 30),
+            headcount=2000,
+            status=Status.CONFIRM
+        )
+
+        res = self.client.get(self.base_url + f'?date={self.target_date}&interval=30')
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data["available_slots"]), 48)
+
+        for slot in res.data["available_slots"]:
+            if slot["start_time"] == "10:00":
+                self.assertEqual(slot["available_headcount"], 48000)
+            else:
+                self.assertEqual(slot["available_headcount"], 50000)
+
+    def test_invalid_interval_returns_error(self):
+        res = self.client.get(self.base_url + f'?date={self.target_date}&interval=20')
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("조회 단위는 60, 30, 15분 중 하나여야 합니다.", str(res.data))
+
+    def test_unchanged_availability_returns_not_modified_without_queries(self):
+        url = self.base_url + f'?date={self.target_date}'
+        etag = self.client.get(url)['ETag']
+
+        with self.assertNumQueries(1):  # 인증 사용자 조회만
+            res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(res['ETag'], etag)
+
+    def test_confirmed_reservation_changes_etag(self):
+        url = self.base_url + f'?date={self.target_date}'
+        etag = self.client.get(url)['ETag']
+
+        Reservation.objects.create(
+            user=self.user,
+            test_reservation_date=date.fromisoformat(self.target_date),
+            test_start_time=time(10, 0),
+            test_end_time=time(11, 0),
+            headcount=2000,
+            status=Status.CONFIRM
+        )
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res['ETag'], etag)
+
+    def test_reloaded_occupancy_changes_etag_without_version_bump(self):
+        # 다른 워커가 확정해 이 워커의 캐시 버전은 그대로이고, 점유 배열만 만료되어 다시 읽는 경우
+        url = self.base_url + f'?date={self.target_date}'
+        etag = self.client.get(url)['ETag']
+        test_date = date.fromisoformat(self.target_date)
+
+        with mock.patch.object(availability_cache, 'invalidate'):
+            Reservation.objects.create(
+                user=self.user,
+                test_reservation_date=test_date,
+                test_start_time=time(10, 0),
+                test_end_time=time(11, 0),
+                headcount=2000,
+                status=Status.CONFIRM
+            )
+        version = availability_cache.get_versions([test_date])[test_date]
+        cache.delete(availability_cache.occupancy_key(test_date, version))
+
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res['ETag'], etag)
+
+    def test_version_expires_with_cached_occupancy(self):
+        test_date = date.fromisoformat(self.target_date)
+        with mock.patch.object(cache, 'set_many', wraps=cache.set_many) as set_many:
+            availability_cache.get_versions([test_date])
+
+        self.assertEqual(set_many.call_args.args[1], settings.AVAILABILITY_CACHE_TIMEOUT)
+
+    def test_etag_depends_on_interval(self):
+        etag = self.client.get(self.base_url + f'?date={self.target_date}')['ETag']
+
+        res = self.client.get(self.base_url + f'?date={self.target_date}&interval=30', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_invalid_date_with_etag_returns_error(self):
+        res = self.client.get(self.base_url + '?date=invalid-date', HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestReservationAvailabilityRangeAPI(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='user1', password='pass')
+        tokens = generate_tokens_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+
+        self.base_url = '/api/reservations/available/range/'
+        self.start_date = now().date() + timedelta(days=5)
+
+    def get_range(self, start: date, end: date, headers: dict = None, **params):
+        query = '&'.join(f'{key}={value}' for key, value in params.items())
+        return self.client.get(self.base_url + f'?from={start.isoformat()}&to={end.isoformat()}&{query}', headers=headers)
+
+    def test_returns_every_day_in_range(self):
+        end_date = self.start_date + timedelta(days=29)
+        Reservation.objects.create(
+            user=self.user,
+            test_reservation_date=self.start_date + timedelta(days=1),
+            test_start_time=time(10, 0),
+            test_end_time=time(11, 0),
+            headcount=2000,
+            status=Status.CONFIRM
+        )
+
+        res = self.get_range(self.start_date, end_date)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["from"], self.start_date.isoformat())
+        self.assertEqual(res.data["to"], end_date.isoformat())
+        self.assertEqual(len(res.data["days"]), 30)
+
+        reserved_day = res.data["days"][1]
+        self.assertEqual(reserved_day["date"], (self.start_date + timedelta(days=1)).isoformat())
+        for slot in reserved_day["available_slots"]:
+            expected = 48000 if slot["start_time"] == "10:00" else 50000
+            self.assertEqual(slot["available_headcount"], expected)
+
+        for day in res.data["days"][2:]:
+            self.assertTrue(all(slot["available_headcount"] == 50000 for slot in day["available_slots"]))
+
+    def test_range_matches_single_day_lookup(self):
+        Reservation.objects.create(
+            user=self.user,
+            test_reservation_date=self.start_date,
+            test_start_time=time(9, 15),
+            test_end_time=time(10, 45),
+            headcount=3000,
+            status=Status.CONFIRM
+        )
+
+        ranged = self.get_range(self.start_date, self.start_date + timedelta(days=2), interval=15)
+        single = self.client.get(f'/api/reservations/available/?date={self.start_date.isoformat()}&interval=15')
+
+        self.assertEqual(ranged.data["days"][0], single.data)
+
+    def test_range_is_read_in_a_single_query(self):
+        with self.assertNumQueries(2):  # 인증 사용자 조회 + 장부 조회
+            res = self.get_range(self.start_date, self.start_date + timedelta(days=30))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data["days"]), 31)
+
+    def test_range_longer_than_limit_returns_error(self):
+        res = self.get_range(self.start_date, self.start_date + timedelta(days=31))
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("최대 31일까지 조회할 수 있습니다.", str(res.data))
+
+    def test_reversed_range_returns_error(self):
+        res = self.get_range(self.start_date, self.start_date - timedelta(days=1))
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("조회 종료일은 시작일보다 이전일 수 없습니다.", str(res.data))
+
+    def test_missing_range_returns_error(self):
+        res = self.client.get(self.base_url + f'?from={self.start_date.isoformat()}')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("조회 기간을 입력해주세요", str(res.data))
+
+    def test_range_changes_when_any_day_changes(self):
+        end_date = self.start_date + timedelta(days=6)
+        etag = self.get_range(self.start_date, end_date)['ETag']
+
+        with self.assertNumQueries(1):  # 인증 사용자 조회만
+            res = self.get_range(self.start_date, end_date, headers={'If-None-Match': etag})
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Reservation.objects.create(
+            user=self.user,
+            test_reservation_date=end_date,
+            test_start_time=time(10, 0),
+            test_end_time=time(11, 0),
+            headcount=2000,
+            status=Status.CONFIRM
+        )
+        res = self.get_range(self.start_date, end_date, headers={'If-None-Match': etag})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res['ETag'], etag)
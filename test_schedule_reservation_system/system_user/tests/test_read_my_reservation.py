@@ -79,3 +79,47 @@ class TestMyReservations(APITestCase):
         response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_unchanged_list_returns_not_modified(self):
+        tokens = generate_tokens_for_user(self.user1)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+
+        response = self.client.get(self.url)
+        etag = response['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_changed_list_returns_new_etag(self):
+        tokens = generate_tokens_for_user(self.user1)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+        etag = self.client.get(self.url)['ETag']
+
+        reservation = Reservation.objects.filter(user=self.user1).first()
+        reservation.delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertNotEqual(response['ETag'], etag)
+
+        etag = response['ETag']
+        Reservation.objects.filter(user=self.user1).update(headcount=5, updated_at=now())
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]['headcount'], 5)
+
+    def test_etag_differs_between_users(self):
+        tokens = generate_tokens_for_user(self.user1)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+        etag = self.client.get(self.url)['ETag']
+
+        tokens = generate_tokens_for_user(self.user2)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access_token'])
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
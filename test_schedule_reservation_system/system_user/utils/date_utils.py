@@ -1,5 +1,5 @@
 from rest_framework.exceptions import ValidationError
-from datetime import datetime
+from datetime import datetime, timedelta
 from django.utils.timezone import now
 
 def parse_and_validate_date(date_str: str) -> datetime.date:
@@ -15,3 +15,36 @@ def parse_and_validate_date(date_str: str) -> datetime.date:
         raise ValidationError("현재 날짜보다 이전 날짜는 조회할 수 없습니다.")
 
     return input_date
+
+
+AVAILABLE_SLOT_MINUTES = (60, 30, 15)
+
+
+def parse_slot_minutes(interval: str | None) -> int:
+    if not interval:
+        return AVAILABLE_SLOT_MINUTES[0]
+
+    if not interval.isdigit() or int(interval) not in AVAILABLE_SLOT_MINUTES:
+        raise ValidationError("조회 단위는 60, 30, 15분 중 하나여야 합니다.")
+
+    return int(interval)
+
+
+MAX_AVAILABLE_RANGE_DAYS = 31
+
+
+def parse_date_range(date_from: str, date_to: str) -> list[datetime.date]:
+    if not date_from or not date_to:
+        raise ValidationError("조회 기간을 입력해주세요. 예: ?from=2025-04-01&to=2025-04-30")
+
+    start = parse_and_validate_date(date_from)
+    end = parse_and_validate_date(date_to)
+
+    if end < start:
+        raise ValidationError("조회 종료일은 시작일보다 이전일 수 없습니다.")
+
+    days = (end - start).days + 1
+    if days > MAX_AVAILABLE_RANGE_DAYS:
+        raise ValidationError(f"한 번에 최대 {MAX_AVAILABLE_RANGE_DAYS}일까지 조회할 수 있습니다.")
+
+    return [start + timedelta(days=i) for i in range(days)]
@@ -9,6 +9,7 @@ https://docs.djangoproject.com/en/5.1/topics/settings/
 For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
+import os
 from datetime import timedelta
 from pathlib import Path
 
@@ -45,6 +46,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # 요청 전체 시간을 재도록 가장 먼저 둔다.
+    'core.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -52,8 +55,12 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
 ]
 
+# /metrics (Prometheus 지표)를 조회할 수 있는 주소. 운영에서는 수집 서버 주소를 넣는다.
+INTERNAL_IPS = ['127.0.0.1', '::1']
+
 ROOT_URLCONF = 'test_schedule_reservation_system.urls'
 
 TEMPLATES = [
@@ -79,7 +86,8 @@ WSGI_APPLICATION = 'test_schedule_reservation_system.wsgi.application'
 
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        # django.db.backends.postgresql 에 연결 획득 통계 기록을 더한 백엔드
+        'ENGINE': 'core.db_backend',
         'NAME': 'grepp',
         'USER': 'user',
         'PASSWORD': 'password',
@@ -88,6 +96,70 @@ DATABASES = {
     }
 }
 
+# DB_ENGINE=sqlite 이면 PostgreSQL 대신 로컬 SQLite 파일(DB_SQLITE_NAME, 기본 db.sqlite3)을 사용한다.
+# 서버 없이 부하 테스트 등을 실행할 때 사용하며, 날짜별 advisory lock 대신 SQLite 의 DB 단위 쓰기 잠금으로 동작한다.
+DB_ENGINE = os.environ.get('DB_ENGINE', 'postgresql')
+if DB_ENGINE == 'sqlite':
+    DATABASES['default'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / os.environ.get('DB_SQLITE_NAME', 'db.sqlite3'),
+        # 동시 쓰기 요청이 "database is locked" 로 실패하지 않도록 트랜잭션 시작 시 쓰기 잠금을 기다린다.
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 20,
+            'init_command': 'PRAGMA journal_mode=WAL;',
+        },
+    }
+
+# 연결 재사용. 환경 변수로 환경별로 설정한다.
+# - DB_POOL_MAX_SIZE 를 주면 psycopg 연결 풀을 사용한다. (pip install "psycopg[pool]" 필요, ASGI 서버에서 권장)
+#   DB_POOL_MIN_SIZE(기본 2), DB_POOL_TIMEOUT(연결을 기다리는 최대 초, 기본 10)
+# - 주지 않으면 DB_CONN_MAX_AGE 초 동안 연결을 재사용하고(지속 연결) 재사용 전에 연결 상태를 확인한다.
+#   기본값 0 은 요청마다 새로 연결한다. ASGI 에서는 요청마다 다른 스레드에서 연결이 열려 지속 연결이
+#   재사용되지 않고 쌓이므로, 지속 연결은 WSGI 서버(gunicorn 등) 환경에서만 DB_CONN_MAX_AGE=60 등으로 켠다.
+DB_POOL_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', 0))
+if DB_POOL_MAX_SIZE:
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+            'max_size': DB_POOL_MAX_SIZE,
+            'timeout': float(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        },
+    }
+else:
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', 0))
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+# 읽기 복제본. 운영에서는 HOST 등을 복제 서버로 바꾸고 DATABASE_REPLICAS 에 alias 를 추가한다.
+# 테스트에서는 별도의 DB 로 만들어 라우팅을 확인한다.
+DATABASES['replica'] = {
+    **DATABASES['default'],
+    # SQLite 는 테스트 DB 가 alias 별 메모리 DB 이므로 이름을 지정하지 않는다.
+    'TEST': {'NAME': None if DB_ENGINE == 'sqlite' else f"test_{DATABASES['default']['NAME']}_replica"},
+}
+
+DATABASE_ROUTERS = ['core.db_router.ReplicaRouter']
+
+# 읽기를 보낼 복제본 alias 목록. 비어 있으면 모든 쿼리가 default 를 사용한다.
+DATABASE_REPLICAS = []
+
+# 쓰기 요청 후 이 시간(초) 동안 같은 사용자의 읽기를 primary 로 보낸다. (0 이면 사용하지 않음)
+REPLICA_READ_YOUR_WRITES_SECONDS = 5
+# 최근 쓴 사용자 기록을 저장할 캐시. 다른 워커가 처리한 요청도 primary 로 보내야 하므로 복제본을 쓰면
+# 모든 워커가 공유하는 캐시 백엔드(Redis 등)의 alias 를 지정한다. (LocMemCache 이면 시스템 체크 core.E002 로 실행되지 않는다)
+REPLICA_PIN_CACHE_ALIAS = 'default'
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# 시간대별 예약 가능 인원 캐시. 여러 워커가 공유하려면 CACHES에 공유 백엔드(Redis 등)를 추가하고 그 alias를 지정한다.
+# 프로세스별 캐시(LocMemCache)이면 다른 워커의 변경은 AVAILABILITY_CACHE_TIMEOUT(초) 뒤 다시 읽을 때 반영된다. (ETag 포함)
+AVAILABILITY_CACHE_ALIAS = 'default'
+AVAILABILITY_CACHE_TIMEOUT = 300
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -131,17 +203,37 @@ REST_USE_JWT = True
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'core.auth.authentication.ClaimsJWTAuthentication',
     ),
 
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+
+    # orjson 이 설치되어 있으면 사용하고, 없으면 DRF 기본 JSON 처리로 동작한다.
+    'DEFAULT_RENDERER_CLASSES': (
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'core.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
 }
 
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=30),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
+    # /api/auth/refresh/ 에서 리프레시 토큰도 새로 발급하고, 이전 토큰은 AUTH_REVOCATION_CACHE_ALIAS 캐시에 기록해 재사용을 막는다.
+    'ROTATE_REFRESH_TOKENS': True,
 }
 
+# True 이면 요청마다 사용자 행을 읽지 않고 액세스 토큰의 클레임(username, is_staff)으로 권한을 판단한다.
+# 권한 변경은 토큰 폐기(revoke_tokens) 전까지 반영되지 않는다. 폐기 기록은 DB 에 저장되고,
+# 이 모드에서는 아래 캐시로 확인하므로 모든 워커가 공유하는 캐시 백엔드(Redis 등)의 alias 를 지정해야 한다.
+# (LocMemCache 이면 시스템 체크 core.E001 로 실행되지 않는다)
+JWT_STATELESS_AUTH = False
+AUTH_REVOCATION_CACHE_ALIAS = 'default'
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'Test Reservation API',
     'DESCRIPTION': '시험 예약 시스템 API 문서입니다.',